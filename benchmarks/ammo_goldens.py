@@ -0,0 +1,91 @@
+"""
+Golden-output check for the weapon randomizer's ammo handling (the ammo split by level / at random, and the ammo count smoothing).
+Runs generate_early for each character / scenario with every Cross-Scenario Weapons mode across a range of seeds, and compares
+what ended up at each location (plus the starting weapon and ammo swaps) to baselines/ammo_goldens.json.
+
+Run this before and after changing how ammo is split or smoothed: any mismatch means a seed now generates differently.
+If the change is supposed to change the output, use --save-goldens to update them.
+
+Uses the stand-in Archipelago modules in benchmarks/standin, unless --archipelago points at an Archipelago checkout
+with this apworld in worlds/residentevil2remake. Run from the repo root:
+
+    python benchmarks/ammo_goldens.py [--archipelago /path/to/Archipelago] [--seeds 20] [--save-goldens]
+"""
+import argparse
+import hashlib
+import json
+import os
+import sys
+
+from harness import BENCHMARK_DIRECTORY, add_archipelago_argument, generate, get_option_keys, import_world
+
+GOLDENS_FILE = os.path.join(BENCHMARK_DIRECTORY, 'baselines', 'ammo_goldens.json')
+
+CHARACTERS = ['leon', 'claire']
+SCENARIOS = ['a', 'b']
+
+
+def get_output(world) -> dict:
+    return {
+        'starting_weapon': world.starting_weapon,
+        'replacement_ammo': world.replacement_ammo,
+        'locations': {
+            key: [location.get('original_item'), location.get('force_item')] for key, location in world.source_locations.items()
+        }
+    }
+
+def get_output_hashes(world_type, seeds: int) -> dict:
+    hashes = {}
+
+    for weapons in get_option_keys(world_type, 'cross_scenario_weapons'):
+        if weapons == 'none':
+            continue
+
+        for character in CHARACTERS:
+            for scenario in SCENARIOS:
+                for seed in range(1, seeds + 1):
+                    options = { 'character': character, 'scenario': scenario, 'cross_scenario_weapons': weapons }
+                    world = generate(world_type, [options], seed=seed, steps=['generate_early'])[0]
+                    output = json.dumps(get_output(world), sort_keys=True)
+
+                    hashes[f"{character} {scenario} {weapons} seed {seed}"] = hashlib.sha1(output.encode()).hexdigest()
+
+    return hashes
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    add_archipelago_argument(parser)
+    parser.add_argument('--seeds', type=int, default=20, help="how many seeds to check for each scenario / mode (default: 20)")
+    parser.add_argument('--goldens', default=GOLDENS_FILE, help="goldens file to compare against / save to")
+    parser.add_argument('--save-goldens', action='store_true', help="save this output as the new goldens")
+    args = parser.parse_args()
+
+    world_type = import_world(args.archipelago)
+    hashes = get_output_hashes(world_type, args.seeds)
+
+    if args.save_goldens:
+        os.makedirs(os.path.dirname(args.goldens), exist_ok=True)
+
+        with open(args.goldens, 'w') as goldens_file:
+            json.dump(hashes, goldens_file, indent=2)
+            goldens_file.write('\n')
+
+        print(f"Saved {len(hashes)} goldens to {args.goldens}")
+        return
+
+    with open(args.goldens) as goldens_file:
+        goldens = json.load(goldens_file)
+
+    mismatches = [name for name, output_hash in hashes.items() if name in goldens and goldens[name] != output_hash]
+    missing = [name for name in hashes if name not in goldens]
+
+    for name in mismatches:
+        print(f"MISMATCH: {name}")
+
+    print(f"{len(hashes) - len(mismatches) - len(missing)} match, {len(mismatches)} mismatch, {len(missing)} not in the goldens")
+    sys.exit(1 if mismatches else 0)
+
+
+if __name__ == '__main__':
+    main()
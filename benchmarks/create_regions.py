@@ -0,0 +1,55 @@
+"""
+Times create_regions for Leon A with enemy kills as locations (killsanity) off and on,
+across 1, 10, and 50 RE2R players in the same multiworld.
+
+Uses the stand-in Archipelago modules in benchmarks/standin, unless --archipelago points at an Archipelago checkout
+with this apworld in worlds/residentevil2remake. Run from the repo root:
+
+    python benchmarks/create_regions.py [--archipelago /path/to/Archipelago]
+"""
+import argparse
+import time
+
+from harness import add_archipelago_argument, generate, import_world
+
+PLAYER_COUNTS = [1, 10, 50]
+REPEATS = 3
+
+
+def time_create_regions(world_type, player_count, enemy_kills) -> float:
+    options = { 'character': 'leon', 'scenario': 'a', 'add_enemy_kills_as_locations': 'all' if enemy_kills else 'none' }
+    worlds = generate(world_type, [options] * player_count, steps=['generate_early'])
+
+    start = time.perf_counter()
+
+    for world in worlds:
+        world.create_regions()
+
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    add_archipelago_argument(parser)
+    args = parser.parse_args()
+
+    ResidentEvil2Remake = import_world(args.archipelago)
+
+    print("create_regions, Leon A (best of {} runs)".format(REPEATS))
+    print("{}{}{}".format('players'.ljust(10, ' '), 'killsanity off'.rjust(18, ' '), 'killsanity on'.rjust(18, ' ')))
+
+    for player_count in PLAYER_COUNTS:
+        timings = [
+            min(time_create_regions(ResidentEvil2Remake, player_count, enemy_kills) for _ in range(REPEATS))
+                for enemy_kills in [False, True]
+        ]
+
+        print("{}{}{}".format(
+            str(player_count).ljust(10, ' '),
+            '{:.1f} ms'.format(timings[0] * 1000).rjust(18, ' '),
+            '{:.1f} ms'.format(timings[1] * 1000).rjust(18, ' ')
+        ))
+
+
+if __name__ == '__main__':
+    main()
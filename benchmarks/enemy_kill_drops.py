@@ -0,0 +1,119 @@
+"""
+Check for the items that enemy kills add to the pool (Add Enemy Kills as Locations / Enemy Kill Items). Runs generate_early for
+Leon A on standard / assisted (the only scenario that killsanity supports) with every Enemy Kill Items choice across a range of seeds,
+and checks that:
+
+    - every enemy kill location got a drop, and every drop is one that the chosen Enemy Kill Items option allows
+      (e.g., only ammo for Ammo), instead of every choice getting the Mixed drops
+    - the drops are the same as the ones in baselines/enemy_kill_drops.json, which is also how to check that they're the same
+      no matter what PYTHONHASHSEED is (run it with a few different ones)
+
+If a change is supposed to change the drops, use --save-goldens to update them.
+
+Uses the stand-in Archipelago modules in benchmarks/standin, unless --archipelago points at an Archipelago checkout
+with this apworld in worlds/residentevil2remake. Run from the repo root:
+
+    python benchmarks/enemy_kill_drops.py [--archipelago /path/to/Archipelago] [--seeds 5] [--save-goldens]
+"""
+import argparse
+import hashlib
+import json
+import os
+import sys
+
+from harness import BENCHMARK_DIRECTORY, add_archipelago_argument, generate, get_option_keys, import_world
+
+GOLDENS_FILE = os.path.join(BENCHMARK_DIRECTORY, 'baselines', 'enemy_kill_drops.json')
+
+DIFFICULTIES = ['standard', 'assisted']
+
+
+# the drop at each enemy kill location, and any drops that the chosen option doesn't allow
+def get_drops(world) -> tuple:
+    from worlds.residentevil2remake.Data import Data
+
+    is_valid_drop = Data.enemy_kill_drop_filters[world.resolved_options.enemy_kill_items]
+    drops = {}
+    invalid_drops = []
+
+    for key, location in world.source_locations.base.items():
+        if location.get('original_item') != "__Enemy Kill Drop Placeholder__":
+            continue
+
+        drop_name = drops[key] = world.source_locations[key].get('original_item')
+        drop = world.item_name_to_item.get(drop_name)
+
+        if drop is None or not is_valid_drop(drop):
+            invalid_drops.append(f"{key}: {drop_name}")
+
+    return drops, invalid_drops
+
+def check_drops(world_type, seeds: int) -> tuple:
+    hashes = {}
+    problems = {}
+
+    for enemy_kill_items in get_option_keys(world_type, 'enemy_kill_items'):
+        for difficulty in DIFFICULTIES:
+            for seed in range(1, seeds + 1):
+                options = {
+                    'character': 'leon', 'scenario': 'a', 'difficulty': difficulty,
+                    'add_enemy_kills_as_locations': 'all', 'enemy_kill_items': enemy_kill_items
+                }
+                world = generate(world_type, [options], seed=seed, steps=['generate_early'])[0]
+                drops, invalid_drops = get_drops(world)
+                name = f"leon a {difficulty} {enemy_kill_items} seed {seed}"
+
+                if len(drops) == 0:
+                    invalid_drops.append("no enemy kill locations")
+
+                if invalid_drops:
+                    problems[name] = invalid_drops
+
+                hashes[name] = hashlib.sha1(json.dumps(drops, sort_keys=True).encode()).hexdigest()
+
+    return hashes, problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    add_archipelago_argument(parser)
+    parser.add_argument('--seeds', type=int, default=5, help="how many seeds to check for each choice (default: 5)")
+    parser.add_argument('--goldens', default=GOLDENS_FILE, help="goldens file to compare against / save to")
+    parser.add_argument('--save-goldens', action='store_true', help="save these drops as the new goldens")
+    args = parser.parse_args()
+
+    world_type = import_world(args.archipelago)
+    hashes, problems = check_drops(world_type, args.seeds)
+
+    for name, invalid_drops in problems.items():
+        print(f"WRONG DROPS: {name}: {', '.join(invalid_drops[:5])}{' ...' if len(invalid_drops) > 5 else ''}")
+
+    if args.save_goldens:
+        if problems:
+            sys.exit("Not saving goldens with wrong drops")
+
+        os.makedirs(os.path.dirname(args.goldens), exist_ok=True)
+
+        with open(args.goldens, 'w') as goldens_file:
+            json.dump(hashes, goldens_file, indent=2)
+            goldens_file.write('\n')
+
+        print(f"Saved {len(hashes)} goldens to {args.goldens}")
+        return
+
+    with open(args.goldens) as goldens_file:
+        goldens = json.load(goldens_file)
+
+    mismatches = [name for name, drops_hash in hashes.items() if name in goldens and goldens[name] != drops_hash]
+    missing = [name for name in hashes if name not in goldens]
+
+    for name in mismatches:
+        print(f"MISMATCH: {name}")
+
+    print(f"{len(hashes) - len(mismatches) - len(missing)} match, {len(mismatches)} mismatch, {len(missing)} not in the goldens, "
+        f"{len(problems)} with wrong drops")
+    sys.exit(1 if mismatches or problems else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,149 @@
+"""
+Runs the RE2R world through generate_early -> create_regions -> create_items -> pre_fill for every character / scenario / difficulty,
+with every Cross-Scenario Weapons mode, and times loading each scenario's data. For each run, it reports:
+
+    wall      best wall time of the repeats, in ms
+    peak      peak memory allocated during the run (tracemalloc), in KB
+    blocks    memory blocks allocated by the run that are still alive when it finishes (what the generated world holds on to)
+    gc        garbage collections during the run (more allocation churn = more collections)
+
+Results are compared against the JSON baseline in benchmarks/baselines, if there is one. Run from the repo root:
+
+    python benchmarks/generation.py                   # compare against the baseline
+    python benchmarks/generation.py --save-baseline   # (re)write the baseline
+"""
+import argparse
+import gc
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+
+from harness import BENCHMARK_DIRECTORY, add_archipelago_argument, generate, get_option_keys, import_world
+
+BASELINE_FILE = os.path.join(BENCHMARK_DIRECTORY, 'baselines', 'generation.json')
+
+CHARACTERS = ['leon', 'claire']
+SCENARIOS = ['a', 'b']
+DIFFICULTIES = ['standard', 'hardcore', 'assisted']
+
+
+def measure(run, repeats: int) -> dict:
+    run() # warm up, so one-time work (like loading the scenario data) isn't counted
+
+    wall = min(timed(run) for _ in range(repeats))
+
+    gc.collect()
+    collections_before = sum(stats['collections'] for stats in gc.get_stats())
+    blocks_before = sys.getallocatedblocks()
+    tracemalloc.start()
+
+    result = run()
+
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    blocks = sys.getallocatedblocks() - blocks_before
+    collections = sum(stats['collections'] for stats in gc.get_stats()) - collections_before
+
+    del result
+
+    return { 'wall_ms': round(wall * 1000, 3), 'peak_kb': round(peak / 1024, 1), 'blocks': blocks, 'gc': collections }
+
+def timed(run) -> float:
+    start = time.perf_counter()
+    run()
+
+    return time.perf_counter() - start
+
+def get_benchmarks(world_type) -> dict:
+    from worlds.residentevil2remake.Data import Data
+
+    benchmarks = {}
+
+    for character, scenario in Data.scenarios:
+        benchmarks[f"data {character} {scenario}: load bundle"] = \
+            lambda c=character, s=scenario: Data.load_compiled(c, s, 'scenario')
+        benchmarks[f"data {character} {scenario}: compile json"] = \
+            lambda c=character, s=scenario: Data.compile_scenario(c, s)
+        benchmarks[f"data {character} {scenario}: load + pools"] = \
+            lambda c=character, s=scenario: [
+                Data.build_location_pool(Data.load_compiled(c, s, 'scenario'), hardcore, enemy_kills)
+                    for hardcore in [False, True] for enemy_kills in [False, True]
+            ]
+
+    for character in CHARACTERS:
+        for scenario in SCENARIOS:
+            for difficulty in DIFFICULTIES:
+                for weapons in get_option_keys(world_type, 'cross_scenario_weapons'):
+                    options = { 'character': character, 'scenario': scenario, 'difficulty': difficulty, 'cross_scenario_weapons': weapons }
+                    benchmarks[f"{character} {scenario} {difficulty}: {weapons}"] = lambda options=options: generate(world_type, [options])
+
+    # killsanity is only supported for Leon A on standard / assisted
+    for enemy_kill_items in get_option_keys(world_type, 'enemy_kill_items'):
+        options = { 'character': 'leon', 'scenario': 'a', 'add_enemy_kills_as_locations': 'all', 'enemy_kill_items': enemy_kill_items }
+        benchmarks[f"leon a standard: killsanity {enemy_kill_items}"] = lambda options=options: generate(world_type, [options])
+
+    return benchmarks
+
+def format_change(value, baseline_value) -> str:
+    if not baseline_value:
+        return ''
+
+    return '{:+.0f}%'.format((value - baseline_value) / baseline_value * 100)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    add_archipelago_argument(parser)
+    parser.add_argument('--repeats', type=int, default=5, help="how many times to time each run, keeping the best (default: 5)")
+    parser.add_argument('--filter', default='', help="only run benchmarks with this text in their name")
+    parser.add_argument('--baseline', default=BASELINE_FILE, help="baseline file to compare against / save to")
+    parser.add_argument('--save-baseline', action='store_true', help="save these results as the new baseline")
+    args = parser.parse_args()
+
+    world_type = import_world(args.archipelago)
+    baseline = {}
+
+    if os.path.exists(args.baseline) and not args.save_baseline:
+        with open(args.baseline) as baseline_file:
+            baseline = json.load(baseline_file)['results']
+
+    results = {}
+    print("{}{}{}{}{}{}".format(
+        'benchmark'.ljust(48, ' '), 'wall'.rjust(12, ' '), 'vs base'.rjust(9, ' '), 'peak'.rjust(12, ' '), 'blocks'.rjust(9, ' '), 'gc'.rjust(5, ' ')
+    ))
+
+    for name, run in get_benchmarks(world_type).items():
+        if args.filter not in name:
+            continue
+
+        result = results[name] = measure(run, args.repeats)
+
+        print("{}{}{}{}{}{}".format(
+            name.ljust(48, ' '),
+            '{:.2f} ms'.format(result['wall_ms']).rjust(12, ' '),
+            format_change(result['wall_ms'], baseline.get(name, {}).get('wall_ms')).rjust(9, ' '),
+            '{:.1f} KB'.format(result['peak_kb']).rjust(12, ' '),
+            str(result['blocks']).rjust(9, ' '),
+            str(result['gc']).rjust(5, ' ')
+        ))
+
+    if args.save_baseline:
+        os.makedirs(os.path.dirname(args.baseline), exist_ok=True)
+
+        with open(args.baseline, 'w') as baseline_file:
+            json.dump({
+                'python': platform.python_version(),
+                'platform': platform.platform(),
+                'archipelago': 'checkout' if args.archipelago else 'stand-in',
+                'results': results
+            }, baseline_file, indent=2)
+            baseline_file.write('\n')
+
+        print(f"\nSaved baseline to {args.baseline}")
+
+
+if __name__ == '__main__':
+    main()
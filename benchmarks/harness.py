@@ -0,0 +1,72 @@
+"""
+Shared setup for the benchmarks. Imports the RE2R world, either from an Archipelago checkout (--archipelago)
+or against the stand-in Archipelago modules in benchmarks/standin, and runs worlds through the generation steps.
+"""
+import os
+import sys
+import typing
+
+BENCHMARK_DIRECTORY = os.path.dirname(os.path.abspath(__file__))
+REPO_DIRECTORY = os.path.dirname(BENCHMARK_DIRECTORY)
+STANDIN_DIRECTORY = os.path.join(BENCHMARK_DIRECTORY, 'standin')
+
+GENERATION_STEPS = ['generate_early', 'create_regions', 'create_items', 'pre_fill']
+
+
+def add_archipelago_argument(parser):
+    parser.add_argument(
+        '--archipelago', default=None,
+        help="path to an Archipelago checkout with this apworld in worlds/residentevil2remake (default: use the stand-ins in benchmarks/standin)"
+    )
+
+def import_world(archipelago: str = None):
+    add_archipelago_path(archipelago)
+
+    from worlds.residentevil2remake import ResidentEvil2Remake
+    return ResidentEvil2Remake
+
+# makes Archipelago's modules (or the stand-ins) importable, without importing the world yet
+def add_archipelago_path(archipelago: str = None):
+    if archipelago:
+        sys.path.insert(0, os.path.abspath(archipelago))
+    else:
+        sys.path.insert(0, STANDIN_DIRECTORY)
+
+        # the stand-in "worlds" package is empty, so point it at this repo to find the residentevil2remake world folder
+        import worlds
+        worlds.__path__.append(REPO_DIRECTORY)
+
+def make_options(options_dataclass, **values):
+    return options_dataclass(**{
+        name: option_type.from_any(values.get(name, option_type.default))
+            for name, option_type in typing.get_type_hints(options_dataclass).items()
+    })
+
+def get_option_keys(world_type, option_name: str) -> list:
+    option_type = typing.get_type_hints(world_type.options_dataclass)[option_name]
+
+    return list(option_type.options.keys())
+
+# creates a multiworld with one RE2R world per set of option values, then runs every world through each step in order, 
+#    followed by the world type's stage_ method for the step if it has one (like generation does)
+def generate(world_type, options_per_player: list, seed: int = 1, steps: list = GENERATION_STEPS) -> list:
+    from BaseClasses import MultiWorld
+
+    multiworld = MultiWorld(len(options_per_player))
+    multiworld.set_seed(seed)
+    worlds = []
+
+    for player, option_values in zip(multiworld.player_ids, options_per_player):
+        world = world_type(multiworld, player)
+        world.options = make_options(world_type.options_dataclass, **option_values)
+        multiworld.worlds[player] = world
+        worlds.append(world)
+
+    for step in steps:
+        for world in worlds:
+            getattr(world, step)()
+
+        if hasattr(world_type, 'stage_' + step):
+            getattr(world_type, 'stage_' + step)(multiworld)
+
+    return worlds
@@ -0,0 +1,66 @@
+"""
+Compares the memory used by the scenario tables (locations, enemies, regions, region connections) when they're
+stored as plain dicts (the old layout) vs. the compact records from Records.py.
+
+Doesn't need Archipelago installed. Run from the repo root:
+
+    python benchmarks/memory_records.py
+"""
+import gc
+import importlib.util
+import json
+import os
+import sys
+import tracemalloc
+
+WORLD_DIRECTORY = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'residentevil2remake')
+
+
+# register the world folder as a package without running its __init__ (which needs Archipelago),
+#    so Data.py and Records.py can be imported on their own
+def import_data_module():
+    spec = importlib.util.spec_from_file_location(
+        'residentevil2remake', os.path.join(WORLD_DIRECTORY, '__init__.py'), submodule_search_locations=[WORLD_DIRECTORY]
+    )
+    sys.modules['residentevil2remake'] = importlib.util.module_from_spec(spec)
+
+    from residentevil2remake.Data import Data
+    return Data
+
+
+def measure(build) -> tuple:
+    gc.collect()
+    tracemalloc.start()
+    tables = build()
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return size, tables
+
+
+def main():
+    Data = import_data_module()
+    scenario_tables = ['regions', 'region_connections', 'locations', 'enemies']
+
+    # measure the compact layout first, so none of its interned strings exist yet
+    compact_size, compiled = measure(lambda: [Data.compile_scenario(character, scenario) for character, scenario in Data.scenarios])
+
+    # the dict layout is measured by parsing the same tables back out of json,
+    #    so every record gets its own dict and its own copies of every string, like the old loader did
+    compiled_json = [
+        json.dumps({ table: [dict(record) for record in records] for table, records in tables.items() })
+            for tables in compiled
+    ]
+    dict_size, _ = measure(lambda: [json.loads(tables) for tables in compiled_json])
+
+    record_count = sum(len(tables[table]) for tables in compiled for table in scenario_tables)
+
+    print("Scenario tables for all 4 scenarios ({} records):".format(record_count))
+    print("  {}{:>10.1f} KB".format('dict layout'.ljust(20, ' '), dict_size / 1024))
+    print("  {}{:>10.1f} KB".format('compact layout'.ljust(20, ' '), compact_size / 1024))
+    print("  {}{:>10.1f} %".format('saved'.ljust(20, ' '), 100 * (1 - compact_size / dict_size)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+"""
+Generates the same multiworld over and over in one process, like a long-running generator / WebHost worker does, and reports how
+much memory is still held after each generation once it's done and dropped. This should stay flat after the first generation
+(which loads the scenario data that every later generation shares).
+
+Each generation has 8 RE2R players across the scenarios with weapons randomized, and goes through the generation steps,
+then the slot data and spoiler, like the output step does.
+
+Uses the stand-in Archipelago modules in benchmarks/standin, unless --archipelago points at an Archipelago checkout
+with this apworld in worlds/residentevil2remake. Run from the repo root:
+
+    python benchmarks/repeated_generations.py [--archipelago /path/to/Archipelago] [--generations 10]
+"""
+import argparse
+import gc
+import io
+import tracemalloc
+
+from harness import add_archipelago_argument, generate, import_world
+
+OPTIONS_PER_PLAYER = [
+    { 'character': character, 'scenario': scenario, 'cross_scenario_weapons': weapons }
+        for weapons in ['all', 'troll'] for character in ['leon', 'claire'] for scenario in ['a', 'b']
+]
+
+
+def generate_with_output(world_type, seed: int):
+    worlds = generate(world_type, OPTIONS_PER_PLAYER, seed=seed)
+
+    for world in worlds:
+        world.fill_slot_data()
+
+        spoiler = io.StringIO()
+        world.write_spoiler(spoiler)
+        world.write_spoiler_end(spoiler)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    add_archipelago_argument(parser)
+    parser.add_argument('--generations', type=int, default=10, help="how many generations to run (default: 10)")
+    args = parser.parse_args()
+
+    world_type = import_world(args.archipelago)
+    tracemalloc.start()
+    first_retained = None
+
+    print("{}{}{}".format('generation'.ljust(14, ' '), 'retained'.rjust(14, ' '), 'since 1st'.rjust(14, ' ')))
+
+    for generation in range(1, args.generations + 1):
+        generate_with_output(world_type, seed=generation)
+        gc.collect()
+
+        retained, _ = tracemalloc.get_traced_memory()
+        first_retained = first_retained if first_retained is not None else retained
+
+        print("{}{}{}".format(
+            str(generation).ljust(14, ' '),
+            '{:.1f} KB'.format(retained / 1024).rjust(14, ' '),
+            '{:+.1f} KB'.format((retained - first_retained) / 1024).rjust(14, ' ')
+        ))
+
+    tracemalloc.stop()
+
+
+if __name__ == '__main__':
+    main()
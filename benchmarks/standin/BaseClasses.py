@@ -0,0 +1,189 @@
+import random
+from collections import Counter
+from enum import IntEnum, IntFlag
+
+
+class ItemClassification(IntFlag):
+    filler = 0
+    progression = 1
+    useful = 2
+    trap = 4
+
+
+class LocationProgressType(IntEnum):
+    DEFAULT = 1
+    PRIORITY = 2
+    EXCLUDED = 3
+
+
+class Item:
+    def __init__(self, name: str, classification: ItemClassification, code: int, player: int):
+        self.name = name
+        self.classification = classification
+        self.code = code
+        self.player = player
+        self.location = None
+
+    @property
+    def advancement(self) -> bool:
+        return bool(self.classification & ItemClassification.progression)
+
+    def __eq__(self, other):
+        return self.name == other.name and self.player == other.player
+
+    def __hash__(self):
+        return hash((self.name, self.player))
+
+    def __repr__(self):
+        return f"{self.name} (Player {self.player})"
+
+
+class CollectionState:
+    # like Archipelago, worlds' LogicMixins add their own state through these (see worlds.AutoWorld)
+    additional_init_functions = []
+    additional_copy_functions = []
+
+    def __init__(self, multiworld):
+        self.multiworld = multiworld
+        self.prog_items = { player: Counter() for player in multiworld.player_ids }
+
+        for function in self.additional_init_functions:
+            function(self, multiworld)
+
+    # like Archipelago, the item's world decides what collecting / removing it does to the state
+    def collect(self, item: Item) -> bool:
+        return self.multiworld.worlds[item.player].collect(self, item)
+
+    def remove(self, item: Item) -> bool:
+        return self.multiworld.worlds[item.player].remove(self, item)
+
+    def copy(self):
+        state = CollectionState(self.multiworld)
+        state.prog_items = { player: items.copy() for player, items in self.prog_items.items() }
+
+        for function in self.additional_copy_functions:
+            state = function(self, state)
+
+        return state
+
+    def has(self, item_name: str, player: int, count: int = 1) -> bool:
+        return self.prog_items[player][item_name] >= count
+
+    def has_all(self, item_names, player: int) -> bool:
+        items = self.prog_items[player]
+
+        return all(items[item_name] for item_name in item_names)
+
+
+class Entrance:
+    access_rule = staticmethod(lambda state: True)
+
+    def __init__(self, player: int, name: str, parent_region):
+        self.player = player
+        self.name = name
+        self.parent_region = parent_region
+        self.connected_region = None
+
+
+class Location:
+    access_rule = staticmethod(lambda state: True)
+    item_rule = staticmethod(lambda item: True)
+    progress_type = LocationProgressType.DEFAULT
+
+    def __init__(self, player: int, name: str, address: int = None, parent=None):
+        self.player = player
+        self.name = name
+        self.address = address
+        self.parent_region = parent
+        self.item = None
+        self.locked = False
+
+    def place_locked_item(self, item: Item):
+        self.item = item
+        item.location = self
+        self.locked = True
+
+
+class Region:
+    def __init__(self, name: str, player: int, multiworld):
+        self.name = name
+        self.player = player
+        self.multiworld = multiworld
+        self.locations = []
+        self.exits = []
+
+    def connect(self, connecting_region, name: str = None, rule=None) -> Entrance:
+        entrance = Entrance(self.player, name or f"{self.name} -> {connecting_region.name}", self)
+        entrance.connected_region = connecting_region
+
+        if rule:
+            entrance.access_rule = rule
+
+        self.exits.append(entrance)
+
+        return entrance
+
+
+class MultiWorld:
+    def __init__(self, players: int):
+        self.players = players
+        self.player_ids = tuple(range(1, players + 1))
+        self.player_name = { player: f"Player{player}" for player in self.player_ids }
+        self.worlds = {}
+        self.random = random.Random()
+        self.seed = None
+        self.regions = []
+        self.itempool = []
+        self.precollected_items = { player: [] for player in self.player_ids }
+        self.early_items = { player: {} for player in self.player_ids }
+        self.completion_condition = {}
+
+        # regions are only ever appended, so index the new ones on lookup (like Archipelago's region / location caches)
+        self.indexed_region_count = 0
+        self.regions_by_player = { player: [] for player in self.player_ids }
+        self.locations_by_player_and_name = {}
+
+    def set_seed(self, seed: int = None, secure: bool = False, name: str = None):
+        self.seed = seed
+        self.random.seed(seed)
+
+    def get_out_file_name_base(self, player: int) -> str:
+        return f"AP_{self.seed}_P{player}_{self.player_name[player]}"
+
+    def index_new_regions(self):
+        for region in self.regions[self.indexed_region_count:]:
+            self.regions_by_player[region.player].append(region)
+
+            for location in region.locations:
+                self.locations_by_player_and_name[(location.player, location.name)] = location
+
+        self.indexed_region_count = len(self.regions)
+
+    def get_region(self, region_name: str, player: int) -> Region:
+        self.index_new_regions()
+
+        for region in self.regions_by_player[player]:
+            if region.name == region_name:
+                return region
+
+        raise KeyError(region_name)
+
+    def get_locations(self, player: int = None) -> list:
+        self.index_new_regions()
+        regions = self.regions if player is None else self.regions_by_player[player]
+
+        return [location for region in regions for location in region.locations]
+
+    def get_location(self, location_name: str, player: int) -> Location:
+        self.index_new_regions()
+
+        return self.locations_by_player_and_name[(player, location_name)]
+
+    def get_filled_locations(self, player: int = None) -> list:
+        return [location for location in self.get_locations(player) if location.item is not None]
+
+    def get_unfilled_locations(self, player: int = None) -> list:
+        return [location for location in self.get_locations(player) if location.item is None]
+
+    def push_precollected(self, item: Item):
+        self.precollected_items[item.player].append(item)
@@ -0,0 +1,175 @@
+from dataclasses import dataclass
+
+
+class OptionError(ValueError):
+    pass
+
+
+class AssembleOptions(type):
+    def __new__(mcs, name, bases, attrs):
+        options = attrs["options"] = {}
+        name_lookup = attrs["name_lookup"] = {}
+
+        for base in bases:
+            options.update(getattr(base, "options", {}))
+            name_lookup.update(getattr(base, "name_lookup", {}))
+
+        new_options = { key[7:].lower(): value for key, value in attrs.items() if key.startswith("option_") }
+        options.update(new_options)
+        name_lookup.update({ value: key for key, value in new_options.items() })
+
+        return super().__new__(mcs, name, bases, attrs)
+
+
+class Option(metaclass=AssembleOptions):
+    default = 0
+    auto_display_name = False
+
+    def __init__(self, value=None):
+        self.value = self.default if value is None else value
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.current_option_name})"
+
+    @classmethod
+    def from_any(cls, data):
+        if isinstance(data, str) and data in cls.options:
+            return cls(cls.options[data])
+
+        return cls(data)
+
+    @property
+    def current_key(self) -> str:
+        return self.name_lookup[self.value]
+
+    @property
+    def current_option_name(self) -> str:
+        return self.get_option_name(self.value)
+
+    @classmethod
+    def get_option_name(cls, value) -> str:
+        if cls.auto_display_name:
+            return cls.name_lookup[value].replace("_", " ").title()
+
+        return cls.name_lookup[value]
+
+
+class NumericOption(Option):
+    def __int__(self):
+        return int(self.value)
+
+    def __bool__(self):
+        return bool(self.value)
+
+
+class Toggle(NumericOption):
+    option_false = 0
+    option_true = 1
+
+    @classmethod
+    def get_option_name(cls, value) -> str:
+        return ["No", "Yes"][int(value)]
+
+
+class Choice(NumericOption):
+    auto_display_name = True
+
+
+class Range(NumericOption):
+    range_start = 0
+    range_end = 1
+
+    @classmethod
+    def from_any(cls, data):
+        return cls(int(data))
+
+    @classmethod
+    def get_option_name(cls, value) -> str:
+        return str(value)
+
+
+class NamedRange(Range):
+    special_range_names = {}
+
+    @classmethod
+    def from_any(cls, data):
+        if isinstance(data, str) and data in cls.special_range_names:
+            return cls(cls.special_range_names[data])
+
+        return cls(int(data))
+
+
+class OptionList(Option):
+    default = ()
+
+    def __init__(self, value=None):
+        self.value = list(self.default if value is None else value)
+
+    @classmethod
+    def get_option_name(cls, value) -> str:
+        return ", ".join(map(str, value))
+
+
+class OptionSet(Option):
+    default = frozenset()
+
+    def __init__(self, value=None):
+        self.value = set(self.default if value is None else value)
+
+    @classmethod
+    def get_option_name(cls, value) -> str:
+        return ", ".join(sorted(value))
+
+
+class OptionDict(Option):
+    default = {}
+
+    def __init__(self, value=None):
+        self.value = dict(self.default if value is None else value)
+
+    @classmethod
+    def get_option_name(cls, value) -> str:
+        return ", ".join(f"{key}: {amount}" for key, amount in value.items())
+
+
+class StartInventoryPool(OptionDict):
+    pass
+
+
+class LocalItems(OptionSet):
+    pass
+
+
+class NonLocalItems(OptionSet):
+    pass
+
+
+class DeathLink(Toggle):
+    pass
+
+
+class ProgressionBalancing(NamedRange):
+    default = 50
+    range_end = 99
+
+
+class Accessibility(Choice):
+    option_full = 0
+    option_minimal = 2
+
+
+@dataclass
+class CommonOptions:
+    progression_balancing: ProgressionBalancing
+    accessibility: Accessibility
+
+
+@dataclass
+class PerGameCommonOptions(CommonOptions):
+    local_items: LocalItems
+    non_local_items: NonLocalItems
+
+
+@dataclass
+class DeathLinkMixin:
+    death_link: DeathLink
@@ -0,0 +1,2 @@
+def visualize_regions(*args, **kwargs):
+    pass
@@ -0,0 +1,67 @@
+import random
+
+from BaseClasses import CollectionState
+
+
+class World:
+    game = None
+    options_dataclass = None
+    options = None
+
+    def __init__(self, multiworld, player: int):
+        self.multiworld = multiworld
+        self.player = player
+        self.random = random.Random(multiworld.random.getrandbits(64))
+
+    # like Archipelago, states only count progression items, and worlds can override collect / remove to track more
+    def collect_item(self, state, item, remove: bool = False):
+        if item.advancement:
+            return item.name
+
+        return None
+
+    def collect(self, state, item) -> bool:
+        name = self.collect_item(state, item)
+
+        if name:
+            state.prog_items[self.player][name] += 1
+            return True
+
+        return False
+
+    def remove(self, state, item) -> bool:
+        name = self.collect_item(state, item, True)
+
+        if name:
+            state.prog_items[self.player][name] -= 1
+
+            if state.prog_items[self.player][name] < 1:
+                del state.prog_items[self.player][name]
+
+            return True
+
+        return False
+
+
+# like Archipelago, a world's LogicMixin subclass adds its attributes / methods to CollectionState,
+#    and its init_mixin / copy_mixin run whenever a state is created / copied
+class AutoLogicRegister(type):
+    def __new__(cls, name: str, bases: tuple, dct: dict):
+        new_class = super().__new__(cls, name, bases, dct)
+
+        for item_name, function in dct.items():
+            if item_name == "copy_mixin":
+                CollectionState.additional_copy_functions.append(function)
+            elif item_name == "init_mixin":
+                CollectionState.additional_init_functions.append(function)
+            elif not item_name.startswith("__"):
+                if hasattr(CollectionState, item_name):
+                    raise Exception(f"Name conflict on Logic Mixin {name} trying to overwrite {item_name}")
+
+                setattr(CollectionState, item_name, function)
+
+        return new_class
+
+
+class LogicMixin(metaclass=AutoLogicRegister):
+    pass
@@ -0,0 +1,17 @@
+from BaseClasses import Location
+
+
+def set_rule(spot, rule):
+    spot.access_rule = rule
+
+
+def add_item_rule(spot, rule, combine: str = "and"):
+    old_rule = spot.item_rule
+
+    # empty rule, replace instead of add
+    if old_rule is Location.item_rule:
+        spot.item_rule = rule
+    elif combine == "and":
+        spot.item_rule = lambda item: rule(item) and old_rule(item)
+    else:
+        spot.item_rule = lambda item: rule(item) or old_rule(item)
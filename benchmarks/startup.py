@@ -0,0 +1,67 @@
+"""
+Times importing the RE2R world in a fresh Python process, which every generation (and every Archipelago launch that loads
+the worlds) pays before doing anything else. Archipelago itself (or the stand-ins) is imported first, outside the timing,
+so only the world's own import is counted: its modules, the item / location tables, and the class body.
+
+Runs with the compiled bundles as they are (warm, like a release) and with the bundles deleted first (cold, like the first run
+after changing the json), and reports the best time of the runs for each. The cold runs delete data/compiled, which the world
+rebuilds the next time it's imported.
+
+Uses the stand-in Archipelago modules in benchmarks/standin, unless --archipelago points at an Archipelago checkout
+with this apworld in worlds/residentevil2remake. Run from the repo root:
+
+    python benchmarks/startup.py [--archipelago /path/to/Archipelago] [--runs 10]
+"""
+import argparse
+import os
+import shutil
+import subprocess
+import sys
+
+from harness import BENCHMARK_DIRECTORY, REPO_DIRECTORY, add_archipelago_argument
+
+COMPILED_DIRECTORY = os.path.join(REPO_DIRECTORY, 'residentevil2remake', 'data', 'compiled')
+
+# imports the Archipelago modules the world needs, then times only the world import, and prints the time in ms
+IMPORT_SCRIPT = """
+import sys, time
+sys.path.insert(0, {benchmark_directory!r})
+from harness import add_archipelago_path
+add_archipelago_path({archipelago!r})
+import BaseClasses, Fill, Options, Utils, worlds.AutoWorld, worlds.generic.Rules
+
+start = time.perf_counter()
+from worlds.residentevil2remake import ResidentEvil2Remake
+print((time.perf_counter() - start) * 1000)
+"""
+
+
+def time_import(archipelago: str) -> float:
+    script = IMPORT_SCRIPT.format(benchmark_directory=BENCHMARK_DIRECTORY, archipelago=archipelago)
+    output = subprocess.run([sys.executable, '-c', script], capture_output=True, text=True, check=True).stdout
+
+    return float(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    add_archipelago_argument(parser)
+    parser.add_argument('--runs', type=int, default=10, help="how many fresh processes to time for each, keeping the best (default: 10)")
+    args = parser.parse_args()
+
+    time_import(args.archipelago) # make sure the bundles are built before timing the warm runs
+    warm = min(time_import(args.archipelago) for _ in range(args.runs))
+
+    cold_times = []
+
+    for _ in range(args.runs):
+        shutil.rmtree(COMPILED_DIRECTORY, ignore_errors=True)
+        cold_times.append(time_import(args.archipelago))
+
+    print("{}{}".format('world import'.ljust(32, ' '), 'best'.rjust(12, ' ')))
+    print("{}{}".format('warm (bundles built)'.ljust(32, ' '), '{:.2f} ms'.format(warm).rjust(12, ' ')))
+    print("{}{}".format('cold (no bundles)'.ljust(32, ' '), '{:.2f} ms'.format(min(cold_times)).rjust(12, ' ')))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,92 @@
+"""
+Times a sweep-like pass over the location / entrance rules for each character / scenario (on standard, with killsanity off and on).
+
+Starting from an empty state, each of the world's progression items is collected in item pool order, and after each one,
+the reachable regions are found through the entrance rules and every location rule in them is checked, like Archipelago's
+sweeps and fill do over and over. Reports the best time of the repeats, and how many rules were checked.
+
+Uses the stand-in Archipelago modules in benchmarks/standin, unless --archipelago points at an Archipelago checkout
+with this apworld in worlds/residentevil2remake. Run from the repo root:
+
+    python benchmarks/sweeps.py [--archipelago /path/to/Archipelago]
+"""
+import argparse
+import time
+
+from harness import add_archipelago_argument, generate, import_world
+
+REPEATS = 20
+
+
+def sweep(world) -> int:
+    from BaseClasses import CollectionState
+
+    state = CollectionState(world.multiworld)
+    menu = world.multiworld.get_region('Menu', world.player)
+    progression_items = [item for item in world.multiworld.itempool if item.player == world.player and item.advancement]
+    rule_checks = 0
+
+    for item in progression_items:
+        state.collect(item)
+
+        reachable = { menu }
+        regions_to_check = [menu]
+
+        while len(regions_to_check) > 0:
+            region = regions_to_check.pop()
+
+            for entrance in region.exits:
+                rule_checks += 1
+
+                if entrance.connected_region not in reachable and entrance.access_rule(state):
+                    reachable.add(entrance.connected_region)
+                    regions_to_check.append(entrance.connected_region)
+
+        for region in reachable:
+            for location in region.locations:
+                rule_checks += 1
+                location.access_rule(state)
+
+    return rule_checks
+
+def time_sweep(world) -> tuple:
+    best = None
+
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        rule_checks = sweep(world)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+
+    return best, rule_checks
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    add_archipelago_argument(parser)
+    args = parser.parse_args()
+
+    world_type = import_world(args.archipelago)
+
+    print("{}{}{}".format('scenario'.ljust(32, ' '), 'best'.rjust(12, ' '), 'rule checks'.rjust(14, ' ')))
+
+    for character in ['leon', 'claire']:
+        for scenario in ['a', 'b']:
+            for enemy_kills in [False, True]:
+                # killsanity is only supported for Leon A
+                if enemy_kills and (character, scenario) != ('leon', 'a'):
+                    continue
+
+                options = { 'character': character, 'scenario': scenario, 'add_enemy_kills_as_locations': 'all' if enemy_kills else 'none' }
+                world = generate(world_type, [options])[0]
+                best, rule_checks = time_sweep(world)
+
+                print("{}{}{}".format(
+                    "{} {}{}".format(character, scenario, ' (killsanity)' if enemy_kills else '').ljust(32, ' '),
+                    '{:.2f} ms'.format(best * 1000).rjust(12, ' '),
+                    str(rule_checks).rjust(14, ' ')
+                ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,111 @@
+"""
+Times each step of the weapon randomizer (the mode itself, upgrades, high-grade gunpowder, troll, and the ammo split / smoothing
+inside them) for every Cross-Scenario Weapons mode, using the world's own profiling (RE2R_PROFILE). Pair it with weapon_snapshots.py
+when changing the randomizer: this shows whether the change is faster, and the snapshots show it still generates the same thing.
+
+For each mode, it runs generate_early for every character / scenario / difficulty across a range of seeds, adds up the time
+spent in each step, and reports the best total of the repeats for each step, divided by the number of generations (so ms per generation).
+Steps include the steps they call, e.g. all_ammo includes all and _split_ammo_randomly.
+
+Results are compared against the JSON baseline in benchmarks/baselines, if there is one. Uses the stand-in Archipelago modules
+in benchmarks/standin, unless --archipelago points at an Archipelago checkout with this apworld in worlds/residentevil2remake.
+Run from the repo root:
+
+    python benchmarks/weapon_randomizer.py                   # compare against the baseline
+    python benchmarks/weapon_randomizer.py --save-baseline   # (re)write the baseline
+"""
+import argparse
+import json
+import os
+import platform
+
+from harness import BENCHMARK_DIRECTORY, add_archipelago_argument, generate, get_option_keys, import_world
+
+BASELINE_FILE = os.path.join(BENCHMARK_DIRECTORY, 'baselines', 'weapon_randomizer.json')
+
+CHARACTERS = ['leon', 'claire']
+SCENARIOS = ['a', 'b']
+DIFFICULTIES = ['standard', 'hardcore']
+
+
+# total ms spent in each weapon randomizer step, across one generation for every character / scenario / difficulty / seed
+def time_steps(world_type, weapons: str, seeds: int) -> dict:
+    step_times = {}
+
+    for character in CHARACTERS:
+        for scenario in SCENARIOS:
+            for difficulty in DIFFICULTIES:
+                for seed in range(1, seeds + 1):
+                    options = { 'character': character, 'scenario': scenario, 'difficulty': difficulty, 'cross_scenario_weapons': weapons }
+                    world = generate(world_type, [options], seed=seed, steps=['generate_early'])[0]
+
+                    for step_name, timing in world.profiler.to_dict()['timings'].items():
+                        if step_name.startswith('WeaponRandomizer.'):
+                            step_times[step_name] = step_times.get(step_name, 0.0) + timing['ms']
+
+    return step_times
+
+def format_change(value, baseline_value) -> str:
+    if not baseline_value:
+        return ''
+
+    return '{:+.0f}%'.format((value - baseline_value) / baseline_value * 100)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    add_archipelago_argument(parser)
+    parser.add_argument('--seeds', type=int, default=10, help="how many seeds to run for each scenario / mode (default: 10)")
+    parser.add_argument('--repeats', type=int, default=3, help="how many times to time each mode, keeping the best for each step (default: 3)")
+    parser.add_argument('--baseline', default=BASELINE_FILE, help="baseline file to compare against / save to")
+    parser.add_argument('--save-baseline', action='store_true', help="save these results as the new baseline")
+    args = parser.parse_args()
+
+    # profiling is checked once at import, so it has to be on before the world is imported
+    os.environ['RE2R_PROFILE'] = '1'
+    world_type = import_world(args.archipelago)
+    generations = len(CHARACTERS) * len(SCENARIOS) * len(DIFFICULTIES) * args.seeds
+    baseline = {}
+
+    if os.path.exists(args.baseline) and not args.save_baseline:
+        with open(args.baseline) as baseline_file:
+            baseline = json.load(baseline_file)['results']
+
+    results = {}
+    print("{}{}{}".format('step'.ljust(60, ' '), 'per gen'.rjust(12, ' '), 'vs base'.rjust(9, ' ')))
+
+    for weapons in get_option_keys(world_type, 'cross_scenario_weapons'):
+        # no weapon randomizer to time
+        if weapons == 'none':
+            continue
+
+        time_steps(world_type, weapons, 1) # warm up, so loading the scenario data isn't counted
+        repeats = [time_steps(world_type, weapons, args.seeds) for _ in range(args.repeats)]
+
+        for step_name in repeats[0]:
+            name = f"{weapons}: {step_name}"
+            result = results[name] = round(min(step_times[step_name] for step_times in repeats) / generations, 4)
+
+            print("{}{}{}".format(
+                name.ljust(60, ' '),
+                '{:.3f} ms'.format(result).rjust(12, ' '),
+                format_change(result, baseline.get(name)).rjust(9, ' ')
+            ))
+
+    if args.save_baseline:
+        os.makedirs(os.path.dirname(args.baseline), exist_ok=True)
+
+        with open(args.baseline, 'w') as baseline_file:
+            json.dump({
+                'python': platform.python_version(),
+                'platform': platform.platform(),
+                'archipelago': 'checkout' if args.archipelago else 'stand-in',
+                'results': results
+            }, baseline_file, indent=2)
+            baseline_file.write('\n')
+
+        print(f"\nSaved baseline to {args.baseline}")
+
+
+if __name__ == '__main__':
+    main()
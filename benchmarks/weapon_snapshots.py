@@ -0,0 +1,109 @@
+"""
+Snapshot check for the weapon randomizer, to prove that a change to it (like a faster version of one of its steps) still
+generates exactly the same thing for the same seed. Runs generate_early for each character / scenario / difficulty with every
+Cross-Scenario Weapons mode across a range of seeds, and compares what the randomizer left behind to the snapshots in
+baselines/weapon_snapshots.json:
+
+    source_locations       every field of every location, after the weapons, ammo, upgrades, gunpowder, etc. were swapped
+    replacement_weapons    the weapon swaps listed in the spoiler
+    replacement_ammo       the ammo swaps listed in the spoiler
+    starting_weapon
+
+Each snapshot is stored as a hash of its JSON, so any difference at all is a mismatch. Use --dump to write out the full snapshots,
+and diff a dump from before the change against one from after to see what a mismatch actually changed.
+If the change is supposed to change the output, use --save-snapshots to update them.
+
+Uses the stand-in Archipelago modules in benchmarks/standin, unless --archipelago points at an Archipelago checkout
+with this apworld in worlds/residentevil2remake. Run from the repo root:
+
+    python benchmarks/weapon_snapshots.py [--archipelago /path/to/Archipelago] [--seeds 10] [--save-snapshots] [--dump snapshots.json]
+"""
+import argparse
+import hashlib
+import json
+import os
+import sys
+
+from harness import BENCHMARK_DIRECTORY, add_archipelago_argument, generate, get_option_keys, import_world
+
+SNAPSHOTS_FILE = os.path.join(BENCHMARK_DIRECTORY, 'baselines', 'weapon_snapshots.json')
+
+CHARACTERS = ['leon', 'claire']
+SCENARIOS = ['a', 'b']
+DIFFICULTIES = ['standard', 'hardcore']
+
+
+def get_snapshot(world) -> dict:
+    return {
+        'source_locations': { key: dict(location) for key, location in world.source_locations.items() },
+        'replacement_weapons': world.replacement_weapons,
+        'replacement_ammo': world.replacement_ammo,
+        'starting_weapon': world.starting_weapon
+    }
+
+def get_snapshots(world_type, seeds: int) -> dict:
+    snapshots = {}
+
+    for weapons in get_option_keys(world_type, 'cross_scenario_weapons'):
+        # no weapon randomizer to check
+        if weapons == 'none':
+            continue
+
+        for character in CHARACTERS:
+            for scenario in SCENARIOS:
+                for difficulty in DIFFICULTIES:
+                    for seed in range(1, seeds + 1):
+                        options = { 'character': character, 'scenario': scenario, 'difficulty': difficulty, 'cross_scenario_weapons': weapons }
+                        world = generate(world_type, [options], seed=seed, steps=['generate_early'])[0]
+
+                        snapshots[f"{character} {scenario} {difficulty} {weapons} seed {seed}"] = get_snapshot(world)
+
+    return snapshots
+
+def get_hash(snapshot: dict) -> str:
+    return hashlib.sha256(json.dumps(snapshot, sort_keys=True).encode()).hexdigest()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    add_archipelago_argument(parser)
+    parser.add_argument('--seeds', type=int, default=10, help="how many seeds to check for each scenario / mode (default: 10)")
+    parser.add_argument('--snapshots', default=SNAPSHOTS_FILE, help="snapshots file to compare against / save to")
+    parser.add_argument('--save-snapshots', action='store_true', help="save this output as the new snapshots")
+    parser.add_argument('--dump', default=None, help="also write the full snapshots to this file, for diffing")
+    args = parser.parse_args()
+
+    world_type = import_world(args.archipelago)
+    snapshots = get_snapshots(world_type, args.seeds)
+    hashes = { name: get_hash(snapshot) for name, snapshot in snapshots.items() }
+
+    if args.dump:
+        with open(args.dump, 'w') as dump_file:
+            json.dump(snapshots, dump_file, indent=2, sort_keys=True)
+            dump_file.write('\n')
+
+    if args.save_snapshots:
+        os.makedirs(os.path.dirname(args.snapshots), exist_ok=True)
+
+        with open(args.snapshots, 'w') as snapshots_file:
+            json.dump(hashes, snapshots_file, indent=2)
+            snapshots_file.write('\n')
+
+        print(f"Saved {len(hashes)} snapshots to {args.snapshots}")
+        return
+
+    with open(args.snapshots) as snapshots_file:
+        saved_hashes = json.load(snapshots_file)
+
+    mismatches = [name for name, snapshot_hash in hashes.items() if name in saved_hashes and saved_hashes[name] != snapshot_hash]
+    missing = [name for name in hashes if name not in saved_hashes]
+
+    for name in mismatches:
+        print(f"MISMATCH: {name}")
+
+    print(f"{len(hashes) - len(mismatches) - len(missing)} match, {len(mismatches)} mismatch, {len(missing)} not in the snapshots")
+    sys.exit(1 if mismatches else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,6 +1,13 @@
+import hashlib
 import json
 import os
+import pickle
 import pkgutil
+import re
+import tempfile
+
+from .Reachability import analyze_reachability
+from .Records import LocationRecord, RegionRecord, RegionConnectionRecord
 
 # blatantly copied from the minecraft ap world because why not
 def load_data_file(*args) -> dict:
@@ -14,7 +21,20 @@ def load_data_file(*args) -> dict:
 
     return filedata
 
+def load_data_bytes(*args) -> bytes:
+    data_directory = "data"
+    fname = os.path.join(data_directory, *args)
+
+    try:
+        filedata = pkgutil.get_data(__name__, fname)
+    except OSError: # missing file, inside or outside of a packed .apworld
+        filedata = b''
+
+    return filedata
+
 class Data:
+    scenarios = [('leon', 'a'), ('leon', 'b'), ('claire', 'a'), ('claire', 'b')]
+
     item_table = []
     location_table = []
     enemy_table = []
@@ -23,22 +43,391 @@ class Data:
 
     item_name_groups = {}
 
-    def load_data(character, scenario):
+    # name <-> id of every location and enemy in every scenario, which is all the datapackage needs.
+    #    the full location / enemy / region records are only loaded for scenarios that someone is playing.
+    location_id_to_name = {}
+    location_name_to_id = {}
+    loaded_scenarios = []
+    location_name_to_location = {}
+
+    # indexes for each loaded scenario, built once when the scenario is loaded, so worlds can look up
+    #    their scenario's data directly instead of scanning every table for every player
+    location_pools = {} # (character, scenario, hardcore, enemy kills) -> { region - name: location }, with hardcore swaps already applied
+    region_index = {} # (character, scenario) -> { region name: region }
+    region_connection_index = {} # (character, scenario) -> [connection]
+    reachability = {} # (character, scenario) -> the reachability table for the scenario (see Reachability.py)
+    enemy_kill_drops = {} # (character, scenario, hardcore) -> { enemy kill items option: { enemy location key: drop name } }
+
+    # which items each enemy kill items option can drop, by option key. only the ones that are already on the scenario's locations are used
+    enemy_kill_drop_filters = {
+        'trash': lambda item: item.get('type', 'None') in ['Lore'] or 'Trophy' in item['name'],
+        'healing': lambda item: item.get('type', 'None') in ['Recovery'],
+        'gunpowder': lambda item: 'Gunpowder' in item['name'],
+        'ammo': lambda item: item.get('type', 'None') in ['Ammo'],
+        'ammo_related': lambda item: item.get('type', 'None') in ['Ammo'] or 'Gunpowder' in item['name'],
+        'all_weapon_related': lambda item: item.get('type', 'None') in ['Ammo', 'Subweapon'] or 'Gunpowder' in item['name'],
+        'mixed': lambda item: item.get('type', 'None') in ['Recovery', 'Ammo', 'Subweapon'] or 'Gunpowder' in item['name']
+    }
+
+    # bump this whenever the compiled data changes shape, so that any existing bundles are rebuilt
+    bundle_version = 2
+
+    def get_start_ids(character, scenario):
         character_offsets = { 'leon': 0, 'claire': 1000 }        
         scenario_offsets = { 'a': 0, 'b': 500 }
+
+        location_start = item_start = 3000000000 + character_offsets[character] + scenario_offsets[scenario]
+        enemy_start = location_start + 1000000000
+
+        return location_start, item_start, enemy_start
+
+    def load_index():
+        checksum = Data.get_checksum(None, None, 'index')
+        bundle_checksum, compiled = Data.load_bundle('index.bundle').get('index', (None, None))
+
+        if bundle_checksum == checksum:
+            compiled = pickle.loads(compiled)
+        else:
+            compiled = Data.compile_index()
+
+            # if the index hasn't been built, the tables came from the scenarios instead, so don't save them under the index's checksum
+            if load_data_bytes('index.json'):
+                Data.save_bundle('index.bundle', { 'index': (checksum, pickle.dumps(compiled, protocol=pickle.HIGHEST_PROTOCOL)) })
+
+        Data.location_id_to_name = compiled['location_id_to_name']
+        Data.location_name_to_id = compiled['location_name_to_id']
+
+    # both directions of the location name / id tables in one pass, sharing the same name strings (which pickling keeps shared too)
+    def compile_index() -> dict:
+        index = load_data_file('index.json')
+
+        # if the index hasn't been built, or was built from scenario data that's changed since (write_index wasn't re-run),
+        #    fall back to loading every scenario to get the names and ids
+        if not index or index.get('sources') != Data.get_index_sources_checksum():
+            index = Data.build_index()
+
+        location_id_to_name = {}
+        location_name_to_id = {}
+
+        for table in ['locations', 'enemies']:
+            for character, scenario in Data.scenarios:
+                for name, id in index[table]['{}/{}'.format(character, scenario)]:
+                    location_id_to_name[id] = name
+                    location_name_to_id[name] = id
+
+        return { 'location_id_to_name': location_id_to_name, 'location_name_to_id': location_name_to_id }
+
+    def build_index() -> dict:
+        index = { 'locations': {}, 'enemies': {} }
+
+        for character, scenario in Data.scenarios:
+            Data.load_data(character, scenario)
+
+            for table_name, table in [('locations', Data.location_table), ('enemies', Data.enemy_table)]:
+                index[table_name]['{}/{}'.format(character, scenario)] = [
+                    [loc['region'] + ' - ' + loc['name'], loc['id']] 
+                        for loc in table if loc['character'] == character and loc['scenario'] == scenario
+                ]
+
+        return index
+
+    # the scenario files that the index is built from, so an index built from older versions of them isn't used
+    def get_index_sources_checksum() -> str:
+        checksum = hashlib.sha1(str(Data.bundle_version).encode())
+
+        for character, scenario in Data.scenarios:
+            for source_file in Data.get_scenario_source_files(character, scenario):
+                checksum.update(load_data_bytes(*source_file))
+
+        return checksum.hexdigest()
+
+    # run this after changing any locations or enemies, so the index matches the scenario data
+    def write_index():
+        tables = ['  "sources": {}'.format(json.dumps(Data.get_index_sources_checksum()))]
+
+        for table_name, table in Data.build_index().items():
+            scenario_entries = [
+                '    {}: [\n{}\n    ]'.format(json.dumps(key), ',\n'.join('      ' + json.dumps(entry) for entry in entries))
+                    for key, entries in table.items()
+            ]
+            tables.append('  {}: {{\n{}\n  }}'.format(json.dumps(table_name), ',\n'.join(scenario_entries)))
+
+        with open(os.path.join(os.path.dirname(__file__), 'data', 'index.json'), 'w') as index_file:
+            index_file.write('{{\n{}\n}}\n'.format(',\n'.join(tables)))
+
+    def load_items(character, scenario):
+        compiled = Data.load_compiled(character, scenario, 'items')
+
+        Data.item_table.extend(compiled['items'])
+
+        for group_name, item_names in compiled['groups'].items():
+            if group_name not in Data.item_name_groups.keys():
+                Data.item_name_groups[group_name] = []
+
+            Data.item_name_groups[group_name].extend(item_names)
+
+    def load_data(character, scenario):
+        # only load each scenario once, no matter how many players are playing it
+        if (character, scenario) in Data.loaded_scenarios:
+            return
+
+        Data.loaded_scenarios.append((character, scenario))
+
+        compiled = Data.load_compiled(character, scenario, 'scenario')
+
+        Data.region_table.extend(compiled['regions'])
+        Data.region_connections_table.extend(compiled['region_connections'])
+        Data.location_table.extend(compiled['locations'])
+        Data.enemy_table.extend(compiled['enemies'])
+
+        Data.location_name_to_location.update({
+            loc['region'] + ' - ' + loc['name']: loc for loc in compiled['locations'] + compiled['enemies']
+        })
+
+        Data.region_index[(character, scenario)] = { region['name']: region for region in compiled['regions'] }
+        Data.region_connection_index[(character, scenario)] = compiled['region_connections']
+
+        for hardcore in [False, True]:
+            for enemy_kills in [False, True]:
+                Data.location_pools[(character, scenario, hardcore, enemy_kills)] = Data.build_location_pool(compiled, hardcore, enemy_kills)
+
+            Data.enemy_kill_drops[(character, scenario, hardcore)] = Data.build_enemy_kill_drops(Data.location_pools[(character, scenario, hardcore, True)])
+
+        Data.reachability[(character, scenario)] = Data.load_compiled(character, scenario, 'reachability')
+
+    def build_location_pool(compiled, hardcore, enemy_kills) -> dict:
+        locations_pool = { loc['id']: loc for loc in compiled['locations'] }
+
+        if enemy_kills:
+            locations_pool.update({ enemy['id']: enemy for enemy in compiled['enemies'] })
+
+        # if the player chose hardcore, take out any matching standard difficulty locations
+        if hardcore:
+            # group the standard locations by region and name, so each hardcore location can find the one it replaces without a scan
+            standard_ids = {}
+
+            for id, loc in locations_pool.items():
+                if loc['difficulty'] != 'hardcore':
+                    standard_ids.setdefault((loc['region'], loc['name']), []).append(id)
+
+            for hardcore_loc in [loc for loc in locations_pool.values() if loc['difficulty'] == 'hardcore']:
+                check_loc_region = re.sub(r'H\)$', ')', hardcore_loc['region']) # take the Hardcore off the region name
+                standard_locs = standard_ids.get((check_loc_region, hardcore_loc['name']), [])
+
+                # if there's a standard location with matching name and region, it's obsoleted in hardcore, remove it
+                if len(standard_locs) > 0:
+                    del locations_pool[standard_locs.pop(0)]
+
+        # else, the player is still playing standard, take out all of the matching hardcore difficulty locations
+        else:
+            locations_pool = {
+                id: loc for id, loc in locations_pool.items() if loc['difficulty'] != 'hardcore'
+            }
+
+        # now that we've factored in hardcore swaps, remove any hardcore locations that were just there for removing unused standard ones
+        #    and key the rest by region + name, which is how the worlds look them up
+        return { loc['region'] + ' - ' + loc['name']: loc for loc in locations_pool.values() if 'remove' not in loc }
+
+    def build_enemy_kill_drops(locations_pool) -> dict:
+        # since enemy kills don't give items themselves, each enemy gets one of the combat-related items that are already on 
+        #    the scenario's locations, going through them in turn (in the order they first show up in the locations)
+        enemy_keys = [key for key, loc in locations_pool.items() if loc.get('original_item') == "__Enemy Kill Drop Placeholder__"]
+        scenario_item_names = list(dict.fromkeys(loc['original_item'] for loc in locations_pool.values() if loc.get('original_item')))
+        items_by_name = { item['name']: item for item in Data.item_table }
+        enemy_kill_drops = {}
+
+        for enemy_kill_items, is_valid_drop in Data.enemy_kill_drop_filters.items():
+            drop_names = [name for name in scenario_item_names if name in items_by_name and is_valid_drop(items_by_name[name])]
+
+            if len(drop_names) == 0:
+                continue
+
+            enemy_kill_drops[enemy_kill_items] = { key: drop_names[x % len(drop_names)] for x, key in enumerate(enemy_keys) }
+
+        return enemy_kill_drops
+
+    ###
+    # Compiled bundles. Each scenario is compiled from its json files into a single pickled bundle with 
+    #    final ids, suffixed region names, and hardcore variants already applied, plus its reachability table. The json files are still
+    #    the source of truth, so each section of a bundle stores a checksum of the json it was compiled from,
+    #    and gets recompiled from the json whenever that doesn't match.
+    ###
+
+    def load_compiled(character, scenario, section) -> dict:
+        bundle_name = '{}_{}.bundle'.format(character, scenario)
+        checksum = Data.get_checksum(character, scenario, section)
+
+        bundle_checksum, compiled = Data.load_bundle(bundle_name).get(section, (None, None))
+
+        if bundle_checksum == checksum:
+            return pickle.loads(compiled)
+
+        # the bundle section is missing or stale, so compile from the json and save it for next time
+        compiled = Data.compile_sections[section](character, scenario)
+
+        # re-read the bundle before saving, since compiling this section might have saved the other sections
+        bundle = Data.load_bundle(bundle_name)
+        bundle[section] = (checksum, pickle.dumps(compiled, protocol=pickle.HIGHEST_PROTOCOL))
+        Data.save_bundle(bundle_name, bundle)
+
+        return compiled
+
+    def load_bundle(bundle_name) -> dict:
+        try:
+            bundle = pickle.loads(load_data_bytes('compiled', bundle_name))
+        except Exception: # missing (OSError, etc.), or unreadable (corrupt / written by another Python), so it's rebuilt as needed
+            bundle = {}
+
+        return bundle if isinstance(bundle, dict) else {}
+
+    def get_checksum(character, scenario, section) -> str:
+        if section == 'items':
+            source_files = [(character, 'items.json')]
+        elif section == 'index': # the index is checked against the scenario files too, so it's recompiled if they change
+            source_files = [('index.json',)] + [
+                source_file for character, scenario in Data.scenarios for source_file in Data.get_scenario_source_files(character, scenario)
+            ]
+        else: # the reachability table is compiled from the scenario, so it uses the same files
+            source_files = Data.get_scenario_source_files(character, scenario)
+
+        checksum = hashlib.sha1(str(Data.bundle_version).encode())
+
+        for source_file in source_files:
+            checksum.update(load_data_bytes(*source_file))
+
+        return checksum.hexdigest()
+
+    def get_scenario_source_files(character, scenario) -> list:
+        return [
+            (character, scenario, file_name) 
+                for file_name in ['regions.json', 'locations.json', 'locations_hardcore.json', 'region_connections.json', 'enemies.json']
+        ]
+
+    def save_bundle(bundle_name, bundle):
+        bundle_directory = os.path.join(os.path.dirname(__file__), 'data', 'compiled')
+        bundle_path = os.path.join(bundle_directory, bundle_name)
+
+        try:
+            os.makedirs(bundle_directory, exist_ok=True)
+
+            # write to a temp file of its own first, so other generations (or worker processes) compiling at the same time
+            #    never read half a bundle, or move each other's half-written temp file into place
+            with tempfile.NamedTemporaryFile(dir=bundle_directory, prefix=bundle_name + '.', suffix='.tmp', delete=False) as bundle_file:
+                temp_path = bundle_file.name
+
+                try:
+                    pickle.dump(bundle, bundle_file, protocol=pickle.HIGHEST_PROTOCOL)
+                except BaseException:
+                    bundle_file.close()
+                    os.remove(temp_path)
+                    raise
+
+            try:
+                os.replace(temp_path, bundle_path)
+            except OSError:
+                os.remove(temp_path)
+                raise
+        except OSError:
+            pass # probably running from a packed .apworld, which can't be written to, so just use the compiled data as-is
+
+    # build step for releases, so the bundles ship with the apworld instead of being compiled on first run
+    def write_bundles():
+        for character, scenario in Data.scenarios:
+            Data.save_bundle('{}_{}.bundle'.format(character, scenario), {
+                section: (
+                    Data.get_checksum(character, scenario, section), 
+                    pickle.dumps(compile_section(character, scenario), protocol=pickle.HIGHEST_PROTOCOL)
+                )
+                for section, compile_section in Data.compile_sections.items()
+            })
+
+        Data.save_bundle('index.bundle', {
+            'index': (Data.get_checksum(None, None, 'index'), pickle.dumps(Data.compile_index(), protocol=pickle.HIGHEST_PROTOCOL))
+        })
+
+    # run this after changing any regions, connections, or locations, to catch data mistakes before they're released
+    def check_reachability():
+        for character, scenario in Data.scenarios:
+            compiled = Data.compile_scenario(character, scenario)
+            scenario_locations = compiled['locations'] + compiled['enemies']
+            reachability = analyze_reachability(compiled['regions'], compiled['region_connections'], scenario_locations)
+            issues = []
+
+            for loc in scenario_locations:
+                name = loc['region'] + ' - ' + loc['name']
+
+                if loc['id'] in reachability['unreachable']:
+                    issues.append("Unreachable: {} (region isn't connected to Menu)".format(name))
+
+                if loc['id'] in reachability['redundant_rules']:
+                    issues.append("Redundant condition: {} (always met once its region is reached)".format(name))
+
+            # locations are looked up by region + name, so a second location with the same region + name (and difficulty) gets dropped
+            seen_locations = set()
+
+            for loc in scenario_locations:
+                location_key = (loc['region'], loc['name'], loc['difficulty'])
+
+                if location_key in seen_locations:
+                    issues.append("Duplicate: {} - {}".format(loc['region'], loc['name']))
+
+                seen_locations.add(location_key)
+
+            print("{} {}: {}".format(character.title(), scenario.upper(), "{} issue(s)".format(len(issues)) if issues else "OK"))
+
+            for issue in issues:
+                print("  " + issue)
+
+    def compile_items(character, scenario) -> dict:
+        _, item_start, _ = Data.get_start_ids(character, scenario)
+
+        ###
+        # Add item table for all difficulties
+        ###
+        
+        new_item_table = load_data_file(character, 'items.json')
+        item_table = [
+            { 
+                **item, 
+                'id': item['id'] if item.get('id') else item_start + key
+            } 
+            for key, item in enumerate(new_item_table)
+        ]
+        item_name_groups = {}
+
+        # For the items that have groups, add them to the item group names
+        new_items_with_groups = [item for _, item in enumerate(new_item_table) if "groups" in item.keys()]
+
+        for item_with_group in new_items_with_groups:
+            item_name = item_with_group["name"]
+            group_names = item_with_group["groups"]
+
+            for group_name in group_names:
+                if group_name not in item_name_groups.keys():
+                    item_name_groups[group_name] = []
+
+                item_name_groups[group_name].append(item_name)
+
+        return { 'items': item_table, 'groups': item_name_groups }
+
+    def compile_scenario(character, scenario) -> dict:
         hardcore_offset = 400 # put all hardcore-only locations in the last 100 location spots for each scenario
         scenario_suffix = ' ({}{})'.format(character[0].upper(), scenario.upper())
         scenario_suffix_hardcore = ' ({}{}H)'.format(character[0].upper(), scenario.upper()) # makes hardcore location variations unique
 
-        location_start = item_start = 3000000000 + character_offsets[character] + scenario_offsets[scenario]
-        enemy_start = location_start + 1000000000
+        location_start, _, enemy_start = Data.get_start_ids(character, scenario)
+
+        region_table = []
+        region_connections_table = []
+        location_table = []
+        enemy_table = []
 
         ###
         # Add standard regions
         ###
 
         new_region_table = load_data_file(character, scenario, 'regions.json')
-        Data.region_table.extend([
+        region_table.extend([
             {
                 **reg,
                 'name': reg['name'] + scenario_suffix if reg['name'] != 'Menu' else reg['name'], # add the scenario abbreviation so they're unique
@@ -56,7 +445,7 @@ class Data:
         hardcore_regions = set([loc['region'] for loc in hardcore_locations_table])
 
         if len(hardcore_regions) > 0:
-            Data.region_table.extend([
+            region_table.extend([
                 {
                     'name': reg + scenario_suffix_hardcore, # add the scenario abbreviation so they're unique
                     'character': character,
@@ -81,7 +470,7 @@ class Data:
 
             added_connections.append(connection_path)
 
-            Data.region_connections_table.append(
+            region_connections_table.append(
                 {
                     **conn,
                     'from': conn['from'] + scenario_suffix if conn['from'] != 'Menu' else conn['from'], # add the scenario abbreviation so they're unique
@@ -119,40 +508,14 @@ class Data:
                         'scenario': scenario    
                     }
 
-                    Data.region_connections_table.append(new_region_connection)
-
-        ###
-        # Add item table for all difficulties
-        ###
-        
-        new_item_table = load_data_file(character, 'items.json')
-        Data.item_table.extend([
-            { 
-                **item, 
-                'id': item['id'] if item.get('id') else item_start + key
-            } 
-            for key, item in enumerate(new_item_table)
-        ])
-
-        # For the items that have groups, add them to the item group names
-        new_items_with_groups = [item for _, item in enumerate(new_item_table) if "groups" in item.keys()]
-
-        for item_with_group in new_items_with_groups:
-            item_name = item_with_group["name"]
-            group_names = item_with_group["groups"]
-
-            for group_name in group_names:
-                if group_name not in Data.item_name_groups.keys():
-                    Data.item_name_groups[group_name] = []
-
-                Data.item_name_groups[group_name].append(item_name)
+                    region_connections_table.append(new_region_connection)
 
         ###
         # Add standard location table
         ###
 
         new_location_table = load_data_file(character, scenario, 'locations.json')
-        Data.location_table.extend([
+        location_table.extend([
             { 
                 **loc, 
                 'id': loc['id'] if loc.get('id') else location_start + key,
@@ -171,7 +534,7 @@ class Data:
         hardcore_location_table = load_data_file(character, scenario, 'locations_hardcore.json')
 
         if len(hardcore_location_table) > 0:
-            Data.location_table.extend([
+            location_table.extend([
                 { 
                     **loc, 
                     'id': loc['id'] if loc.get('id') else location_start + key + hardcore_offset,
@@ -187,9 +550,8 @@ class Data:
         # Add enemy table
         ###
 
-        enemy_table = load_data_file(character, scenario, 'enemies.json')
-
-        Data.enemy_table.extend([
+        new_enemy_table = load_data_file(character, scenario, 'enemies.json')
+        enemy_table.extend([
             { 
                 **enemy, 
                 'id': enemy['id'] if enemy.get('id') else enemy_start + key,
@@ -201,6 +563,21 @@ class Data:
                 # since enemy kills don't give items themselves, just randomize more combat-related items into the pool
                 'original_item': "__Enemy Kill Drop Placeholder__"
             }
-            for key, enemy in enumerate(enemy_table) if not enemy.get('excluded', 0)
+            for key, enemy in enumerate(new_enemy_table) if not enemy.get('excluded', 0)
         ])
 
+        # store everything as compact records instead of dicts, since these tables live for the whole generation
+        return {
+            'regions': [RegionRecord(reg) for reg in region_table],
+            'region_connections': [RegionConnectionRecord(conn) for conn in region_connections_table],
+            'locations': [LocationRecord(loc) for loc in location_table],
+            'enemies': [LocationRecord(enemy) for enemy in enemy_table]
+        }
+
+    def compile_reachability(character, scenario) -> dict:
+        compiled = Data.load_compiled(character, scenario, 'scenario')
+
+        return analyze_reachability(compiled['regions'], compiled['region_connections'], compiled['locations'] + compiled['enemies'])
+
+# how to compile each section of a bundle, by section name
+Data.compile_sections = { 'items': Data.compile_items, 'scenario': Data.compile_scenario, 'reachability': Data.compile_reachability }
@@ -0,0 +1,104 @@
+from typing import Iterable, Iterator
+
+from BaseClasses import Item, ItemClassification
+
+
+class ItemPool:
+    """
+    A player's item pool while create_items builds it. It keeps items in the order they were added, like the list it replaces,
+    but indexes every item's position by name and by classification, so counting, finding, and removing items doesn't rescan the pool.
+
+    Items with the same name are interchangeable, so remove() takes the first item with that name in pool order,
+    the same item that list.remove() would have taken.
+    """
+    def __init__(self, items: Iterable[Item] = ()):
+        self.items = {} # position: item, in pool order. positions only go up, so removing an item leaves the rest in order.
+        self.positions_by_name = {} # item name: { position: None }, in pool order
+        self.positions_by_classification = {} # classification: { position: None }, in pool order
+        self.next_position = 0
+
+        self.extend(items)
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    # iterates over a copy, so items can be removed / added while looping
+    def __iter__(self) -> Iterator[Item]:
+        return iter(list(self.items.values()))
+
+    def __contains__(self, item_name: str) -> bool:
+        return bool(self.positions_by_name.get(item_name))
+
+    def append(self, item: Item):
+        position = self.next_position
+        self.next_position += 1
+
+        self.items[position] = item
+        self.positions_by_name.setdefault(item.name, {})[position] = None
+        self.positions_by_classification.setdefault(item.classification, {})[position] = None
+
+    def extend(self, items: Iterable[Item]):
+        for item in items:
+            self.append(item)
+
+    def count(self, item_name: str) -> int:
+        return len(self.positions_by_name.get(item_name, ()))
+
+    # returns the first item in pool order with any of the names and / or the classification, or None if there isn't one
+    def first(self, item_names: Iterable[str] = (), classification: ItemClassification = None) -> Item | None:
+        position_sets = [self.positions_by_name.get(item_name) for item_name in item_names]
+
+        if classification is not None:
+            position_sets.append(self.positions_by_classification.get(classification))
+
+        first_positions = [next(iter(positions)) for positions in position_sets if positions]
+
+        return self.items[min(first_positions)] if first_positions else None
+
+    # removes (and returns) the first item with this name, or returns None if there isn't one
+    def remove(self, item_name: str) -> Item | None:
+        positions = self.positions_by_name.get(item_name)
+
+        if not positions:
+            return None
+
+        return self._remove_position(next(iter(positions)))
+
+    # removes every item with this name, and returns how many were removed
+    def remove_all(self, item_name: str) -> int:
+        positions = list(self.positions_by_name.get(item_name, ()))
+
+        for position in positions:
+            self._remove_position(position)
+
+        return len(positions)
+
+    # swaps every item with this name for the new items (one new item per removed item), keeping them in the same spots in the pool
+    def replace_in_place(self, item_name: str, new_items: list[Item]):
+        positions = list(self.positions_by_name.get(item_name, ()))
+        changed_indexes = set()
+
+        for position, new_item in zip(positions, new_items):
+            old_item = self.items[position]
+            del self.positions_by_name[old_item.name][position]
+            del self.positions_by_classification[old_item.classification][position]
+
+            self.items[position] = new_item # same key, so the new item keeps the old item's spot in the pool order
+            self.positions_by_name.setdefault(new_item.name, {})[position] = None
+            self.positions_by_classification.setdefault(new_item.classification, {})[position] = None
+            changed_indexes.update([('name', new_item.name), ('classification', new_item.classification)])
+
+        # the replaced spots can be earlier than items already indexed for the new item, so put those indexes back in pool order
+        for index_type, key in changed_indexes:
+            index = self.positions_by_name if index_type == 'name' else self.positions_by_classification
+            index[key] = dict.fromkeys(sorted(index[key]))
+
+    def to_list(self) -> list[Item]:
+        return list(self.items.values())
+
+    def _remove_position(self, position: int) -> Item:
+        item = self.items.pop(position)
+        del self.positions_by_name[item.name][position]
+        del self.positions_by_classification[item.classification][position]
+
+        return item
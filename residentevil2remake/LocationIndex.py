@@ -0,0 +1,143 @@
+from .LocationOverlay import LocationOverlay
+
+
+class LocationIndex:
+    """
+    Indexes a player's source locations (location key: location) by their original / forced item names and item types,
+    so the weapon randomizer can find the locations it needs without copying or scanning all of them.
+
+    Queries return locations in the same order as the source locations (one entry per key, like iterating over them would).
+    Each location is an editable view into the player's LocationOverlay, and is the same object for as long as the index is around.
+    Item changes have to go through set_item (and new keys through set_location), so the index stays in sync.
+    """
+    indexed_fields = ['original_item', 'force_item']
+
+    def __init__(self, locations: LocationOverlay, item_name_to_item: dict):
+        self.locations = locations
+        self.item_name_to_item = item_name_to_item
+        self.views = {} # base location key: editable view of the location, made the first time it's asked for
+        self.base_keys = {} # id(view): base location key
+        self.positions = {} # location key: position in the source locations
+        self.keys_by_location = {} # base location key: [location keys], since the same location can be under more than one key
+        self.keys_by_item = { field: {} for field in self.indexed_fields } # field: { item name: { location key: None } }
+        self.keys_by_type = { field: {} for field in self.indexed_fields } # field: { item type: { location key: None } }
+
+        for key in locations:
+            self._add_key(key, locations[key])
+
+    def get(self, key: str) -> dict:
+        base_key = self.locations.get_base_key(key)
+
+        if base_key not in self.views:
+            view = self.views[base_key] = self.locations.edit(base_key)
+            self.base_keys[id(view)] = base_key
+
+        return self.views[base_key]
+
+    def items(self):
+        return [(key, self.get(key)) for key in self.locations]
+
+    # all locations, in order, as a new list
+    def all(self) -> list:
+        return [self.get(key) for key in self.locations]
+
+    def having(self, field: str, item_name: str) -> list:
+        return self._in_order(self.keys_by_item[field].get(item_name, {}))
+
+    def count(self, field: str, item_name: str) -> int:
+        return len(self.keys_by_item[field].get(item_name, {}))
+
+    def having_type(self, field: str, item_type: str) -> list:
+        return self._in_order(self.keys_by_type[field].get(item_type, {}))
+
+    def keys_having_type(self, item_type: str) -> list:
+        keys = { **self.keys_by_type['original_item'].get(item_type, {}), **self.keys_by_type['force_item'].get(item_type, {}) }
+
+        return sorted(keys, key=self.positions.__getitem__)
+
+    def keys_having_any(self, item_names: list) -> list:
+        keys = {}
+
+        for field in self.indexed_fields:
+            for item_name in item_names:
+                keys.update(self.keys_by_item[field].get(item_name, {}))
+
+        return sorted(keys, key=self.positions.__getitem__)
+
+    def set_item(self, location: dict, field: str, item_name: str):
+        keys = self.keys_by_location[self.base_keys[id(location)]]
+
+        for key in keys:
+            self._unindex_field(key, location, field)
+
+        location[field] = item_name
+
+        for key in keys:
+            self._index_field(key, location, field)
+
+    # applies a whole batch of (location, item name) changes to one field, so a location that's listed more than once
+    #    ends up with the last item it was given, but is only re-indexed once (and not at all if its item didn't change)
+    def set_items(self, field: str, assignments):
+        last_assignments = {} # id(location): (location, item name)
+
+        for location, item_name in assignments:
+            last_assignments[id(location)] = (location, item_name)
+
+        for location, item_name in last_assignments.values():
+            if location.get(field) == item_name:
+                location[field] = item_name # still written, so the location is changed the same way as with set_item
+            else:
+                self.set_item(location, field, item_name)
+
+    # same as locations[key] = location, but keeps the index in sync
+    def set_location(self, key: str, location: dict):
+        if key in self.locations:
+            previous_location = self.get(key)
+
+            if previous_location is location:
+                return
+
+            self._remove_key(key, previous_location)
+
+        self.locations.set_alias(key, self.base_keys[id(location)])
+        self._add_key(key, location)
+
+    def _in_order(self, keys: dict) -> list:
+        return [self.get(key) for key in sorted(keys, key=self.positions.__getitem__)]
+
+    def _add_key(self, key: str, location: dict):
+        # a replaced key keeps its spot in the dict, so only new keys get a new position
+        if key not in self.positions:
+            self.positions[key] = len(self.positions)
+
+        self.keys_by_location.setdefault(self.locations.get_base_key(key), []).append(key)
+
+        for field in self.indexed_fields:
+            self._index_field(key, location, field)
+
+    def _remove_key(self, key: str, location: dict):
+        self.keys_by_location[self.locations.get_base_key(key)].remove(key)
+
+        for field in self.indexed_fields:
+            self._unindex_field(key, location, field)
+
+    def _index_field(self, key: str, location: dict, field: str):
+        item_name = location.get(field)
+
+        if item_name is None:
+            return
+
+        self.keys_by_item[field].setdefault(item_name, {})[key] = None
+        self.keys_by_type[field].setdefault(self._get_item_type(item_name), {})[key] = None
+
+    def _unindex_field(self, key: str, location: dict, field: str):
+        item_name = location.get(field)
+
+        if item_name is None:
+            return
+
+        del self.keys_by_item[field][item_name][key]
+        del self.keys_by_type[field][self._get_item_type(item_name)][key]
+
+    def _get_item_type(self, item_name: str) -> str:
+        return self.item_name_to_item.get(item_name, {}).get('type')
@@ -0,0 +1,102 @@
+from collections.abc import Mapping, MutableMapping
+
+
+class LocationView(MutableMapping):
+    """
+    A location as one player sees it: the fields that were changed for that player, over the shared location record.
+    Reads check the changed fields first, and writes (location['force_item'] = ...) only ever go into the changed fields.
+    """
+    __slots__ = ('changes', 'record')
+
+    def __init__(self, changes: dict, record: Mapping):
+        self.changes = changes
+        self.record = record
+
+    def __getitem__(self, field):
+        if field in self.changes:
+            return self.changes[field]
+
+        return self.record[field]
+
+    def get(self, field, default=None):
+        if field in self.changes:
+            return self.changes[field]
+
+        return self.record.get(field, default)
+
+    def __contains__(self, field):
+        return field in self.changes or field in self.record
+
+    def __setitem__(self, field, value):
+        self.changes[field] = value
+
+    def __delitem__(self, field):
+        raise TypeError("Can't remove fields from a location, only change them.")
+
+    def __iter__(self):
+        yield from self.record
+
+        for field in self.changes:
+            if field not in self.record:
+                yield field
+
+    def __len__(self):
+        return len(self.record) + len([field for field in self.changes if field not in self.record])
+
+    def __repr__(self):
+        return "{}({})".format(self.__class__.__name__, dict(self))
+
+
+class LocationOverlay(Mapping):
+    """
+    A player's source locations (location key: location), as a copy-on-write overlay over the scenario's location records.
+
+    Every player on the same scenario reads the same shared, read-only records, and each player only stores the fields that were
+    changed for them (by the weapon randomizer, enemy kill drops, etc.), so an extra player costs about as much as its swaps do.
+    Reading a location gives its shared record if nothing changed, or a LocationView of the changes over the record if something did.
+
+    Changes have to go through set_field or a view from edit, and keys added (or replaced) after the base through set_alias.
+    """
+    def __init__(self, base: dict):
+        self.base = base # location key: shared location record
+        self.changes = {} # base location key: { field: changed value }
+        self.aliases = {} # location key: base location key, for keys that were added / replaced since the base
+
+    def __getitem__(self, key: str):
+        base_key = self.get_base_key(key)
+        changes = self.changes.get(base_key)
+
+        return LocationView(changes, self.base[base_key]) if changes else self.base[base_key]
+
+    def __iter__(self):
+        yield from self.base
+
+        for key in self.aliases:
+            if key not in self.base:
+                yield key
+
+    def __len__(self):
+        return len(self.base) + len([key for key in self.aliases if key not in self.base])
+
+    def __contains__(self, key):
+        return key in self.base or key in self.aliases
+
+    def get_base_key(self, key: str) -> str:
+        return self.aliases.get(key, key)
+
+    # a view of the location that writes any changes made to it into the overlay
+    def edit(self, key: str) -> LocationView:
+        base_key = self.get_base_key(key)
+
+        return LocationView(self.changes.setdefault(base_key, {}), self.base[base_key])
+
+    def set_field(self, key: str, field: str, value):
+        self.changes.setdefault(self.get_base_key(key), {})[field] = value
+
+    # same as locations[key] = locations[other_key], so both keys are the same location from here on
+    def set_alias(self, key: str, other_key: str):
+        self.aliases[key] = self.get_base_key(other_key)
+
+    # views from edit that were never changed leave empty changes behind, so drop those once editing is done
+    def compact(self):
+        self.changes = { key: changes for key, changes in self.changes.items() if changes }
@@ -1,5 +1,5 @@
-from dataclasses import dataclass
-from Options import (Choice, OptionList, NamedRange, 
+from dataclasses import dataclass, fields
+from Options import (Choice, OptionList, NamedRange, Range, Toggle, 
     StartInventoryPool,
     PerGameCommonOptions, DeathLinkMixin)
 
@@ -421,3 +421,61 @@ class RE2ROptions(StartInventoryFromPoolMixin, DeathLinkMixin, PerGameCommonOpti
     add_poison_traps: AddPoisonTraps
     poison_trap_count: PoisonTrapCount
 
+# the options above, resolved once per player to plain values, so generation doesn't decode the option objects every time it checks one
+class RE2RResolvedOptions:
+    """A snapshot of a player's RE2ROptions as plain values, taken in generate_early.
+
+    True/False choices (and toggles like death_link) are bools, e.g., double_weapons == True.
+    Every other choice is its option key, e.g., cross_scenario_weapons == "all_ammo", difficulty == "hardcore".
+    Ranges are ints, and list / set / dict options are their values."""
+    character: str
+    scenario: str
+    difficulty: str
+    unlocked_typewriters: list
+    starting_weapon: str
+    starting_hip_pouches: int
+    starting_ink_ribbons: int
+    bonus_start: bool
+    extra_clock_tower_items: bool
+    extra_medallions: bool
+    early_medallions: bool
+    allow_progression_in_labs: bool
+    add_enemy_kills_as_locations: str
+    enemy_kill_items: str
+    cross_scenario_weapons: str
+    ammo_pack_modifier: str
+    local_weapons: bool
+    double_weapons: bool
+    oops_all_rockets: bool
+    oops_all_miniguns: bool
+    oops_all_grenades: bool
+    oops_all_knives: bool
+    no_first_aid_spray: bool
+    no_green_herb: bool
+    no_red_herb: bool
+    no_gunpowder: bool
+    add_damage_traps: bool
+    damage_trap_count: int
+    damage_traps_can_kill: bool
+    add_poison_traps: bool
+    poison_trap_count: int
+    death_link: bool
+
+    def __init__(self, options: RE2ROptions):
+        for option_field in fields(options):
+            setattr(self, option_field.name, RE2RResolvedOptions.resolve(getattr(options, option_field.name)))
+
+    def resolve(option):
+        if isinstance(option, Toggle):
+            return bool(option.value)
+
+        if isinstance(option, Choice):
+            if set(option.options.keys()) == {"false", "true"}:
+                return bool(option.value)
+
+            return option.current_key
+
+        if isinstance(option, Range):
+            return int(option.value)
+
+        return option.value
@@ -0,0 +1,87 @@
+import os
+import random
+
+from .Data import Data
+from .LocationOverlay import LocationOverlay
+from .Profiling import get_profiler
+
+# set the RE2R_PREPARE_WORKERS environment variable to a number of processes before generating to prepare RE2R players
+#    (enemy kill drops, weapon randomizer, etc.) in that many worker processes at once, instead of one after another.
+#    checked once at import, like RE2R_PROFILE. it's only worth it with lots of RE2R players, since starting the workers isn't free.
+preparation_workers = int(os.environ.get('RE2R_PREPARE_WORKERS', '0') or '0')
+
+
+class PreparedState:
+    """
+    Everything prepare_scenario_state changed for one player, in a form that can be sent back from a worker process and applied to
+    the player's world in the main process: their source location changes, weapon randomizer results, location item tally,
+    and the state of their random afterwards, so the rest of generation picks up exactly where the worker left off.
+
+    Since the worker starts from the world's own random state, a player gets the same result as they would without the workers.
+    """
+    def __init__(self, world):
+        self.changes = world.source_locations.changes
+        self.aliases = world.source_locations.aliases
+        self.starting_weapon = world.starting_weapon
+        self.replacement_weapons = world.replacement_weapons
+        self.replacement_ammo = world.replacement_ammo
+        self.location_item_counts = world.location_item_counts
+        self.random_state = world.random.getstate()
+        self.profiler = world.profiler
+
+    def apply(self, world):
+        world.source_locations.changes = self.changes
+        world.source_locations.aliases = self.aliases
+        world.starting_weapon = self.starting_weapon
+        world.replacement_weapons = self.replacement_weapons
+        world.replacement_ammo = self.replacement_ammo
+        world.location_item_counts = self.location_item_counts
+        world.random.setstate(self.random_state)
+
+        # if profiling is on, the worker's timings go in with the rest of the world's
+        if self.profiler is not None:
+            get_profiler(world).merge(self.profiler)
+
+        world.preparation_pending = False
+
+
+# runs in a worker process, on a bare copy of the world that only has what prepare_scenario_state reads (no multiworld)
+def prepare_player(world_type, player: int, resolved_options, random_state: tuple) -> PreparedState:
+    world = world_type.__new__(world_type)
+    world.player = player
+    world.resolved_options = resolved_options
+    world.random = random.Random()
+    world.random.setstate(random_state)
+    world.profiler = None
+
+    character, scenario = world._get_character(), world._get_scenario()
+
+    # with forked workers the scenario is usually already loaded, but with spawned workers each worker loads it once
+    Data.load_data(character, scenario)
+
+    world.source_locations = LocationOverlay(world._get_locations_for_scenario(character, scenario))
+    world.prepare_scenario_state()
+
+    return PreparedState(world)
+
+# prepares each of the worlds in the worker processes, then applies the results to the worlds in the same order as they were passed in
+def prepare_in_workers(worlds: list, workers: int):
+    # not worth starting workers for a single player
+    if len(worlds) == 1 or workers <= 1:
+        for world in worlds:
+            world.prepare_scenario_state()
+            world.preparation_pending = False
+
+        return
+
+    # only imported here, since it's slow to import and most generations never use it
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=min(workers, len(worlds))) as executor:
+        futures = [
+            executor.submit(prepare_player, type(world), world.player, world.resolved_options, world.random.getstate())
+                for world in worlds
+        ]
+
+        for world, future in zip(worlds, futures):
+            future.result().apply(world)
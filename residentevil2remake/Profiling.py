@@ -0,0 +1,109 @@
+import functools
+import json
+import os
+import time
+from typing import Callable, TextIO
+
+# set the RE2R_PROFILE environment variable (to anything but 0) before generating to turn profiling on.
+#    this is checked once at import, so the decorated methods run as-is when it's off.
+profiling_enabled = os.environ.get('RE2R_PROFILE', '0') not in ['', '0']
+
+
+class Profiler:
+    """
+    Collects timings and counters for one player's world during generation.
+    The breakdown is written to the end of the spoiler log and to a JSON file next to the other output files.
+    """
+    def __init__(self):
+        self.timings = {} # step name: [total seconds, calls], in the order the steps first ran
+        self.counts = {} # counter name: count
+        self.output_file = None
+
+    # called when a step starts, so steps are listed in the order they started (outer steps before the steps inside them)
+    def start_step(self, step_name: str):
+        if step_name not in self.timings:
+            self.timings[step_name] = [0.0, 0]
+
+    def add_time(self, step_name: str, seconds: float):
+        self.start_step(step_name)
+        self.timings[step_name][0] += seconds
+        self.timings[step_name][1] += 1
+
+    def count(self, counter_name: str, amount: int = 1):
+        self.counts[counter_name] = self.counts.get(counter_name, 0) + amount
+
+    # wraps a rule function so every call to it is counted under counter_name
+    def counted(self, counter_name: str, rule: Callable) -> Callable:
+        self.counts.setdefault(counter_name, 0)
+
+        def counted_rule(*args):
+            self.counts[counter_name] += 1
+            return rule(*args)
+
+        return counted_rule
+
+    # adds another profiler's timings and counts to this one's, like from a worker process (see Preparation.py)
+    def merge(self, other: 'Profiler'):
+        for step_name, (seconds, calls) in other.timings.items():
+            self.start_step(step_name)
+            self.timings[step_name][0] += seconds
+            self.timings[step_name][1] += calls
+
+        for counter_name, count in other.counts.items():
+            self.count(counter_name, count)
+
+    def to_dict(self) -> dict:
+        return {
+            'timings': {
+                step_name: { 'ms': round(seconds * 1000, 3), 'calls': calls }
+                    for step_name, (seconds, calls) in self.timings.items()
+            },
+            'counts': dict(self.counts)
+        }
+
+    def write_report(self, spoiler_handle: TextIO, player_name: str):
+        spoiler_handle.write(f"\n\nGeneration Profile ({player_name}):\n")
+
+        for step_name, (seconds, calls) in self.timings.items():
+            spoiler_handle.write(f"\n{step_name.ljust(50, ' ')} {'{:.2f} ms'.format(seconds * 1000).rjust(12, ' ')} ({calls}x)")
+
+        for counter_name, count in self.counts.items():
+            spoiler_handle.write(f"\n{counter_name.ljust(50, ' ')} {str(count).rjust(12, ' ')}")
+
+        spoiler_handle.write("\n")
+
+    def write_json(self):
+        if not self.output_file:
+            return
+
+        with open(self.output_file, 'w') as profile_file:
+            json.dump(self.to_dict(), profile_file, indent=2)
+
+
+# gets the world's profiler, creating it on first use. only called while profiling is on.
+def get_profiler(world) -> Profiler:
+    if world.profiler is None:
+        world.profiler = Profiler()
+
+    return world.profiler
+
+# times a world method (or a WeaponRandomizer method, through its world) as step_name, if profiling is on
+def profiled(step_name: str) -> Callable:
+    def decorator(method: Callable) -> Callable:
+        if not profiling_enabled:
+            return method
+
+        @functools.wraps(method)
+        def timed_method(self, *args, **kwargs):
+            profiler = get_profiler(getattr(self, 'world', self))
+            profiler.start_step(step_name)
+            start = time.perf_counter()
+
+            try:
+                return method(self, *args, **kwargs)
+            finally:
+                profiler.add_time(step_name, time.perf_counter() - start)
+
+        return timed_method
+
+    return decorator
@@ -0,0 +1,122 @@
+from .ScenarioGraph import ScenarioGraph
+
+# Works out which items are needed on every path to each region / location of a scenario (the "dominator" items),
+#    from the region connections and location conditions alone. This is run offline when a scenario is compiled (see Data.py),
+#    and generation loads the result as a table instead of working it out again.
+#
+# Requirements are stored as { item name: count }, since some conditions need more than one of the same item.
+
+
+# the items a condition needs no matter which of its sets of items is used (same shape that compile_item_rule takes)
+def get_required_items(item_names: list) -> dict:
+    if len(item_names) == 0:
+        return {}
+
+    if type(item_names[0]) is not list:
+        item_names = [item_names]
+
+    requirement_sets = [count_items(set_of_requirements) for set_of_requirements in item_names]
+    required = requirement_sets[0]
+
+    for requirements in requirement_sets[1:]:
+        required = intersect_requirements(required, requirements)
+
+    return required
+
+def count_items(set_of_requirements: list) -> dict:
+    item_counts = {}
+
+    for item_name in set_of_requirements:
+        item_counts[item_name] = item_counts.get(item_name, 0) + 1
+
+    return item_counts
+
+def combine_requirements(first: dict, second: dict) -> dict:
+    combined = dict(first)
+
+    for item_name, count in second.items():
+        combined[item_name] = max(combined.get(item_name, 0), count)
+
+    return combined
+
+def intersect_requirements(first: dict, second: dict) -> dict:
+    return { item_name: min(count, second[item_name]) for item_name, count in first.items() if item_name in second }
+
+def is_covered_by(requirements: dict, covering: dict) -> bool:
+    return all(covering.get(item_name, 0) >= count for item_name, count in requirements.items())
+
+def get_condition_items(location) -> list | None:
+    if "condition" in location and "items" in location["condition"]:
+        return location["condition"].get("items", [])
+
+    return None
+
+def analyze_reachability(regions: list, connections: list, locations: list) -> dict:
+    """
+    Returns a table with:
+      - regions: { region name: ((item name, count), ...) } for every region that can be reached from Menu
+      - locations: { location id: ((item name, count), ...) } for every location in a region that can be reached
+      - unreachable: [location ids] in regions that can't be reached from Menu at all
+      - redundant_rules: { location ids } whose condition is always met once their region is reached, so it doesn't need a rule
+    """
+    graph = ScenarioGraph({}, regions, connections, None) # only the regions / connections are needed, which is the same graph create_regions uses
+    edges_from = [[] for _ in graph.region_names]
+
+    for region_from, region_to, items in zip(graph.connection_from, graph.connection_to, graph.connection_items):
+        edges_from[region_from].append((region_to, get_required_items(items) if items is not None else {}))
+
+    # every region starts out unreached (None). a region's requirements are what every way into it needs, so each new way into it
+    #    can only take requirements away. keep re-checking regions whose requirements changed until nothing does.
+    menu = graph.region_names.index('Menu')
+    required_by_region = [None for _ in graph.region_names]
+    required_by_region[menu] = {}
+    changed = [menu]
+
+    while len(changed) > 0:
+        region_from = changed.pop()
+
+        for region_to, edge_requirements in edges_from[region_from]:
+            requirements = combine_requirements(required_by_region[region_from], edge_requirements)
+
+            if required_by_region[region_to] is not None:
+                requirements = intersect_requirements(required_by_region[region_to], requirements)
+
+                if requirements == required_by_region[region_to]:
+                    continue
+
+            required_by_region[region_to] = requirements
+            changed.append(region_to)
+
+    region_requirements = {
+        region_name: requirements for region_name, requirements in zip(graph.region_names, required_by_region) if requirements is not None
+    }
+    location_requirements = {}
+    unreachable = []
+    redundant_rules = set()
+
+    for location in locations:
+        if location['region'] not in region_requirements:
+            unreachable.append(location['id'])
+
+            continue
+
+        requirements = region_requirements[location['region']]
+        condition_items = get_condition_items(location)
+
+        if condition_items is not None:
+            # if any set of items in the condition is already needed to get to the region, then the condition is always met there
+            sets_of_requirements = condition_items if len(condition_items) > 0 and type(condition_items[0]) is list else [condition_items]
+
+            if any(is_covered_by(count_items(set_of_requirements), requirements) for set_of_requirements in sets_of_requirements):
+                redundant_rules.add(location['id'])
+
+            requirements = combine_requirements(requirements, get_required_items(condition_items))
+
+        location_requirements[location['id']] = tuple(sorted(requirements.items()))
+
+    return {
+        'regions': { region_name: tuple(sorted(requirements.items())) for region_name, requirements in region_requirements.items() },
+        'locations': location_requirements,
+        'unreachable': unreachable,
+        'redundant_rules': redundant_rules
+    }
@@ -0,0 +1,113 @@
+import sys
+from collections.abc import Mapping
+
+
+# lists of strings (like forbid_item) and empty conditions are repeated across hundreds of locations, 
+#    so share one copy of each. nothing modifies these after loading, so sharing them is safe.
+shared_lists = {}
+shared_empty_dict = {}
+
+def intern_value(value):
+    if isinstance(value, str):
+        return sys.intern(value)
+
+    if isinstance(value, list) and all(isinstance(v, str) for v in value):
+        key = tuple(value)
+
+        if key not in shared_lists:
+            shared_lists[key] = [sys.intern(v) for v in value]
+
+        return shared_lists[key]
+
+    if isinstance(value, list):
+        return [intern_value(v) for v in value]
+
+    if isinstance(value, dict):
+        if not value:
+            return shared_empty_dict
+
+        return { sys.intern(k): intern_value(v) for k, v in value.items() }
+
+    return value
+
+
+class Record(Mapping):
+    """
+    A read-only, dict-compatible record for the scenario tables, so code that reads locations / regions /
+    connections as dicts (loc['region'], loc.get('force_item'), 'remove' in loc, {**loc}) keeps working.
+
+    Each known field is a slot, and fields that weren't in the source data are left unset, so they act like
+    missing dict keys. Any field that isn't known yet goes in "extra", so new json fields don't get dropped.
+    """
+    __slots__ = ('extra',)
+    fields = ()
+    field_set = frozenset()
+
+    def __init__(self, data: dict):
+        extra = {}
+
+        for key, value in data.items():
+            if key in self.field_set:
+                setattr(self, key, intern_value(value))
+            else:
+                extra[sys.intern(key)] = intern_value(value)
+
+        self.extra = extra or None
+
+    def __getitem__(self, key):
+        try:
+            return getattr(self, key) if key in self.field_set else self.extra[key]
+        except (AttributeError, TypeError):
+            raise KeyError(key)
+
+    def __iter__(self):
+        for field in self.fields:
+            if hasattr(self, field):
+                yield field
+
+        if self.extra:
+            yield from self.extra
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __contains__(self, key):
+        if key in self.field_set:
+            return hasattr(self, key)
+
+        return bool(self.extra) and key in self.extra
+
+    def get(self, key, default=None):
+        if key in self.field_set:
+            return getattr(self, key, default)
+
+        return self.extra.get(key, default) if self.extra else default
+
+    def __repr__(self):
+        return "{}({})".format(self.__class__.__name__, dict(self))
+
+    # pickle (for the compiled bundles) as a plain dict, so loading a bundle interns the strings again
+    def __reduce__(self):
+        return (self.__class__, (dict(self),))
+
+
+class LocationRecord(Record):
+    fields = (
+        'name', 'region', 'original_item', 'condition', 'item_object', 'parent_object', 'folder_path',
+        'forbid_item', 'randomized', 'force_item', 'victory', 'remove', 'id', 'character', 'scenario', 'difficulty',
+        'type', 'excluded', 'conditions' # only enemies have these
+    )
+    field_set = frozenset(fields)
+    __slots__ = fields
+
+
+class RegionRecord(Record):
+    fields = ('name', 'zone_id', 'character', 'scenario')
+    field_set = frozenset(fields)
+    __slots__ = fields
+
+
+class RegionConnectionRecord(Record):
+    fields = ('from', 'to', 'condition', 'limitation', 'character', 'scenario')
+    field_set = frozenset(fields)
+    __slots__ = fields
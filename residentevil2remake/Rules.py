@@ -0,0 +1,88 @@
+from typing import Callable
+
+from BaseClasses import CollectionState, MultiWorld
+from worlds.AutoWorld import LogicMixin
+
+
+class RE2RLogic(LogicMixin):
+    """
+    Each RE2R progression item gets a bit (see item_name_to_bit in the world class), and the world's collect / remove keep a mask
+    of the ones that a state has, for each RE2R player. That way, a rule can check all of its items with one int comparison.
+
+    The masks are kept next to the state's items instead of in prog_items, so anything that reads or counts the items doesn't see them,
+    and are copied along with the state.
+    """
+    re2r_progression_masks: dict # player: mask of the progression items that the state has
+
+    def init_mixin(self, parent: MultiWorld):
+        self.re2r_progression_masks = {}
+
+    def copy_mixin(self, new_state: CollectionState) -> CollectionState:
+        new_state.re2r_progression_masks = self.re2r_progression_masks.copy()
+
+        return new_state
+
+
+def always_true(state: CollectionState) -> bool:
+    return True
+
+# Turns the item requirements from a location / connection "condition" into a rule function once, up front,
+#    so the fill and sweeps don't re-interpret the requirements every time the rule is checked.
+#    The requirements are either a single set of items (["Spade Key", "Club Key"]) or a list of sets where any set works.
+#    Items that have a bit in item_bits are checked against the state's progression mask, and any others with state.has.
+def compile_item_rule(item_names: list, player: int, item_bits: dict) -> Callable[[CollectionState], bool]:
+    # if there are no item requirements, this location is open
+    if len(item_names) == 0:
+        return always_true
+
+    # if the requirements are a single set of items, make it a list of a single set of items (same as multiple sets)
+    if type(item_names[0]) is not list:
+        item_names = [item_names]
+
+    rules = [compile_requirement_set(set_of_requirements, player, item_bits) for set_of_requirements in item_names]
+
+    if len(rules) == 1:
+        return rules[0]
+
+    if always_true in rules:
+        return always_true
+
+    rules = tuple(rules)
+
+    return lambda state: any(rule(state) for rule in rules)
+
+def compile_requirement_set(set_of_requirements: list, player: int, item_bits: dict) -> Callable[[CollectionState], bool]:
+    if len(set_of_requirements) == 0:
+        return always_true
+
+    # group the items up once, so duplicates become counts (e.g., { Spare Key: 2 })
+    item_counts = {}
+
+    for item_name in set_of_requirements:
+        item_counts[item_name] = item_counts.get(item_name, 0) + 1
+
+    # any item that's only needed once and has a bit goes in the mask, and the rest need a state.has with a count
+    mask = 0
+    other_item_counts = []
+
+    for item_name, count in item_counts.items():
+        if count == 1 and item_name in item_bits:
+            mask |= item_bits[item_name]
+        else:
+            other_item_counts.append((item_name, count))
+
+    other_item_counts = tuple(other_item_counts)
+
+    if len(other_item_counts) == 0:
+        return lambda state: (state.re2r_progression_masks.get(player, 0) & mask) == mask
+
+    if mask == 0:
+        if len(other_item_counts) == 1:
+            item_name, count = other_item_counts[0]
+
+            return lambda state: state.has(item_name, player, count)
+
+        return lambda state: all(state.has(item_name, player, count) for item_name, count in other_item_counts)
+
+    return lambda state: (state.re2r_progression_masks.get(player, 0) & mask) == mask and \
+        all(state.has(item_name, player, count) for item_name, count in other_item_counts)
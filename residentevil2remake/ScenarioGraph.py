@@ -0,0 +1,68 @@
+class ScenarioGraph:
+    """
+    The regions, connections, and location slots for one scenario (and difficulty / enemy kills combo), worked out once and shared
+    by every player on that scenario, so create_regions only has to loop over it instead of re-deriving it from Data for each player.
+
+    Everything is stored in flat tuples, indexed by region / location / connection number:
+      - regions: region_names, region_zone_ids, and region_location_starts (region N's locations are slots starts[N] to starts[N + 1])
+      - location slots: location_keys (to look up the player's source location), location_names (the AP location name), location_ids
+      - connections: connection_from / connection_to (region numbers), and connection_items (the items in the condition, or None)
+
+    One-sided doors are already left out of the connections, and any Menu region name is already just "Menu".
+    """
+    def __init__(self, locations: dict, regions: list, connections: list, get_location_name):
+        self.region_names = tuple(region['name'] for region in regions)
+        self.region_zone_ids = tuple(region['zone_id'] for region in regions)
+
+        # group the location slots by region, keeping the locations in the same order as the source locations
+        slots_by_region = { region_name: [] for region_name in self.region_names }
+
+        for key, location in locations.items():
+            if location['region'] in slots_by_region:
+                slots_by_region[location['region']].append((key, get_location_name(location['region'], location['name']), location['id']))
+
+        slots = [slot for region_name in self.region_names for slot in slots_by_region[region_name]]
+        starts = [0]
+
+        for region_name in self.region_names:
+            starts.append(starts[-1] + len(slots_by_region[region_name]))
+
+        self.region_location_starts = tuple(starts)
+        self.location_keys = tuple(slot[0] for slot in slots)
+        self.location_names = tuple(slot[1] for slot in slots)
+        self.location_ids = tuple(slot[2] for slot in slots)
+
+        region_numbers = { region_name: number for number, region_name in enumerate(self.region_names) }
+        connection_from = []
+        connection_to = []
+        connection_items = []
+
+        for connect in connections:
+            # skip connecting on a one-sided connection because this should not be reachable backwards (and should be reachable otherwise)
+            if 'limitation' in connect and connect['limitation'] in ['ONE_SIDED_DOOR']:
+                continue
+
+            from_name = connect['from'] if 'Menu' not in connect['from'] else 'Menu'
+            to_name = connect['to'] if 'Menu' not in connect['to'] else 'Menu'
+
+            connection_from.append(region_numbers[from_name])
+            connection_to.append(region_numbers[to_name])
+
+            if "condition" in connect and "items" in connect["condition"]:
+                connection_items.append(connect["condition"].get("items", []))
+            else:
+                connection_items.append(None)
+
+        self.connection_from = tuple(connection_from)
+        self.connection_to = tuple(connection_to)
+        self.connection_items = tuple(connection_items)
+
+
+# (character, scenario, hardcore, enemy kills): ScenarioGraph, built the first time a player on that scenario needs it
+scenario_graphs = {}
+
+def get_scenario_graph(key: tuple, locations: dict, regions: list, connections: list, get_location_name) -> ScenarioGraph:
+    if key not in scenario_graphs:
+        scenario_graphs[key] = ScenarioGraph(locations, regions, connections, get_location_name)
+
+    return scenario_graphs[key]
@@ -0,0 +1,79 @@
+import json
+import os
+
+# set the RE2R_SPOILER_JSON environment variable (to anything but 0) before generating to also write each player's swaps to
+#    the spoiler log as a JSON block, for tools that read spoilers. checked once at import, like RE2R_PROFILE.
+spoiler_json_enabled = os.environ.get('RE2R_SPOILER_JSON', '0') not in ['', '0']
+
+
+class WeaponSpoiler:
+    """
+    One player's starting weapon and weapon / ammo swaps, gathered once as plain data, then formatted into a single string
+    for the spoiler log (plus the same data as a JSON block, if that's turned on).
+
+    Swaps are lists of { 'from': name, 'to': [names] } for weapons, and { 'from': name, 'to': [{ 'name': name, 'count': count }] }
+    for ammo, where count is how many of the player's locations have that ammo. Both are None if weapons weren't randomized.
+    """
+    def __init__(self, player_name: str, starting_weapon: str, weapon_swaps: list | None = None, ammo_swaps: list | None = None):
+        self.player_name = player_name
+        self.starting_weapon = starting_weapon
+        self.weapon_swaps = weapon_swaps
+        self.ammo_swaps = ammo_swaps
+
+    def from_replacements(player_name: str, starting_weapon: str, replacement_weapons: dict, replacement_ammo: dict, item_counts: dict):
+        weapon_swaps = []
+        ammo_swaps = []
+
+        for from_weapon, to_weapon in replacement_weapons.items():
+            # if the from weapon is a placeholder string of underscores, all of these were added (no "old" weapon)
+            if len(from_weapon) > 0 and from_weapon.strip('_') == '':
+                from_weapon = '(Added)'
+
+            weapon_swaps.append({ 'from': from_weapon, 'to': list(to_weapon) if isinstance(to_weapon, list) else [to_weapon] })
+
+        for from_ammo, to_ammo in replacement_ammo.items():
+            ammo_swaps.append({
+                'from': from_ammo,
+                'to': [{ 'name': ammo, 'count': item_counts.get(ammo, 0) } for ammo in dict.fromkeys(to_ammo)]
+            })
+
+        return WeaponSpoiler(player_name, starting_weapon, weapon_swaps, ammo_swaps)
+
+    def to_dict(self) -> dict:
+        return {
+            'player': self.player_name,
+            'starting_weapon': self.starting_weapon,
+            'weapon_swaps': self.weapon_swaps,
+            'ammo_swaps': self.ammo_swaps
+        }
+
+    def format(self) -> str:
+        lines = []
+
+        if self.weapon_swaps is None:
+            lines.append(f"\n\nStarting Weapon ({self.player_name}): {self.starting_weapon}\n")
+        else:
+            lines.append(f"\n\nWeapon Swaps ({self.player_name}):\n")
+            lines.append(self.format_swap('(Starting Weapon)', [self.starting_weapon]))
+            lines.extend(self.format_swap(swap['from'], swap['to']) for swap in self.weapon_swaps)
+
+            lines.append(f"\n\nAmmo Swaps ({self.player_name}):\n")
+            lines.extend(
+                self.format_swap(swap['from'], ["{} ({})".format(ammo['name'], ammo['count']) for ammo in swap['to']])
+                    for swap in self.ammo_swaps
+            )
+            lines.append("\n\n(Ammo totals are for the whole campaign, not per swap/category.)")
+
+        if spoiler_json_enabled:
+            lines.append(f"\n\nWeapon Swaps JSON ({self.player_name}):\n")
+            lines.append(json.dumps(self.to_dict(), indent=2))
+            lines.append("\n")
+
+        return ''.join(lines)
+
+    # the first new item goes next to the old one, and any others go under it
+    def format_swap(self, from_name: str, to_names: list) -> str:
+        if len(to_names) == 0:
+            return f"\n{from_name.ljust(30, ' ')} -> :("
+
+        return ''.join(f"\n{(from_name if number == 0 else '').ljust(30, ' ')} -> {to_name}" for number, to_name in enumerate(to_names))
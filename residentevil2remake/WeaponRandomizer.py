@@ -2,6 +2,8 @@ import math
 from typing import Optional
 
 from .Exceptions import RE2ROptionError
+from .LocationIndex import LocationIndex
+from .Profiling import profiled
 
 class WeaponRandomizer():
     def __init__(self, world, character, scenario):
@@ -19,13 +21,15 @@ class WeaponRandomizer():
         # ammo == None only applies for endgame items, which we want to avoid randomizing into the location of normal weapons
         self.all_weapons = [item for item in world.item_name_to_item.values() if item.get('type') == 'Weapon' and item.get('ammo', None) != None]
         self.starting_ammo_name = 'Handgun Ammo'
-        self.world.replacement_weapons[self.world.player] = {}
-        self.world.replacement_ammo[self.world.player] = {}
-        self.swap_queue = {}
+        self.world.replacement_weapons = {}
+        self.world.replacement_ammo = {}
+        self.swap_queue = {} # (item type, old item name): [new item names], in the order they were queued
+        self.locations = LocationIndex(self.world.source_locations, self.world.item_name_to_item)
 
     ###
     # CrossScenarioWeapons == "Starting"
     ###
+    @profiled('WeaponRandomizer.starting')
     def starting(self):
         self.mode = "starting"
         random_weapon = self._determine_starting_weapon()
@@ -36,6 +40,7 @@ class WeaponRandomizer():
     ###
     # CrossScenarioWeapons == "Match"
     ###
+    @profiled('WeaponRandomizer.match')
     def match(self):
         self.mode = "match"
         random_weapon = self._determine_starting_weapon('light') # match starting weapon level too
@@ -59,6 +64,7 @@ class WeaponRandomizer():
     ###
     # CrossScenarioWeapons == "Full"
     ###
+    @profiled('WeaponRandomizer.full')
     def full(self, include_ammo: Optional[bool] = True):
         self.mode = self.mode or "full"
         random_weapon = self._determine_starting_weapon()
@@ -85,6 +91,7 @@ class WeaponRandomizer():
     ###
     # CrossScenarioWeapons == "All"
     ###
+    @profiled('WeaponRandomizer.all')
     def all(self, include_ammo: Optional[bool] = True):
         self.mode = self.mode or "all"
         self._determine_starting_weapon()
@@ -111,11 +118,9 @@ class WeaponRandomizer():
 
             matched = self.random.choice(all_weapons)
 
-            loc['original_item'] = matched['name']
-            loc_key = self._get_location_key(loc['region'], loc['name'])
-            self.world.source_locations[self.world.player][loc_key] = loc
+            self.locations.set_item(loc, 'original_item', matched['name'])
 
-            self.world.replacement_weapons[self.world.player]["_" * str_repeat_count] = matched['name']
+            self.world.replacement_weapons["_" * str_repeat_count] = matched['name']
             str_repeat_count += 1
 
             # remove anything that was placed so it's not placed again
@@ -127,6 +132,7 @@ class WeaponRandomizer():
     ###
     # CrossScenarioWeapons == "Full Ammo"
     ###    
+    @profiled('WeaponRandomizer.full_ammo')
     def full_ammo(self):
         self.mode = "full_ammo"
         self.full(include_ammo=False)
@@ -135,12 +141,14 @@ class WeaponRandomizer():
     ###
     # CrossScenarioWeapons == "All Ammo"
     ###
+    @profiled('WeaponRandomizer.all_ammo')
     def all_ammo(self):
         self.mode = self.mode or "all_ammo"
         self.all(include_ammo=False)
         self._split_ammo_randomly()
 
     # Since Troll also calls All Ammo, we need to set the correct mode before calling it
+    @profiled('WeaponRandomizer.all_ammo_troll')
     def all_ammo_troll(self):
         self.mode = "troll"
         self.all_ammo()
@@ -148,12 +156,13 @@ class WeaponRandomizer():
     ###
     # CrossScenarioWeapons == "Troll"
     ###
+    @profiled('WeaponRandomizer.troll')
     def troll(self, weapon_count=2):
         # self.all_ammo() is called during processing of options, and self.troll() is specifically called after upgrades, gunpowder, etc.
 
         self.mode = self.mode or "troll"
-        weapons = [w for w in self._get_weapons_from_locations() if w['name'] != self.world.starting_weapon[self.world.player]]
-        only_weapons = [self.world.item_name_to_item.get(self.world.starting_weapon[self.world.player])]
+        weapons = [w for w in self._get_weapons_from_locations() if w['name'] != self.world.starting_weapon]
+        only_weapons = [self.world.item_name_to_item.get(self.world.starting_weapon)]
 
         for _ in range(weapon_count):
             random_weapon = self.random.choice(weapons)
@@ -164,27 +173,24 @@ class WeaponRandomizer():
 
         for loc in self._get_weapon_locations():
             if loc.get('force_item', None) is not None and loc.get('force_item') not in only_weapons_names:
-                loc['force_item'] = 'Wooden Boards'
-                loc_key = self._get_location_key(loc['region'], loc['name'])
-                self.world.source_locations[self.world.player][loc_key] = loc
+                self.locations.set_item(loc, 'force_item', 'Wooden Boards')
                 continue
 
             if loc.get('original_item', None) is not None and loc.get('original_item') not in only_weapons_names:
-                loc['original_item'] = 'Wooden Boards'
-                loc_key = self._get_location_key(loc['region'], loc['name'])
-                self.world.source_locations[self.world.player][loc_key] = loc
+                self.locations.set_item(loc, 'original_item', 'Wooden Boards')
                 continue
 
-        self.world.replacement_weapons[self.world.player] = {
+        self.world.replacement_weapons = {
             "Other Random Weapons": [
                 w['name'] for w in only_weapons 
-                    if w['name'] != self.world.starting_weapon[self.world.player]
+                    if w['name'] != self.world.starting_weapon
             ]
         }
 
     ###
     # CrossScenarioWeapons == "TrollStarting"
     ###
+    @profiled('WeaponRandomizer.troll_starting')
     def troll_starting(self):
         self.mode = "troll_starting"
         return self.troll(0) # remove all weapons except the starting weapon
@@ -192,6 +198,7 @@ class WeaponRandomizer():
     ###
     # Function to be called after ANY weapon rando, so that the upgrades for the included weapons are also included
     ###
+    @profiled('WeaponRandomizer.upgrades')
     def upgrades(self):
         all_upgrades = [item for item in self.world.item_name_to_item.values() if item.get('type') == 'Upgrade']
 
@@ -199,27 +206,24 @@ class WeaponRandomizer():
         #    and swap their orig & force to an upgrade at random for one of the new random weapons.
         #    Then, fill in any gaps with the first value in replacement ammo to match the starting weapon's ammo.
         location_names_with_upgrades = []
-        available_upgrades = [item["name"] for item in all_upgrades if item.get('upgrades') in self.world.replacement_weapons[self.world.player].values() or item.get('upgrades') == self.world.starting_weapon[self.world.player]] # match to new weapons
+        available_upgrades = [item["name"] for item in all_upgrades if item.get('upgrades') in self.world.replacement_weapons.values() or item.get('upgrades') == self.world.starting_weapon] # match to new weapons
 
         # NEED TO CHECK LOCATIONS BELOW TO MAKE SURE THEY'RE ACTUALLY RANDO'D
         # (i.e., L-Hawk Laser Sight)
 
-        for loc_name, loc in self._get_locations().items():
+        for loc_name in self.locations.keys_having_type("Upgrade"):
+            loc = self.locations.get(loc_name)
             original_item = loc.get("original_item", None)
             original_item = self.world.item_name_to_item.get(original_item, {})
 
-            force_item = loc.get("force_item", None)
-            force_item = self.world.item_name_to_item.get(force_item, {})
+            # if the location isn't randomized, it means that the original item (upgrade) is likely not able to be randomized
+            #    so, leave the upgrade there, and remove that upgrade from the available upgrades so we don't try to place it again
+            if loc.get("randomized", 1) == 0:
+                available_upgrades = [i for i in available_upgrades if i != original_item['name']]
 
-            if original_item.get("type") == "Upgrade" or force_item.get("type") == "Upgrade":
-                # if the location isn't randomized, it means that the original item (upgrade) is likely not able to be randomized
-                #    so, leave the upgrade there, and remove that upgrade from the available upgrades so we don't try to place it again
-                if loc.get("randomized", 1) == 0:
-                    available_upgrades = [i for i in available_upgrades if i != original_item['name']]
-
-                    continue
+                continue
 
-                location_names_with_upgrades.append(loc_name)
+            location_names_with_upgrades.append(loc_name)
 
         if len(available_upgrades) > 0:
             extra_locations_needed = len(available_upgrades) - len(location_names_with_upgrades)
@@ -237,7 +241,7 @@ class WeaponRandomizer():
 
             if extra_upgrades_needed > 0:
                 for x in range(extra_upgrades_needed):
-                    replacement_item = list(self.world.replacement_ammo[self.world.player].values())[0][0]
+                    replacement_item = list(self.world.replacement_ammo.values())[0][0]
 
                     if isinstance(replacement_item, list):
                         replacement_item = replacement_item[0]
@@ -245,41 +249,40 @@ class WeaponRandomizer():
                     available_upgrades.append(replacement_item)
 
         for loc_name in location_names_with_upgrades:
-            if self.world.source_locations[self.world.player][loc_name].get("force_item"):
-                self.world.source_locations[self.world.player][loc_name]["force_item"] = available_upgrades.pop(0)
-            elif self.world.source_locations[self.world.player][loc_name].get("original_item"):
-                self.world.source_locations[self.world.player][loc_name]["original_item"] = available_upgrades.pop(0)
+            loc = self.locations.get(loc_name)
+
+            if loc.get("force_item"):
+                self.locations.set_item(loc, "force_item", available_upgrades.pop(0))
+            elif loc.get("original_item"):
+                self.locations.set_item(loc, "original_item", available_upgrades.pop(0))
 
     ###
     # Function to be called after ANY weapon rando, so that the high-grade gunpowder is split to support any weapon's ammo
     ###
+    @profiled('WeaponRandomizer.high_grade_gunpowder')
     def high_grade_gunpowder(self):
-        location_names_with_hgg = [] # hgg = high grade gunpowder
-
         # Finally, find all high grade gunpowder in the scenario, and split it half-and-half between white and yellow.
         #    To account for any possible weapons that show up in the scenario.
-        for loc_name, loc in self._get_locations().items():
-            original_item = loc.get("original_item", "")
-            force_item = loc.get("force_item", "")
-
-            if "High-Grade Gunpowder" in original_item or "High-Grade Gunpowder" in force_item:
-                location_names_with_hgg.append(loc_name)
+        hgg_names = [item_name for item_name in self.world.item_name_to_item.keys() if "High-Grade Gunpowder" in item_name] # hgg = high grade gunpowder
+        location_names_with_hgg = self.locations.keys_having_any(hgg_names)
 
         # Alternate back and forth playing Yellow and White
         counter = 0
         for loc_name in location_names_with_hgg:
+            loc = self.locations.get(loc_name)
+
             if counter % 2 == 0:
-                if self.world.source_locations[self.world.player][loc_name].get("original_item"):
-                    self.world.source_locations[self.world.player][loc_name]["original_item"] = "High-Grade Gunpowder - Yellow"
+                if loc.get("original_item"):
+                    self.locations.set_item(loc, "original_item", "High-Grade Gunpowder - Yellow")
                 
-                if self.world.source_locations[self.world.player][loc_name].get("force_item"):
-                    self.world.source_locations[self.world.player][loc_name]["force_item"] = "High-Grade Gunpowder - Yellow"
+                if loc.get("force_item"):
+                    self.locations.set_item(loc, "force_item", "High-Grade Gunpowder - Yellow")
             else:
-                if self.world.source_locations[self.world.player][loc_name].get("original_item"):
-                    self.world.source_locations[self.world.player][loc_name]["original_item"] = "High-Grade Gunpowder - White"
+                if loc.get("original_item"):
+                    self.locations.set_item(loc, "original_item", "High-Grade Gunpowder - White")
                 
-                if self.world.source_locations[self.world.player][loc_name].get("force_item"):
-                    self.world.source_locations[self.world.player][loc_name]["force_item"] = "High-Grade Gunpowder - White"
+                if loc.get("force_item"):
+                    self.locations.set_item(loc, "force_item", "High-Grade Gunpowder - White")
 
             counter = counter + 1
 
@@ -297,7 +300,7 @@ class WeaponRandomizer():
         random_weapon = self.random.choice(weapon_list)
 
         # if the player set a starting weapon option, use that as the choice instead, and raise error if it's an invalid choice
-        if self.world.options.starting_weapon.current_key != "default":
+        if self.world.resolved_options.starting_weapon != "default":
             starting_weapon_name = self.world.get_starting_weapon_name_from_option_value()
             weapons_with_name = [w for w in weapon_list if w['name'] == starting_weapon_name]
 
@@ -306,9 +309,9 @@ class WeaponRandomizer():
 
             random_weapon = weapons_with_name[0]
 
-        self.world.starting_weapon[self.world.player] = random_weapon["name"]
+        self.world.starting_weapon = random_weapon["name"]
         # starting weapon isn't on a location, so no need to set replacement; but set replacement for ammo
-        self.world.replacement_ammo[self.world.player][self.starting_ammo_name] = [random_weapon["ammo"]]
+        self.world.replacement_ammo[self.starting_ammo_name] = [random_weapon["ammo"]]
 
         # remove the starting
         self.all_weapons = [i for i in self.all_weapons if i['name'] != random_weapon['name']]
@@ -319,76 +322,66 @@ class WeaponRandomizer():
         return random_weapon
 
     def _queue_swap(self, old_item: str, new_item: str, item_type: str):
-        if old_item not in self.swap_queue.keys():
-            self.swap_queue[old_item] = []
+        if (item_type, old_item) not in self.swap_queue.keys():
+            self.swap_queue[(item_type, old_item)] = []
         
-        self.swap_queue[old_item].append({
-            'old_item': old_item,
-            'new_item': new_item,
-            'item_type': item_type
-        })
+        self.swap_queue[(item_type, old_item)].append(new_item)
 
         old_item = self.world.item_name_to_item.get(old_item, {})
 
         if old_item.get('type') == 'Weapon':
-            self.world.replacement_weapons[self.world.player][old_item['name']] = new_item
+            self.world.replacement_weapons[old_item['name']] = new_item
 
         if old_item.get('type') == 'Ammo':
-            if old_item['name'] not in self.world.replacement_ammo[self.world.player].keys():
-                self.world.replacement_ammo[self.world.player][old_item['name']] = []
+            if old_item['name'] not in self.world.replacement_ammo.keys():
+                self.world.replacement_ammo[old_item['name']] = []
 
-            self.world.replacement_ammo[self.world.player][old_item['name']].append(new_item)
+            self.world.replacement_ammo[old_item['name']].append(new_item)
 
-    def _swap_queued_at_locations(self):
-        # counters to help with cycling through new item replacements for old items (if they have more than one replacement)
-        queue_indexes = { k: 0 for k in self.swap_queue.keys() }
-        
+    @profiled('WeaponRandomizer._swap_queued_at_locations')
+    def _swap_queued_at_locations(self) -> list:
         self._smooth_ammo_counts() # only changes ammo counts if swap queue includes ammo
 
-        for loc_name, loc in self._get_locations().items():
+        # returns the keys of the locations that were swapped
+        return [loc_name for loc_name, _ in self._apply_queued_swaps()]
+
+    # swaps the queued items at each location in one pass, yielding each location as it's swapped
+    def _apply_queued_swaps(self):
+        # counters to help with cycling through new item replacements for old items (if they have more than one replacement)
+        queue_indexes = {}
+        queued_item_names = [old_item for _, old_item in self.swap_queue.keys()]
+
+        # only locations that have a queued item (forced or original) can be swapped
+        for loc_name in self.locations.keys_having_any(queued_item_names):
+            loc = self.locations.get(loc_name)
+
             # if the location has already been swapped, don't swap it again
             if loc.get('swapped', None) == True:
                 continue
 
-            original_item = loc.get("original_item", None)
-            original_item = self.world.item_name_to_item.get(original_item, {})
-            force_item = loc.get("force_item", None)
-            force_item = self.world.item_name_to_item.get(force_item, {})
-            swapped = False
-
-            matched_by_force = [v2 for v in self.swap_queue.values() for v2 in v if force_item.get('type') == v2['item_type'] and force_item.get('name', None) == v2['old_item']]
+            # the forced item takes priority over the original item, since that's what's actually placed
+            for field in ['force_item', 'original_item']:
+                item = self.world.item_name_to_item.get(loc.get(field, None), {})
+                queue_key = (item.get('type'), item.get('name', None))
 
-            if not swapped and len(matched_by_force) > 0:
-                old_item = matched_by_force[0]['old_item']
-                queue_index = queue_indexes[old_item]
+                if queue_key not in self.swap_queue:
+                    continue
 
                 # increment the indexes so we're alternating what replacement gets swapped in
-                if queue_index >= len(self.swap_queue[old_item]):
-                    queue_index = queue_indexes[old_item] = 0
-
-                loc['force_item'] = matched_by_force[queue_index]['new_item']
-                swapped = True
-                queue_indexes[old_item] += 1
+                queue_index = queue_indexes.get(queue_key, 0)
 
-            matched_by_original = [v2 for v in self.swap_queue.values() for v2 in v if original_item.get('type') == v2['item_type'] and original_item.get('name', None) == v2['old_item']]
+                if queue_index >= len(self.swap_queue[queue_key]):
+                    queue_index = 0
 
-            if not swapped and len(matched_by_original) > 0:
-                old_item = matched_by_original[0]['old_item']
-                queue_index = queue_indexes[old_item]
-
-                # increment the indexes so we're alternating what replacement gets swapped in
-                if queue_index >= len(self.swap_queue[old_item]):
-                    queue_index = queue_indexes[old_item] = 0
-                    
-                loc['original_item'] = matched_by_original[queue_index]['new_item']
-                swapped = True
-                queue_indexes[old_item] += 1
+                queue_indexes[queue_key] = queue_index + 1
 
-            # if anything was swapped, set the new location back
-            if swapped:
+                self.locations.set_item(loc, field, self.swap_queue[queue_key][queue_index])
                 loc['swapped'] = True
-                self.world.source_locations[self.world.player][loc_name] = loc
+
+                yield loc_name, loc
+                break
      
+    @profiled('WeaponRandomizer._smooth_ammo_counts')
     def _smooth_ammo_counts(self):
         # we only want to smooth ammo counts for weapon rando modes that can change the weapon power density
         #   (also, we exclude "troll" and troll adjacent because unfair ammo splits is part of the appeal)
@@ -399,21 +392,21 @@ class WeaponRandomizer():
         #    and, if present, let's smooth over those quantities a bit
         # - For B scenarios, this involves cutting the Large Cal ammo in half and sending the difference to Handgun Ammo
         # - For all other scenarios, identify if there's a qty >=30 and, if so, chop 10 off it and redistribute the 10 randomly between the two lowest categories <10
-        ammo_swaps = {k: 0 for k, v in self.swap_queue.items() for v2 in v if v2['item_type'] == 'Ammo'}
+        ammo_swaps = {old_item: 0 for item_type, old_item in self.swap_queue.keys() if item_type == 'Ammo'}
 
         if len(ammo_swaps.keys()):
             if self.scenario.lower() == "b":
-                lc_locs = [loc for loc_name, loc in self._get_locations().items() if loc.get('original_item') == "Large-Caliber Handgun Ammo"]
+                lc_locs = self._get_locations_having("Large-Caliber Handgun Ammo")
                 
                 # take half of the LCH ammo locations and change them to regular Handgun ammo
                 for x in range(math.floor(len(lc_locs) / 2)):
                     if lc_locs[x].get('original_item'):
                         loc_name = lc_locs[x]['name']
-                        lc_locs[x]['original_item'] = 'Handgun Ammo'
-                        self.world.source_locations[self.world.player][loc_name] = lc_locs[x]
+                        self.locations.set_item(lc_locs[x], 'original_item', 'Handgun Ammo')
+                        self.locations.set_location(loc_name, lc_locs[x])
             else:
-                for k in ammo_swaps.keys():
-                    ammo_swaps[k] = len([loc for loc_name, loc in self._get_locations().items() if loc.get('original_item') == k])
+                # the index already has the locations for each item, so the counts don't need the locations themselves
+                ammo_swaps = {k: self.locations.count('original_item', k) for k in ammo_swaps.keys()}
 
                 # get ammo w/ high counts and with low counts, and cut one high count by 10 and redistribute it between 2 low counts
                 high_counts = [k for k, v in ammo_swaps.items() if v >= 30]
@@ -432,79 +425,46 @@ class WeaponRandomizer():
                         reserve_split = [10, 0]
 
                 if count_in_reserve > 0 and len(reserve_split) > 0:
-                    high_count_locs = [loc for loc_name, loc in self._get_locations().items() if loc.get('original_item') == high_counts[0]]
-
-                    for x in range(count_in_reserve):
-                        loc_name = f"{high_count_locs[x]['region']} - {high_count_locs[x]['name']}"
-                        swapped = False
-
-                        if reserve_split[0] > 0:
-                            reserve_split[0] -= 1
-                            swapped = True
-                            high_count_locs[x]['original_item'] = low_counts[0]
-                        elif reserve_split[1] > 0:
-                            reserve_split[1] -= 1
-                            swapped = True
-                            high_count_locs[x]['original_item'] = low_counts[1]
-                        
-                        if swapped:
-                            self.world.source_locations[self.world.player][loc_name] = high_count_locs[x]
-         
-    def _get_locations(self):
-        locs = { k: l for k, l in self.world.source_locations[self.world.player].items() }
-        return locs
+                    high_count_locs = self._get_locations_having(high_counts[0])
 
+                    # the first reserve_split[0] of the reserve go to the lowest count, the next reserve_split[1] to the second lowest
+                    #    (with only one low count, reserve_split[1] is 0, so low_counts[1] is never needed)
+                    redistributed = [low_counts[0]] * reserve_split[0] + [low_counts[-1]] * reserve_split[1]
+                    self.locations.set_items('original_item', zip(high_count_locs[:count_in_reserve], redistributed))
+         
     def _get_weapons_from_locations(self):
-        weapons = []
+        weapons = {} # weapon name: weapon, in the order they're first found
 
         for loc in self._get_weapon_locations():
-            original_item = loc.get("original_item", None)
-            original_item = self.world.item_name_to_item.get(original_item, {})
-
-            if original_item.get("type") == "Weapon" and original_item.get("ammo", None):
-                if original_item not in weapons:
-                    weapons.append(original_item)
+            weapon = self._get_weapon_at_location(loc)
+            weapons.setdefault(weapon['name'], weapon)
 
-                continue
-
-            force_item = loc.get("force_item", None)
-            force_item = self.world.item_name_to_item.get(force_item, {})
-
-            if force_item.get("type") == "Weapon" and force_item.get("ammo", None):
-                if force_item not in weapons:
-                    weapons.append(force_item)
-
-                continue
-
-        return weapons
+        return list(weapons.values())
     
     def _get_weapon_locations(self):
-        locations = []
-
-        for _, loc in self._get_locations().items():
-            original_item = loc.get("original_item", None)
-            original_item = self.world.item_name_to_item.get(original_item, {})
+        locations = {} # id(loc): loc, since a location can be listed under more than one key
 
-            if original_item.get("type") == "Weapon" and original_item.get("ammo", None):
-                if loc not in locations:
-                    locations.append(loc)
+        for loc_name in self.locations.keys_having_type("Weapon"):
+            loc = self.locations.get(loc_name)
 
-                continue
+            if id(loc) not in locations and self._get_weapon_at_location(loc):
+                locations[id(loc)] = loc
 
-            force_item = loc.get("force_item", None)
-            force_item = self.world.item_name_to_item.get(force_item, {})
+        return list(locations.values())
 
-            if force_item.get("type") == "Weapon" and force_item.get("ammo", None):
-                if loc not in locations:
-                    locations.append(loc)
+    # the weapon (that uses ammo) at the location, checking the original item before the forced item
+    def _get_weapon_at_location(self, loc) -> Optional[dict]:
+        for field in ["original_item", "force_item"]:
+            item = self.world.item_name_to_item.get(loc.get(field, None), {})
 
-                continue
+            if item.get("type") == "Weapon" and item.get("ammo", None):
+                return item
 
-        return locations
+        return None
 
     def _get_locations_for_extra_weapons(self) -> list:
         available_locations = []
-        locations = list(self._get_locations().values())
+        locations = self.locations.all()
         self.random.shuffle(locations)
 
         for loc in locations:
@@ -522,19 +482,20 @@ class WeaponRandomizer():
         return available_locations
     
     def _get_locations_having(self, item_name: str) -> list:
-        return [loc for _, loc in self._get_locations().items() if loc.get('original_item') == item_name]
+        return self.locations.having('original_item', item_name)
 
+    @profiled('WeaponRandomizer._split_ammo_by_level')
     def _split_ammo_by_level(self, level: Optional[str] = None):
         levels = self.weapons_by_level.keys()
 
         if level:
             levels = [level]
         else:
-            self.world.replacement_ammo[self.world.player] = {} # if we're splitting all ammo by level, this includes starting, so remove it and anything else
+            self.world.replacement_ammo = {} # if we're splitting all ammo by level, this includes starting, so remove it and anything else
 
         weapons_at_locations = [self.world.item_name_to_item.get(w.get('name')) for w in self._get_weapons_from_locations()]
-        weapons_at_locations = [w for w in weapons_at_locations if w.get('name') in self.world.replacement_weapons[self.world.player].values()]
-        starting_weapon = self.world.item_name_to_item.get(self.world.starting_weapon[self.world.player])
+        weapons_at_locations = [w for w in weapons_at_locations if w.get('name') in self.world.replacement_weapons.values()]
+        starting_weapon = self.world.item_name_to_item.get(self.world.starting_weapon)
         weapons_at_locations.append(starting_weapon)
 
         placed_weapons_by_level = {
@@ -553,56 +514,63 @@ class WeaponRandomizer():
             'heavy': []
         }
         
+        ammo_locations_by_ammo = {} # ammo name: locations having it, since the same ammo can come up for more than one weapon
+
         for level, weapons in placed_weapons_by_level.items():
+            placed_ids = set() # id(loc) for each location already placed for this level
+
             for weapon in weapons:
                 needed_ammo_by_level[level].append(weapon['ammo'])
-                placed_ammo_by_level[level].extend([l for l in self._get_locations_having(weapon['ammo']) if l not in placed_ammo_by_level[level]])
 
-            # de-dupe the ammo
-            needed_ammo_by_level[level] = list(set(needed_ammo_by_level[level]))
+                if weapon['ammo'] not in ammo_locations_by_ammo:
+                    ammo_locations_by_ammo[weapon['ammo']] = self._get_locations_having(weapon['ammo'])
+
+                ammo_locations = [l for l in ammo_locations_by_ammo[weapon['ammo']] if id(l) not in placed_ids]
+                placed_ammo_by_level[level].extend(ammo_locations)
+                placed_ids.update(id(l) for l in ammo_locations)
+
+            # de-dupe the ammo, keeping the order the weapons were found in, so a seed always splits the ammo the same way
+            needed_ammo_by_level[level] = list(dict.fromkeys(needed_ammo_by_level[level]))
+
+        heavy_ids = set(id(l) for l in placed_ammo_by_level['heavy'])
 
         # if medium is included, fix the medium locations to not include locations from heavy and not include light ammo locations
         if 'medium' in levels:
             placed_ammo_by_level['medium'] = [
                 l for l in placed_ammo_by_level['medium'] 
-                    if l not in placed_ammo_by_level['heavy'] 
+                    if id(l) not in heavy_ids 
                         and l.get('original_item') not in ['Handgun Ammo', 'Large-Caliber Handgun Ammo']
             ]
 
+        medium_ids = set(id(l) for l in placed_ammo_by_level['medium'])
+
         # if light is included, fix the light locations to not include locations from medium or heavy
         if 'light' in levels:
             placed_ammo_by_level['light'] = [
                 l for l in placed_ammo_by_level['light'] 
-                    if l not in placed_ammo_by_level['medium'] and l not in placed_ammo_by_level['heavy']
+                    if id(l) not in medium_ids and id(l) not in heavy_ids
             ]
 
         for lev in levels:
             # take the amount of locations with ammo and divide by the number of ammo types, rounding down
             level_total = len(needed_ammo_by_level[lev])
             each_amount = math.floor(len(placed_ammo_by_level[lev]) / level_total)
-            count = 0
 
-            # loop over all the placed ammo, and update it to the correct ammo split based on the count
+            # update all the placed ammo at once to the correct ammo split based on its position in the list
             # 0 to count is first ammo, count to count x 2 is second, etc. Last one might get extra because rounded down.
-            for loc in placed_ammo_by_level[lev]:
-                index = math.floor(count / each_amount)
-
-                if index + 1 >= level_total:
-                    index = level_total - 1
-
-                loc['original_item'] = needed_ammo_by_level[lev][index]
-                loc_key = self._get_location_key(loc['region'], loc['name'])
-                self.world.source_locations[self.world.player][loc_key] = loc
-
-                count += 1
+            split_ammo = [
+                needed_ammo_by_level[lev][min(count // each_amount, level_total - 1)] for count in range(len(placed_ammo_by_level[lev]))
+            ]
+            self.locations.set_items('original_item', zip(placed_ammo_by_level[lev], split_ammo))
 
-            self.world.replacement_ammo[self.world.player]["{} Weapon Ammo".format(lev.title())] = needed_ammo_by_level[lev]
+            self.world.replacement_ammo["{} Weapon Ammo".format(lev.title())] = needed_ammo_by_level[lev]
 
+    @profiled('WeaponRandomizer._split_ammo_randomly')
     def _split_ammo_randomly(self):
-        self.world.replacement_ammo[self.world.player] = {} # all ammo is completely random, so skip starting listing(s) too
+        self.world.replacement_ammo = {} # all ammo is completely random, so skip starting listing(s) too
 
         placed_weapons = [self.world.item_name_to_item.get(w.get('name')) for w in self._get_weapons_from_locations()]
-        starting_weapon = self.world.item_name_to_item.get(self.world.starting_weapon[self.world.player])
+        starting_weapon = self.world.item_name_to_item.get(self.world.starting_weapon)
         placed_weapons.append(starting_weapon)
 
         needed_ammo = []
@@ -611,27 +579,27 @@ class WeaponRandomizer():
         for weapon in placed_weapons:
             needed_ammo.append(weapon['ammo'])
 
+        ammo_locations_by_ammo = {} # ammo name: locations having it, since weapons can share ammo
+
         for weapon in self.all_weapons:
-            placed_ammo.extend(self._get_locations_having(weapon['ammo']))
-
-        # de-dupe the ammo list
-        needed_ammo = list(set(needed_ammo))
-        forced_minimum_ammo = [*needed_ammo]
-        more_minimum_ammo = [*needed_ammo] * 3
-
-        # loop over all the placed ammo, and update it to a completely random ammo choice
-        for loc in placed_ammo:
-            if len(forced_minimum_ammo) > 0: # first, guaranteed a single pack of every ammo type
-                loc['original_item'] = forced_minimum_ammo.pop()
-            elif len(more_minimum_ammo) > len(needed_ammo): # ... then, have a chance to roll up to 3 more of any pack
-                loc['original_item'] = more_minimum_ammo.pop()
-            else: # ... then, just pick randomly
-                loc['original_item'] = self.random.choice(needed_ammo)
-            
-            loc_key = self._get_location_key(loc['region'], loc['name'])
-            self.world.source_locations[self.world.player][loc_key] = loc
-
-        self.world.replacement_ammo[self.world.player]["Random Quantities"] = needed_ammo
+            if weapon['ammo'] not in ammo_locations_by_ammo:
+                ammo_locations_by_ammo[weapon['ammo']] = self._get_locations_having(weapon['ammo'])
+
+            placed_ammo.extend(ammo_locations_by_ammo[weapon['ammo']])
+
+        # de-dupe the ammo list, keeping the order the weapons were found in, so a seed always picks the same ammo
+        needed_ammo = list(dict.fromkeys(needed_ammo))
+
+        # update all the placed ammo at once to a completely random ammo choice:
+        # first, guaranteed a single pack of every ammo type, then up to 2 more of every pack (in reverse order, like popping them off the list) ...
+        random_ammo = [*reversed(needed_ammo)] * 3
+        random_ammo = random_ammo[:len(placed_ammo)]
+
+        # ... then, just pick randomly
+        random_ammo.extend(self.random.choice(needed_ammo) for _ in range(len(placed_ammo) - len(random_ammo)))
+        self.locations.set_items('original_item', zip(placed_ammo, random_ammo))
+
+        self.world.replacement_ammo["Random Quantities"] = needed_ammo
 
     def _get_location_key(self, *location_parts):
         return " - ".join(location_parts)
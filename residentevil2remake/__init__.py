@@ -1,3 +1,4 @@
+import os
 import re
 import typing
 
@@ -6,19 +7,27 @@ from Utils import visualize_regions
 
 from BaseClasses import ItemClassification, Item, Location, Region, CollectionState, LocationProgressType
 from worlds.AutoWorld import World
-from ..generic.Rules import set_rule
+from ..generic.Rules import add_item_rule, set_rule
 from Fill import fill_restrictive
 
 from .Data import Data
 from .Exceptions import RE2ROptionError
-from .Options import RE2ROptions
+from .ItemPool import ItemPool
+from .LocationOverlay import LocationOverlay
+from .Options import RE2ROptions, RE2RResolvedOptions
+from .Preparation import prepare_in_workers, preparation_workers
+from .Profiling import get_profiler, profiled, profiling_enabled
+from .Rules import compile_item_rule
+from .ScenarioGraph import ScenarioGraph, get_scenario_graph
+from .Spoiler import WeaponSpoiler
 from .WeaponRandomizer import WeaponRandomizer
 
 
-Data.load_data('leon', 'a')
-Data.load_data('leon', 'b')
-Data.load_data('claire', 'a')
-Data.load_data('claire', 'b')
+# items are needed for every world, but scenario locations / regions are only loaded when a player is playing that scenario
+for character, scenario in Data.scenarios:
+    Data.load_items(character, scenario)
+
+Data.load_index()
 
 
 class RE2RLocation(Location):
@@ -34,6 +43,37 @@ class RE2RLocation(Location):
         return current_item_rule(item) and ('forbid_item' not in location_data or item.name not in location_data['forbid_item'])
 
 
+# an item's classification never changes, so this is worked out once per item name when the world class is set up
+def get_item_classification(item: dict) -> ItemClassification:
+    if item.get('progression', False):
+        return ItemClassification.progression
+    elif item.get('type', None) not in ['Lore', 'Filler', 'Trap']:
+        return ItemClassification.useful
+    elif item.get('type', None) == 'Trap':
+        return ItemClassification.trap
+    else: # it's Lore/Filler
+        return ItemClassification.filler
+
+
+# the item lookup tables, in one pass over the item table: id -> name, name -> id, name -> item, 
+#    and name -> what create_item needs (name, classification, id)
+def build_item_tables(item_table: list) -> tuple:
+    item_id_to_name = {}
+    item_name_to_id = {}
+    item_name_to_item = {}
+    item_name_to_prototype = {}
+
+    for item in item_table:
+        name, id = item['name'], item['id']
+
+        item_id_to_name[id] = name
+        item_name_to_id[name] = id
+        item_name_to_item[name] = item
+        item_name_to_prototype[name] = (name, get_item_classification(item), id)
+
+    return item_id_to_name, item_name_to_id, item_name_to_item, item_name_to_prototype
+
+
 class ResidentEvil2Remake(World):
     """
     'Leon, I am your father.' - Billy Birkin, probably
@@ -44,117 +84,101 @@ class ResidentEvil2Remake(World):
     required_client_version = (0, 5, 0)
     apworld_release_version = "0.3.3" # defined to show in spoiler log
 
-    item_id_to_name = { item['id']: item['name'] for item in Data.item_table }
-    item_name_to_id = { item['name']: item['id'] for item in Data.item_table }
-    item_name_to_item = { item['name']: item for item in Data.item_table }
-    location_id_to_name = { loc['id']: RE2RLocation.stack_names(loc['region'], loc['name']) for loc in Data.location_table + Data.enemy_table }
-    location_name_to_id = { RE2RLocation.stack_names(loc['region'], loc['name']): loc['id'] for loc in Data.location_table + Data.enemy_table }
-    location_name_to_location = { RE2RLocation.stack_names(loc['region'], loc['name']): loc for loc in Data.location_table + Data.enemy_table }
-    source_locations = {} # this is used to seed the initial item pool from original items, and is indexed by player as lname:loc locations
+    item_id_to_name, item_name_to_id, item_name_to_item, item_name_to_prototype = build_item_tables(Data.item_table)
+    item_name_to_bit = { # each progression item's bit in the progression mask that the rules check (see Rules.py)
+        name: 1 << bit for bit, name in enumerate(
+            name for name, (_, classification, _) in item_name_to_prototype.items() if classification & ItemClassification.progression
+        )
+    }
+    location_id_to_name = Data.location_id_to_name
+    location_name_to_id = Data.location_name_to_id
+    location_name_to_location = Data.location_name_to_location # filled in as scenarios are loaded for players that are playing them
 
     # de-dupe the item names for the item group name
     item_name_groups = { key: set(values) for key, values in Data.item_name_groups.items() }
 
+    # this player's state, which is set on each world as it's generated (so nothing is kept between generations), 
+    #    and dropped again by release_player_state once the output is done
+    source_locations = None # used to seed the initial item pool from original items, as lname:loc locations (see LocationOverlay.py)
+    location_item_counts = None # item name: how many of the player's locations have it, tallied once the weapon randomizer is done
+
     # keep track of the weapon randomizer settings for use in various steps and in slot data
-    starting_weapon = {}
-    replacement_weapons = {}
-    replacement_ammo = {}
+    starting_weapon = None
+    replacement_weapons = None
+    replacement_ammo = None
 
     options_dataclass = RE2ROptions
     options: RE2ROptions
 
+    profiler = None # only set for each world while profiling is on (see Profiling.py)
+    preparation_pending = False # set in generate_early when prepare_scenario_state is left for the worker processes (see Preparation.py)
+
+    @profiled('generate_early')
     def generate_early(self): # check weapon randomization before locations and items are processed, so we can swap non-randomized items as well
         # check for option values that UT passed via storing from slot data, and set our options to match if present
         for key, val in getattr(self.multiworld, 're_gen_passthrough', {}).get(self.game, {}).items():
             # gets the int val from the string option value name, then sets
             getattr(self.options, key).value = getattr(self.options, key).options[val]
 
+        # resolve the options to plain values once, so everything after this can just read them
+        self.resolved_options = RE2RResolvedOptions(self.options)
+
+        # load the full scenario data for this player's scenario, if another player hasn't already
+        Data.load_data(self._get_character(), self._get_scenario())
+
         # if the enemy kills as locations option is enabled for a scenario that doesn't support it yet, throw an error
         if self._enemy_kill_rando() and not self._can_enemy_kill_rando():
             raise RE2ROptionError("The Enemy Kills as Locations option is only currently supported for Leon's A (1st) scenario on Assisted / Standard difficulty.")
             return
 
         # start with the normal locations per player for pool, then overwrite with weapon rando if needed
-        self.source_locations[self.player] = self._get_locations_for_scenario(self._get_character(), self._get_scenario()) # id:loc combo
-        self.source_locations[self.player] = { 
-            RE2RLocation.stack_names(l['region'], l['name']): { **l, 'id': i } 
-                for i, l in self.source_locations[self.player].items() 
-        } # turn it into name:loc instead
-
-        if self._enemy_kill_rando():
-            # since enemy kills don't give items themselves, create a drop table of 
-            # combat-related items to add to the pool for these locations
-            enemy_kill_items = self._format_option_text(self.options.enemy_kill_items).lower()
-
-            if enemy_kill_items == "Trash":
-                enemy_kill_valid_drops = [
-                    i['name'] for i in Data.item_table if i.get('type', 'None') in ['Lore'] or 'Trophy' in i['name'] 
-                ]   
-            elif enemy_kill_items == "Healing":
-                enemy_kill_valid_drops = [
-                    i['name'] for i in Data.item_table if i.get('type', 'None') in ['Recovery'] 
-                ]
-            elif enemy_kill_items == "Gunpowder":
-                enemy_kill_valid_drops = [
-                    i['name'] for i in Data.item_table if 'Gunpowder' in i['name'] 
-                ]
-            elif enemy_kill_items == "Ammo":
-                enemy_kill_valid_drops = [
-                    i['name'] for i in Data.item_table if i.get('type', 'None') in ['Ammo'] 
-                ]
-            elif enemy_kill_items == "Ammo Related":
-                enemy_kill_valid_drops = [
-                    i['name'] for i in Data.item_table if i.get('type', 'None') in ['Ammo'] or 'Gunpowder' in i['name'] 
-                ]
-            elif enemy_kill_items == "All Weapon Related":
-                enemy_kill_valid_drops = [
-                    i['name'] for i in Data.item_table if i.get('type', 'None') in ['Ammo', 'Subweapon'] or 'Gunpowder' in i['name'] 
-                ]
-            else: # == "Mixed"
-                enemy_kill_valid_drops = [
-                    i['name'] for i in Data.item_table if i.get('type', 'None') in ['Recovery', 'Ammo', 'Subweapon'] or 'Gunpowder' in i['name'] 
-                ]   
-
-            # get the list of viable items from the list of items currently on the scenario's locations
-            enemy_kill_drop_names = list(set([
-                l['original_item'] for l in self.source_locations[self.player].values() if l.get('original_item', 'None') in enemy_kill_valid_drops
-            ]))
-            enemy_kill_drops = []
-
-            for x in range(len(Data.enemy_table)):
-                drop_name = enemy_kill_drop_names[x % len(enemy_kill_drop_names)]
-                enemy_kill_drops.append(drop_name)
-
-            # replace placeholders for enemy kills with the chosen distribution of items
-            for name, loc in self.source_locations[self.player].items():
-                if loc.get('original_item') == "__Enemy Kill Drop Placeholder__":
-                    loc['original_item'] = enemy_kill_drops.pop(0)
-
-        weapon_rando = self._format_option_text(self.options.cross_scenario_weapons).lower()
+        #    the locations are shared with every other player on this scenario, so this player's changes go in an overlay on top of them
+        self.source_locations = LocationOverlay(self._get_locations_for_scenario(self._get_character(), self._get_scenario()))
 
-        # if any of the "Oops! All X" weapon options are present, don't bother with weapon randomization since they'll all get overwritten
-        #    and since starting with pistol is important to prevent softlock at Gator with all knives
+        # if any of the "Oops! All X" weapon options are present, make sure nothing else is trying to change weapons
         if self._get_oops_all_options_flag():
-            if weapon_rando != "none":
+            if self.resolved_options.cross_scenario_weapons != "none":
                 raise RE2ROptionError("Cannot apply 'Oops All' options alongside Cross Scenario Weapons. Please fix your yaml.")
             
             # also check for starting weapon option, which is incompatible with Oops! options
-            if self.options.starting_weapon.current_key != "default":
+            if self.resolved_options.starting_weapon != "default":
                 raise RE2ROptionError("Cannot apply 'Starting Weapon' options alongside 'Oops All' options. Please fix your yaml.")
 
             # also check for double weapons, which is incompatible with Oops! options
-            if self._format_option_text(self.options.double_weapons) == 'True':
+            if self.resolved_options.double_weapons:
                 raise RE2ROptionError("Cannot use 'Double Weapons' option alongside 'Oops All' options. Please fix your yaml.")
 
+        # the rest only depends on this player's options and the scenario data, so if preparing in worker processes is turned on,
+        #    it's done for every RE2R player at once in stage_generate_early instead (see Preparation.py)
+        if preparation_workers > 0:
+            self.preparation_pending = True
             return
 
-        weapon_rando = self._format_option_text(self.options.cross_scenario_weapons).lower()
+        self.prepare_scenario_state()
+
+    # enemy kill drops, the weapon randomizer, and the location item tally. this only reads the player's resolved options, random, and
+    #    source locations (not the multiworld), so it can also run in a worker process on a bare copy of the world (see Preparation.py)
+    @profiled('prepare_scenario_state')
+    def prepare_scenario_state(self):
+        if self._enemy_kill_rando():
+            # replace placeholders for enemy kills with the chosen distribution of items, which is worked out for each scenario when it's loaded
+            enemy_kill_drops = Data.enemy_kill_drops[(self._get_character(), self._get_scenario(), self._get_difficulty() == 'hardcore')]
+
+            for name, drop_name in enemy_kill_drops.get(self.resolved_options.enemy_kill_items, {}).items():
+                self.source_locations.set_field(name, 'original_item', drop_name)
+
+        weapon_rando = self.resolved_options.cross_scenario_weapons
+
+        # if any of the "Oops! All X" weapon options are present, don't bother with weapon randomization since they'll all get overwritten
+        #    and since starting with pistol is important to prevent softlock at Gator with all knives
+        if self._get_oops_all_options_flag():
+            return
 
         # if the user didn't pick any weapon randomization, skip all of this
         if weapon_rando == "none":
             # if not using weapon rando (which handles its own starting weapon), set the starting weapon here
-            if self.options.starting_weapon.current_key != "default":
-                self.starting_weapon[self.player] = self.get_starting_weapon_name_from_option_value()
+            if self.resolved_options.starting_weapon != "default":
+                self.starting_weapon = self.get_starting_weapon_name_from_option_value()
 
             return
 
@@ -169,12 +193,12 @@ class ResidentEvil2Remake(World):
             weapon_randomizer.full()
         elif weapon_rando == "all": 
             weapon_randomizer.all()
-        elif weapon_rando == "full ammo": 
+        elif weapon_rando == "full_ammo": 
             weapon_randomizer.full_ammo()
         # all ammo and troll are identical, except there's a step after upgrades are placed for all weapons to remove all but a few weapons
         # so just do all_ammo here, then call the actual troll option after upgrades + gunpowder + whatever else
-        elif weapon_rando == "all ammo" or weapon_rando == "troll" or weapon_rando == "troll starting": 
-            if weapon_rando == "all ammo": weapon_randomizer.all_ammo()
+        elif weapon_rando == "all_ammo" or weapon_rando == "troll" or weapon_rando == "troll_starting": 
+            if weapon_rando == "all_ammo": weapon_randomizer.all_ammo()
             else: weapon_randomizer.all_ammo_troll()
         else:
             raise RE2ROptionError("Invalid weapon randomizer value!")
@@ -184,18 +208,31 @@ class ResidentEvil2Remake(World):
 
         if weapon_rando == "troll":
             weapon_randomizer.troll()
-        if weapon_rando == "troll starting":
+        if weapon_rando == "troll_starting":
             weapon_randomizer.troll_starting()
 
+        self.source_locations.compact() # only keep the locations that the weapon randomizer actually changed
+        self.location_item_counts = self._count_location_items()
+
+    # runs once all the players' generate_early are done, to prepare every RE2R player that was left for the worker processes
+    @classmethod
+    def stage_generate_early(cls, multiworld):
+        worlds = [world for world in multiworld.worlds.values() if isinstance(world, cls) and world.preparation_pending]
+
+        if len(worlds) > 0:
+            prepare_in_workers(worlds, preparation_workers)
+
+    @profiled('create_regions')
     def create_regions(self): # and create locations
-        scenario_locations = { l['id']: l for _, l in self.source_locations[self.player].items() }
-        scenario_regions = self._get_region_table_for_scenario(self._get_character(), self._get_scenario())
+        scenario_locations = self.source_locations
+        scenario_graph = self._get_scenario_graph()
+        redundant_rules = self._get_reachability()['redundant_rules'] # conditions that are always met once the region is reached
 
         # used below if killsanity is on
         has_fire_weapon = False
         fire_weapons = ['GM 79', 'Chemical Flamethrower']
 
-        if self._format_option_text(self.options.oops_all_rockets) == 'True':
+        if self.resolved_options.oops_all_rockets:
             has_fire_weapon = True
         elif self._get_starting_weapon() in fire_weapons:
             has_fire_weapon = True
@@ -205,20 +242,22 @@ class ResidentEvil2Remake(World):
                     for _, location in scenario_locations.items() if location.get('original_item') in fire_weapons
             ]) > 0
 
-        regions = [
-            Region(region['name'], self.player, self.multiworld) 
-                for region in scenario_regions
-        ]
-        
-        for region in regions:
+        regions = []
+        no_progression_rule = lambda item: not item.advancement # shared by all the Labs locations, if progression isn't allowed there
+
+        for region_number, region_name in enumerate(scenario_graph.region_names):
+            region = Region(region_name, self.player, self.multiworld)
+            zone_id = scenario_graph.region_zone_ids[region_number]
+            first_slot = scenario_graph.region_location_starts[region_number]
+            last_slot = scenario_graph.region_location_starts[region_number + 1]
+
             region.locations = [
-                RE2RLocation(self.player, RE2RLocation.stack_names_not_victory(region.name, location['name']), location['id'], region) 
-                    for _, location in scenario_locations.items() if location['region'] == region.name
+                RE2RLocation(self.player, scenario_graph.location_names[slot], scenario_graph.location_ids[slot], region) 
+                    for slot in range(first_slot, last_slot)
             ]
-            region_data = [scenario_region for scenario_region in scenario_regions if scenario_region['name'] == region.name][0]
             
-            for location in region.locations:
-                location_data = scenario_locations[location.address]
+            for location, location_key in zip(region.locations, scenario_graph.location_keys[first_slot:last_slot]):
+                location_data = scenario_locations[location_key]
                 
                 # if location has an item that should be forced there, place that. for cases where the item to place differs from the original.
                 if 'force_item' in location_data and location_data['force_item']:
@@ -230,9 +269,9 @@ class ResidentEvil2Remake(World):
                 # if location is not force_item'd or not not randomized, check for Labs progression option and apply
                 # since Labs progression option doesn't matter for force_item'd or not randomized locations
                 # we check for zone id > 3 because 3 is typically Sewers, and anything beyond that is Labs / endgame stuff
-                elif self._format_option_text(self.options.allow_progression_in_labs) == 'False' and region_data['zone_id'] > 3:
-                    location.item_rule = lambda item: not item.advancement
-                elif self._format_option_text(self.options.allow_progression_in_labs) == 'True' and re.match(r'^Treatment Pool Room \(\w+?\) - Cable Car Table$', location.name):
+                elif not self.resolved_options.allow_progression_in_labs and zone_id > 3:
+                    location.item_rule = no_progression_rule
+                elif self.resolved_options.allow_progression_in_labs and re.match(r'^Treatment Pool Room \(\w+?\) - Cable Car Table$', location.name):
                     location.place_locked_item(self.create_item("Sewers Key"))
                 # END if
 
@@ -250,25 +289,18 @@ class ResidentEvil2Remake(World):
                     location.item_rule = lambda item, loc_data=location_data, cur_rule=current_item_rule: RE2RLocation.is_item_forbidden(item, loc_data, cur_rule)
 
                 # now, set rules for the location access
-                if "condition" in location_data and "items" in location_data["condition"]:
-                    set_rule(location, lambda state, loc=location, loc_data=location_data: self._has_items(state, loc_data["condition"].get("items", [])))
+                if "condition" in location_data and "items" in location_data["condition"] and location.address not in redundant_rules:
+                    set_rule(location, self._count_rule_calls('location rule calls', compile_item_rule(location_data["condition"].get("items", []), self.player, self.item_name_to_bit)))
 
+            regions.append(region)
             self.multiworld.regions.append(region)
-                
-        for connect in self._get_region_connection_table_for_scenario(self._get_character(), self._get_scenario()):
-            # skip connecting on a one-sided connection because this should not be reachable backwards (and should be reachable otherwise)
-            if 'limitation' in connect and connect['limitation'] in ['ONE_SIDED_DOOR']:
-                continue
 
-            from_name = connect['from'] if 'Menu' not in connect['from'] else 'Menu'
-            to_name = connect['to'] if 'Menu' not in connect['to'] else 'Menu'
+        # one-sided doors are already left out of the scenario graph, so every connection here gets connected
+        for region_from, region_to, items in zip(scenario_graph.connection_from, scenario_graph.connection_to, scenario_graph.connection_items):
+            ent = regions[region_from].connect(regions[region_to])
 
-            region_from = self.multiworld.get_region(from_name, self.player)
-            region_to = self.multiworld.get_region(to_name, self.player)
-            ent = region_from.connect(region_to)
-
-            if "condition" in connect and "items" in connect["condition"]:
-                set_rule(ent, lambda state, en=ent, conn=connect: self._has_items(state, conn["condition"].get("items", [])))
+            if items is not None:
+                set_rule(ent, self._count_rule_calls('entrance rule calls', compile_item_rule(items, self.player, self.item_name_to_bit)))
 
         # Uncomment the below to see a connection of the regions (and their locations) for any scenarios you're testing.
         # visualize_regions(self.multiworld.get_region("Menu", self.player), "region_uml")
@@ -277,95 +309,90 @@ class ResidentEvil2Remake(World):
         self.multiworld.get_location("Victory", self.player) \
             .place_locked_item(self.create_item("Victory"))
 
-        self.multiworld.completion_condition[self.player] = lambda state: self._has_items(state, ['Victory'])
+        self.multiworld.completion_condition[self.player] = compile_item_rule(['Victory'], self.player, self.item_name_to_bit)
 
+    @profiled('create_items')
     def create_items(self):
-        scenario_locations = self.source_locations[self.player]
+        scenario_locations = self.source_locations
 
-        pool = [
-            self.create_item(item['name'] if item else None) for item in [
-                self.item_name_to_item[location['original_item']] if location.get('original_item') else None
-                    for _, location in scenario_locations.items()
-            ]
-        ]
+        # some of the locations might not have an original item, so might not create an item for the pool
+        pool = ItemPool(
+            self.create_item(location['original_item']) for _, location in scenario_locations.items() if location.get('original_item')
+        )
 
         # print([location['name'] + ' | ' + location.get('original_item', 'None') for _, location in scenario_locations.items()])
 
-        pool = [item for item in pool if item is not None] # some of the locations might not have an original item, so might not create an item for the pool
-
         # if there's a starting weapon option set, remove the starting weapon from the pool and replace it with its ammo
-        if self.options.starting_weapon.current_key != "default":
+        if self.resolved_options.starting_weapon != "default":
             starting_weapon_name = self.get_starting_weapon_name_from_option_value()
             starting_weapon_ammo = [item['ammo'] for item in self.item_name_to_item.values() if item['name'] == starting_weapon_name][0]
 
             # replace every instance of the weapon we started with (in the item pool) with its ammo
-            pool = [item if item.name != starting_weapon_name else self.create_item(starting_weapon_ammo) for item in pool]
+            pool.replace_in_place(starting_weapon_name, self.create_item_copies(starting_weapon_ammo, pool.count(starting_weapon_name)))
 
         # remove any already-placed items from the pool (forced items, etc.)
         for filled_location in self.multiworld.get_filled_locations(self.player):
-            if filled_location.item.code and filled_location.item in pool: # not id... not address... "code"
-                pool.remove(filled_location.item)
+            if filled_location.item.code and filled_location.item.player == self.player: # not id... not address... "code"
+                pool.remove(filled_location.item.name)
 
         # check the starting hip pouches option and add as precollected, removing from pool and replacing with junk
-        starting_hip_pouches = int(self.options.starting_hip_pouches)
+        starting_hip_pouches = self.resolved_options.starting_hip_pouches
 
         if starting_hip_pouches > 0:
-            hip_pouches = [item for item in pool if item.name == 'Hip Pouch'] # 6 total in every campaign, I think
+            hip_pouch_count = pool.count('Hip Pouch') # 6 total in every campaign, I think
 
             # if the hip pouches option exceeds the number of hip pouches in the pool, reduce it to the number in the pool
-            if starting_hip_pouches > len(hip_pouches):
-                starting_hip_pouches = len(hip_pouches)
-                self.options.starting_hip_pouches.value = len(hip_pouches)
+            if starting_hip_pouches > hip_pouch_count:
+                starting_hip_pouches = hip_pouch_count
+                self.options.starting_hip_pouches.value = hip_pouch_count
 
             for x in range(starting_hip_pouches):
-                self.multiworld.push_precollected(hip_pouches[x]) # starting inv
-                pool.remove(hip_pouches[x])
+                self.multiworld.push_precollected(pool.remove('Hip Pouch')) # starting inv
 
         # check the starting ink ribbons option and add as precollected, removing from pool and replacing with junk
-        starting_ink_ribbons = int(self.options.starting_ink_ribbons)
+        starting_ink_ribbons = self.resolved_options.starting_ink_ribbons
 
-        if self._format_option_text(self.options.difficulty) == 'Hardcore' and starting_ink_ribbons > 0:
-            ink_ribbons = [item for item in pool if item.name == 'Ink Ribbon'] # 12+ total in every campaign, I think
+        if self._get_difficulty() == 'hardcore' and starting_ink_ribbons > 0:
+            ink_ribbon_count = pool.count('Ink Ribbon') # 12+ total in every campaign, I think
 
             # if the ink ribbons option exceeds the number of ink ribbons in the pool, reduce it to the number in the pool
-            if starting_ink_ribbons > len(ink_ribbons):
-                starting_ink_ribbons = len(ink_ribbons)
-                self.options.starting_ink_ribbons.value = len(ink_ribbons)
+            if starting_ink_ribbons > ink_ribbon_count:
+                starting_ink_ribbons = ink_ribbon_count
+                self.options.starting_ink_ribbons.value = ink_ribbon_count
 
             for x in range(starting_ink_ribbons):
-                self.multiworld.push_precollected(ink_ribbons[x]) # starting inv
-                pool.remove(ink_ribbons[x])
+                self.multiworld.push_precollected(pool.remove('Ink Ribbon')) # starting inv
 
         # check the bonus start option and add some heal items and ammo packs as precollected / starting items
-        if self._format_option_text(self.options.bonus_start) == 'True':
+        if self.resolved_options.bonus_start:
             count_spray = 3
             count_ammo = 4
             count_grenades = 3
             count_bangs = 3
 
-            for x in range(count_spray): self.multiworld.push_precollected(self.create_item('First Aid Spray'))
+            for item in self.create_item_copies('First Aid Spray', count_spray): self.multiworld.push_precollected(item)
 
-            if self.player in self.starting_weapon:
-                starting_weapon = self.starting_weapon[self.player]
+            if self.starting_weapon is not None:
+                starting_weapon = self.starting_weapon
                 starting_weapon_ammo = self.item_name_to_item[starting_weapon].get('ammo')
-                for x in range(count_ammo): self.multiworld.push_precollected(self.create_item(starting_weapon_ammo))
+                for item in self.create_item_copies(starting_weapon_ammo, count_ammo): self.multiworld.push_precollected(item)
             else:
-                for x in range(count_ammo): self.multiworld.push_precollected(self.create_item('Handgun Ammo'))
+                for item in self.create_item_copies('Handgun Ammo', count_ammo): self.multiworld.push_precollected(item)
 
-            for x in range(count_grenades): self.multiworld.push_precollected(self.create_item('Hand Grenade'))
-            for x in range(count_bangs): self.multiworld.push_precollected(self.create_item('Flash Grenade'))
+            for item in self.create_item_copies('Hand Grenade', count_grenades): self.multiworld.push_precollected(item)
+            for item in self.create_item_copies('Flash Grenade', count_bangs): self.multiworld.push_precollected(item)
 
         # do all the "no X" options here so we have more empty spots to use for traps, if needed
-        if self._format_option_text(self.options.no_first_aid_spray) == 'True':
+        if self.resolved_options.no_first_aid_spray:
             pool = self._replace_pool_item_with(pool, 'First Aid Spray', 'Wooden Boards')
 
-        if self._format_option_text(self.options.no_green_herb) == 'True':
+        if self.resolved_options.no_green_herb:
             pool = self._replace_pool_item_with(pool, 'Green Herb', 'Wooden Boards')
 
-        if self._format_option_text(self.options.no_red_herb) == 'True':
+        if self.resolved_options.no_red_herb:
             pool = self._replace_pool_item_with(pool, 'Red Herb', 'Wooden Boards')
         
-        if self._format_option_text(self.options.no_gunpowder) == 'True':
+        if self.resolved_options.no_gunpowder:
             replaceables = set(item.name for item in pool if 'Gunpowder' in item.name)
             less_useful_items = set(
                 item.name for item in pool 
@@ -380,13 +407,11 @@ class ResidentEvil2Remake(World):
         # do this before the "oops all X" options so we can make use of extra Handgun Ammo spots before they get replaced out
         traps = []
 
-        if self._format_option_text(self.options.add_damage_traps) == 'True':
-            for x in range(int(self.options.damage_trap_count)):
-                traps.append(self.create_item("Damage Trap"))
+        if self.resolved_options.add_damage_traps:
+            traps.extend(self.create_item_copies("Damage Trap", self.resolved_options.damage_trap_count))
 
-        if self._format_option_text(self.options.add_poison_traps) == 'True':
-            for x in range(int(self.options.poison_trap_count)):
-                traps.append(self.create_item("Poison Trap"))
+        if self.resolved_options.add_poison_traps:
+            traps.extend(self.create_item_copies("Poison Trap", self.resolved_options.poison_trap_count))
 
         if len(traps) > 0:
             # use these spots for replacement first, since they're entirely non-essential
@@ -408,19 +433,19 @@ class ResidentEvil2Remake(World):
                 if len(traps) == 0: break
 
                 trap_to_place = traps.pop()
-                pool.remove(spot)
+                pool.remove(spot.name)
                 pool.append(trap_to_place)
                 
             for spot in extra_spots:
                 if len(traps) == 0: break
 
                 trap_to_place = traps.pop()
-                pool.remove(spot)
+                pool.remove(spot.name)
                 pool.append(trap_to_place)
 
         # add extras for Clock Tower items or Medallions, if configured
         # doing this before "oops all X" to make use of extra Handgun Ammo spots, too
-        if self._format_option_text(self.options.extra_clock_tower_items) == 'True':
+        if self.resolved_options.extra_clock_tower_items:
             replaceables = [
                 item for item in pool if 
                     'Boards' in item.name or item.name == 'Handgun Ammo' or item.name == 'Large-Caliber Handgun Ammo' or item.name == "Gunpowder" or 
@@ -429,13 +454,13 @@ class ResidentEvil2Remake(World):
             
             for x in range(3):
                 if len(replaceables) == 0: break
-                pool.remove(replaceables.pop())
+                pool.remove(replaceables.pop().name)
 
             pool.append(self.create_item('Mechanic Jack Handle'))
             pool.append(self.create_item('Small Gear'))
             pool.append(self.create_item('Large Gear'))
 
-        if self._format_option_text(self.options.extra_medallions) == 'True':
+        if self.resolved_options.extra_medallions:
             replaceables = replaceables = [
                 item for item in pool if 
                     'Boards' in item.name or item.name == 'Handgun Ammo' or item.name == 'Large-Caliber Handgun Ammo' or item.name == "Gunpowder" or 
@@ -444,7 +469,7 @@ class ResidentEvil2Remake(World):
 
             for x in range(2):
                 if len(replaceables) == 0: break
-                pool.remove(replaceables.pop())
+                pool.remove(replaceables.pop().name)
 
             pool.append(self.create_item('Lion Medallion'))
             pool.append(self.create_item('Unicorn Medallion'))
@@ -453,12 +478,12 @@ class ResidentEvil2Remake(World):
             # B scenarios have it randomized, so add a second randomized Maiden.
             if self._get_scenario().lower() == 'b':
                 if len(replaceables) > 0:
-                    pool.remove(replaceables.pop()) # remove the 3rd item to make room for a 3rd medallion
+                    pool.remove(replaceables.pop().name) # remove the 3rd item to make room for a 3rd medallion
 
                 pool.append(self.create_item('Maiden Medallion'))
 
-        if self._format_option_text(self.options.early_medallions) == 'True':
-            medallions = {i.name: len([i2 for i2 in pool if i2.name == i.name]) for i in pool if i.name in ['Lion Medallion', 'Unicorn Medallion', 'Maiden Medallion']}
+        if self.resolved_options.early_medallions:
+            medallions = {i.name: pool.count(i.name) for i in pool if i.name in ['Lion Medallion', 'Unicorn Medallion', 'Maiden Medallion']}
 
             for item_name, item_qty in medallions.items():
                 if item_qty > 0:
@@ -509,19 +534,15 @@ class ResidentEvil2Remake(World):
                 pool = self._replace_pool_item_with(pool, from_item['name'], oops_items_map[oops_all_flag])
 
             # Add Marvin's Knife back in. He gets cranky if you don't give him his knife.
-            for item in pool:
-                if item.name == oops_items_map[oops_all_flag]:
-                    pool.remove(item)
-                    pool.append(self.create_item("Combat Knife"))
-                    break
+            if pool.remove(oops_items_map[oops_all_flag]):
+                pool.append(self.create_item("Combat Knife"))
 
 
         # if the number of unfilled locations exceeds the count of the pool, fill the remainder of the pool with extra maybe helpful items
         missing_item_count = len(self.multiworld.get_unfilled_locations(self.player)) - len(pool)
 
         if missing_item_count > 0:
-            for x in range(missing_item_count):
-                pool.append(self.create_item('Blue Herb'))
+            pool.extend(self.create_item_copies('Blue Herb', missing_item_count))
 
         # Make any items that result in a really quick BK either early or local items, so the BK time is reduced
         early_items = {}       
@@ -540,11 +561,11 @@ class ResidentEvil2Remake(World):
         ]
 
         local_items = {}       
-        local_items["Fuse - Main Hall"] = len([i for i in pool if i.name == "Fuse - Main Hall"])
+        local_items["Fuse - Main Hall"] = pool.count("Fuse - Main Hall")
 
-        if self._format_option_text(self.options.local_weapons) == 'True':
+        if self.resolved_options.local_weapons:
             for weapon_name in all_weapon_names:
-                count = len([i for i in pool if i.name == weapon_name])
+                count = pool.count(weapon_name)
 
                 if count:
                     local_items[weapon_name] = count
@@ -554,42 +575,30 @@ class ResidentEvil2Remake(World):
                 self.options.local_items.value.add(item_name)
 
         # if double weapons is on, add copies in the place of less useful items
-        if self._format_option_text(self.options.double_weapons) == 'True':
+        if self.resolved_options.double_weapons:
             for weapon_name in all_weapon_names:            
-                count = len([i for i in pool if i.name == weapon_name])
+                count = pool.count(weapon_name)
 
                 # if the weapon isn't in the pool at all, or already has a duplicate, skip it
                 if not count or count > 1:
                     continue
 
-                eligible_items = [i for i in pool if i.classification == ItemClassification.filler]
-
-                if len(eligible_items) == 0:
-                    eligible_items = [i for i in pool if i.name in ["Wooden Boards", "Blue Herb", "Gunpowder"]]
+                eligible_item = self._get_first_removable_pool_item(pool)
 
-                if len(eligible_items) == 0:
-                    eligible_items = [i for i in pool if i.name in ["Handgun Ammo"]]
-
-                if len(eligible_items) == 0: break # no more items to replace out, give up
+                if not eligible_item: break # no more items to replace out, give up
 
                 pool.append(self.create_item(weapon_name))
-                pool.remove(eligible_items[0])
+                pool.remove(eligible_item.name)
 
         # Check the item count against the location count, and remove items until they match
         extra_items = len(pool) - len(self.multiworld.get_unfilled_locations(self.player))
 
         for _ in range(extra_items):
-            eligible_items = [i for i in pool if i.classification == ItemClassification.filler]
-
-            if len(eligible_items) == 0:
-                eligible_items = [i for i in pool if i.name in ["Wooden Boards", "Blue Herb", "Gunpowder"]]
-
-            if len(eligible_items) == 0:
-                eligible_items = [i for i in pool if i.name in ["Handgun Ammo"]]
+            eligible_item = self._get_first_removable_pool_item(pool)
 
-            if len(eligible_items) == 0: break # no items to remove to match, give up
+            if not eligible_item: break # no items to remove to match, give up
 
-            pool.remove(eligible_items[0])
+            pool.remove(eligible_item.name)
 
         # if enemy kills are added to the locations, remove all Wooden Boards so that players don't prevent themselves from killing window vaulting enemies
         if self._enemy_kill_rando():
@@ -598,41 +607,62 @@ class ResidentEvil2Remake(World):
             else:
                 pool = self._replace_pool_item_with(pool, "Wooden Boards", "Gunpowder")
 
-        self.multiworld.itempool += pool
+        self.multiworld.itempool += pool.to_list()
+
+    # plando and item links are done by the time this runs, so any copies they added or placed are counted here
+    def pre_fill(self):
+        self._reject_self_locking_placements()
             
     def create_item(self, item_name: str) -> Item:
         if not item_name: return
 
-        item = self.item_name_to_item[item_name]
+        name, classification, code = self.item_name_to_prototype[item_name]
+
+        return Item(name, classification, code, player=self.player)
+
+    # creates count copies of the same item, for adding / replacing several of one item at a time
+    def create_item_copies(self, item_name: str, count: int) -> list[Item]:
+        name, classification, code = self.item_name_to_prototype[item_name]
+        player = self.player
+
+        return [Item(name, classification, code, player=player) for x in range(count)]
+
+    # keep the state's progression mask in sync with its progression items, so the rules can check the mask
+    def collect(self, state: CollectionState, item: Item) -> bool:
+        changed = super().collect(state, item)
 
-        if item.get('progression', False):
-            classification = ItemClassification.progression
-        elif item.get('type', None) not in ['Lore', 'Filler', 'Trap']:
-            classification = ItemClassification.useful
-        elif item.get('type', None) == 'Trap':
-            classification = ItemClassification.trap
-        else: # it's Lore/Filler
-            classification = ItemClassification.filler
+        if changed and item.name in self.item_name_to_bit:
+            state.re2r_progression_masks[self.player] = state.re2r_progression_masks.get(self.player, 0) | self.item_name_to_bit[item.name]
 
-        new_item = Item(item['name'], classification, item['id'], player=self.player)
-        return new_item
+        return changed
+
+    def remove(self, state: CollectionState, item: Item) -> bool:
+        changed = super().remove(state, item)
+
+        # only clear the bit once the state doesn't have any copies of the item left
+        if changed and item.name in self.item_name_to_bit and state.prog_items[self.player][item.name] < 1:
+            state.re2r_progression_masks[self.player] = state.re2r_progression_masks.get(self.player, 0) & ~self.item_name_to_bit[item.name]
+
+        return changed
 
     def get_filler_item_name(self) -> str:
         return "Wooden Boards"
 
+    @profiled('fill_slot_data')
     def fill_slot_data(self) -> Dict[str, Any]:
         slot_data = {
             "apworld_version": self.apworld_release_version,
             "character": self._get_character(),
             "scenario": self._get_scenario(),
             "difficulty": self._get_difficulty(),
+            # the client expects these as option display names, so they're still formatted from the options themselves
             "unlocked_typewriters": self._format_option_text(self.options.unlocked_typewriters).split(", "),
             "weapon_rando": self._format_option_text(self.options.cross_scenario_weapons),
             "starting_weapon": self._get_starting_weapon(),
             "all_weapons": self._get_all_weapons(),
             "ammo_pack_modifier": self._format_option_text(self.options.ammo_pack_modifier),
-            "damage_traps_can_kill": self._format_option_text(self.options.damage_traps_can_kill) == 'True',
-            "death_link": self._format_option_text(self.options.death_link) == 'Yes' # why is this yes? lol
+            "damage_traps_can_kill": self.resolved_options.damage_traps_can_kill,
+            "death_link": self.resolved_options.death_link
         }
 
         return slot_data
@@ -647,159 +677,171 @@ class ResidentEvil2Remake(World):
 
         # below are the only options that affect logic during generation
         #    comparing and only sending what's different breaks with YAML random, so always just regen with the slot data
-        regen_values['character'] = slot_data.get('character') or self._get_character()
-        regen_values['scenario'] = slot_data.get('scenario') or self._get_scenario()
-        regen_values['difficulty'] = slot_data.get('difficulty') or self._get_difficulty()
+        #    (this runs before generate_early, so the options haven't been resolved yet)
+        regen_values['character'] = slot_data.get('character') or self.options.character.current_key
+        regen_values['scenario'] = slot_data.get('scenario') or self.options.scenario.current_key
+        regen_values['difficulty'] = slot_data.get('difficulty') or self.options.difficulty.current_key
 
         return regen_values
 
     def write_spoiler_header(self, spoiler_handle: TextIO):
         spoiler_handle.write(f"RE2R_AP_World version: {self.apworld_release_version}\n")
 
+    @profiled('write_spoiler')
     def write_spoiler(self, spoiler_handle: typing.TextIO) -> None:
         # if weapons were randomized across scenarios, list what was swapped for what here (excluding upgrades, because who cares)
-        if self._format_option_text(self.options.cross_scenario_weapons) != "None":
-            starting_weapon = self.starting_weapon[self.player]
-            spoiler_handle.write(f"\n\nWeapon Swaps ({self.multiworld.player_name[self.player]}):\n")
-            spoiler_handle.write(f"\n{'(Starting Weapon)'.ljust(30, ' ')} -> {starting_weapon}")
-
-            for from_weapon, to_weapon in self.replacement_weapons[self.player].items():
-                # if the from weapon is a placeholder string of underscores, all of these were added (no "old" weapon)
-                if re.match('^[_]+$', from_weapon):
-                    from_weapon = '(Added)'
-
-                if isinstance(to_weapon, list):
-                    if not to_weapon:
-                        spoiler_handle.write(f"\n{from_weapon.ljust(30, ' ')} -> :(")
-                        continue
-
-                    spoiler_handle.write(f"\n{from_weapon.ljust(30, ' ')} -> {to_weapon[0]}")
-
-                    if len(to_weapon) > 1:
-                        for weapon in to_weapon[1:]:
-                            spoiler_handle.write(f"\n{''.ljust(30, ' ')} -> {weapon}")
-                else:
-                    spoiler_handle.write(f"\n{from_weapon.ljust(30, ' ')} -> {to_weapon}")
-            
-            spoiler_handle.write(f"\n\nAmmo Swaps ({self.multiworld.player_name[self.player]}):\n")
-
-            for from_ammo, to_ammo in self.replacement_ammo[self.player].items():
-                ammo_set = list(set(to_ammo))
-                ammo_count = len([l for _, l in self.source_locations[self.player].items() if l.get('original_item', None) == ammo_set[0]])                    
-
-                spoiler_handle.write(f"\n{from_ammo.ljust(30, ' ')} -> {ammo_set[0]} ({ammo_count})")
-
-                if len(ammo_set) > 1:
-                    for ammo in ammo_set[1:]:
-                        ammo_count = len([l for _, l in self.source_locations[self.player].items() if l.get('original_item', None) == ammo])                    
-                        spoiler_handle.write(f"\n{''.ljust(30, ' ')} -> {ammo} ({ammo_count})")
-
-            spoiler_handle.write("\n\n(Ammo totals are for the whole campaign, not per swap/category.)")
-        elif self.options.starting_weapon.current_key != "default":
-            starting_weapon = self.starting_weapon[self.player]
-            spoiler_handle.write(f"\n\nStarting Weapon ({self.multiworld.player_name[self.player]}): {starting_weapon}\n")
-
-    def _has_items(self, state: CollectionState, item_names: list) -> bool:
-        # if there are no item requirements, this location is open, they "have the items needed"
-        if len(item_names) == 0:
-            return True
-
-        # if the requirements are a single set of items, make it a list of a single set of items to support looping for multiple sets (below)
-        if len(item_names) > 0 and type(item_names[0]) is not list:
-            item_names = [item_names]
-
-        for set_of_requirements in item_names:
-            # if it requires all unique items, just do a state has all
-            if len(set(set_of_requirements)) == len(set_of_requirements):
-                if state.has_all(set_of_requirements, self.player):
-                    return True
-            # else, it requires some duplicates, so let's group them up and do some has w/ counts
-            else:
-                item_counts = {
-                    item_name: len([i for i in set_of_requirements if i == item_name]) for item_name in set_of_requirements # e.g., { Spare Key: 2 }
-                }
-                missing_an_item = False
+        if self.resolved_options.cross_scenario_weapons != "none":
+            weapon_spoiler = WeaponSpoiler.from_replacements(
+                self.multiworld.player_name[self.player],
+                self.starting_weapon,
+                self.replacement_weapons,
+                self.replacement_ammo,
+                self.location_item_counts
+            )
+        elif self.resolved_options.starting_weapon != "default":
+            weapon_spoiler = WeaponSpoiler(self.multiworld.player_name[self.player], self.starting_weapon)
+        else:
+            return
 
-                for item_name, count in item_counts.items():
-                    if not state.has(item_name, self.player, count):
-                        missing_an_item = True
+        spoiler_handle.write(weapon_spoiler.format())
 
-                if missing_an_item:
-                    continue # didn't meet these requirements, so skip to the next set, if any
-                
-                # if we made it here, state has all the items and the quantities needed, return True
-                return True
+    def write_spoiler_end(self, spoiler_handle: typing.TextIO) -> None:
+        # write_spoiler is done by now, so this is the full profile
+        if profiling_enabled:
+            profiler = get_profiler(self)
+            profiler.write_report(spoiler_handle, self.multiworld.player_name[self.player])
+            profiler.write_json()
+
+        # the spoiler is the last thing that reads this player's state
+        self.release_player_state()
+
+    # drops this player's source locations, weapon randomizer results, etc., which are only needed up to the slot data and spoiler.
+    #    this is called at the end of the spoiler, and hosts that keep the multiworld around without writing a spoiler can call it themselves
+    def release_player_state(self):
+        self.source_locations = None
+        self.location_item_counts = None
+        self.starting_weapon = None
+        self.replacement_weapons = None
+        self.replacement_ammo = None
+        self.profiler = None
 
-        # if we made it here, state didn't have enough to return True, so return False
-        return False
+    def generate_output(self, output_directory: str) -> None:
+        # the profile is written here too, in case there's no spoiler log
+        if profiling_enabled:
+            profiler = get_profiler(self)
+            profiler.output_file = os.path.join(output_directory, f"{self.multiworld.get_out_file_name_base(self.player)}_RE2R_profile.json")
+            profiler.write_json()
+
+    # how many of the player's locations have each item, after weapon randomization
+    def _count_location_items(self) -> dict:
+        item_counts = {}
+
+        for location in self.source_locations.values():
+            item_name = location.get('original_item')
+
+            if item_name is not None:
+                item_counts[item_name] = item_counts.get(item_name, 0) + 1
+
+        return item_counts
+
+    def _count_rule_calls(self, counter_name: str, rule: typing.Callable) -> typing.Callable:
+        if not profiling_enabled:
+            return rule
+
+        return get_profiler(self).counted(counter_name, rule)
 
     def _format_option_text(self, option) -> str:
         return re.sub(r'\w+\(', '', str(option)).rstrip(')')
     
+    # shared by every player on this scenario, so don't modify it (see LocationOverlay.py)
     def _get_locations_for_scenario(self, character, scenario) -> dict:
-        locations_pool = {
-            loc['id']: loc for loc in Data.location_table
-                if loc['character'] == character and loc['scenario'] == scenario
-        }
+        hardcore = self._get_difficulty() == 'hardcore'
+
+        return Data.location_pools[(character, scenario, hardcore, self._enemy_kill_rando())]
+
+    # the regions / connections / location slots for this player's scenario, shared with every other player on it (see ScenarioGraph.py)
+    def _get_scenario_graph(self) -> ScenarioGraph:
+        character, scenario = self._get_character(), self._get_scenario()
+        key = (character, scenario, self._get_difficulty() == 'hardcore', self._enemy_kill_rando())
+
+        return get_scenario_graph(
+            key, 
+            self._get_locations_for_scenario(character, scenario), 
+            self._get_region_table_for_scenario(character, scenario), 
+            self._get_region_connection_table_for_scenario(character, scenario), 
+            RE2RLocation.stack_names_not_victory
+        )
+
+    # the items needed on every path to each location of this player's scenario, and more (see Reachability.py)
+    def _get_reachability(self) -> dict:
+        return Data.reachability[(self._get_character(), self._get_scenario())]
+
+    # an item can't go somewhere that needs every copy of that item to be reached, so turn those placements away in the location's
+    #    item rule. this does change where items can go: with full accessibility the fill would usually back out of those placements
+    #    after its reachability checks, but a location that's only reached through an item placed later (plando, etc.) isn't caught there.
+    #    with minimal accessibility, locations are allowed to end up unreachable, so there's no rule at all
+    def _reject_self_locking_placements(self):
+        if self.options.accessibility.value == self.options.accessibility.option_minimal:
+            return
 
-        if self._enemy_kill_rando():
-            locations_pool.update({
-                enemy['id']: enemy for enemy in Data.enemy_table
-                    if enemy['character'] == character and enemy['scenario'] == scenario
-            })
+        location_requirements = self._get_reachability()['locations']
+        pool_counts = {} # item name: copies of this player's item in the pool
+        item_copies = {} # item name: copies that aren't in the pool, from starting inventory or already placed
 
-        # if the player chose hardcore, take out any matching standard difficulty locations
-        if self._format_option_text(self.options.difficulty) == 'Hardcore':
-            for hardcore_loc in [loc for loc in locations_pool.values() if loc['difficulty'] == 'hardcore']:
-                check_loc_region = re.sub(r'H\)$', ')', hardcore_loc['region']) # take the Hardcore off the region name
-                check_loc_name = hardcore_loc['name']
+        for item in self.multiworld.itempool:
+            if item.player == self.player:
+                pool_counts[item.name] = pool_counts.get(item.name, 0) + 1
 
-                # if there's a standard location with matching name and region, it's obsoleted in hardcore, remove it
-                standard_locs = [id for id, loc in locations_pool.items() if loc['region'] == check_loc_region and loc['name'] == check_loc_name and loc['difficulty'] != 'hardcore']
+        for item in self.multiworld.precollected_items[self.player] + [location.item for location in self.multiworld.get_filled_locations()]:
+            if item.player == self.player:
+                item_copies[item.name] = item_copies.get(item.name, 0) + 1
 
-                if len(standard_locs) > 0:
-                    del locations_pool[standard_locs[0]]
+        # most locations in the same area have the same requirements, so share the locking items and rules between them
+        locking_items_by_requirements = {}
+        rules = {} # locking items: item rule
 
-        # else, the player is still playing standard, take out all of the matching hardcore difficulty locations
-        else:
-            locations_pool = {
-                id: loc for id, loc in locations_pool.items() if loc['difficulty'] != 'hardcore'
-            }
+        for location in self.multiworld.get_unfilled_locations(self.player):
+            requirements = location_requirements.get(location.address, ())
 
-        # now that we've factored in hardcore swaps, remove any hardcore locations that were just there for removing unused standard ones
-        locations_pool = { id: loc for id, loc in locations_pool.items() if 'remove' not in loc }
-        
-        return locations_pool
+            if requirements not in locking_items_by_requirements:
+                locking_items_by_requirements[requirements] = frozenset(
+                    item_name for item_name, count in requirements 
+                        if pool_counts.get(item_name, 0) > 0 and pool_counts[item_name] + item_copies.get(item_name, 0) <= count
+                )
+
+            locking_items = locking_items_by_requirements[requirements]
+
+            if len(locking_items) == 0:
+                continue
+
+            if locking_items not in rules:
+                rules[locking_items] = lambda item, locking_items=locking_items: not (item.player == self.player and item.name in locking_items)
+
+            add_item_rule(location, rules[locking_items])
 
     def _get_region_table_for_scenario(self, character, scenario) -> list:
-        return [
-            region for region in Data.region_table 
-                if region['character'] == character and region['scenario'] == scenario
-        ]
+        return list(Data.region_index[(character, scenario)].values())
     
     def _get_region_connection_table_for_scenario(self, character, scenario) -> list:
-        return [
-            conn for conn in Data.region_connections_table
-                if conn['character'] == character and conn['scenario'] == scenario
-        ]
+        return list(Data.region_connection_index[(character, scenario)])
     
     def _get_character(self) -> str:
-        return self._format_option_text(self.options.character).lower()
+        return self.resolved_options.character
     
     def _get_scenario(self) -> str:
-        return self._format_option_text(self.options.scenario).lower()
+        return self.resolved_options.scenario
     
     def _get_difficulty(self) -> str:
-        return self._format_option_text(self.options.difficulty).lower()
+        return self.resolved_options.difficulty
     
     def _get_starting_weapon(self) -> str:
-        return self.starting_weapon[self.player] if self.player in self.starting_weapon else None
+        return self.starting_weapon
 
     def _get_all_weapons(self) -> list[str] | None:
-        if self.player not in self.replacement_weapons:
+        if self.replacement_weapons is None:
             return None
 
-        weapons_list = list(self.replacement_weapons[self.player].values())
+        weapons_list = list(self.replacement_weapons.values())
 
         if weapons_list and isinstance(weapons_list[0], list):
             weapons_list = weapons_list[0]
@@ -822,34 +864,34 @@ class ResidentEvil2Remake(World):
             "submachinegun_mq11": "MQ 11"
         }
 
-        return lookups[self.options.starting_weapon.current_key]
+        return lookups[self.resolved_options.starting_weapon]
     
-    def _replace_pool_item_with(self, pool, from_item_name, to_item_name) -> list:
-        items_to_remove = [item for item in pool if item.name == from_item_name]
-        count_of_new_items = len(items_to_remove)
-
-        for item in items_to_remove:
-            pool.remove(item)
-
-        for x in range(count_of_new_items):
-            pool.append(self.create_item(to_item_name))
+    def _replace_pool_item_with(self, pool, from_item_name, to_item_name) -> ItemPool:
+        count_of_new_items = pool.remove_all(from_item_name)
+        pool.extend(self.create_item_copies(to_item_name, count_of_new_items))
 
         return pool
 
+    # the item to take out of the pool when making room: filler first, then the less useful non-filler, then handgun ammo as a last resort
+    def _get_first_removable_pool_item(self, pool) -> Item | None:
+        return pool.first(classification=ItemClassification.filler) or \
+            pool.first(["Wooden Boards", "Blue Herb", "Gunpowder"]) or \
+            pool.first(["Handgun Ammo"])
+
     def _get_oops_all_options_flag(self) -> int:
         flag = 0
-        if self._format_option_text(self.options.oops_all_rockets) == 'True':
+        if self.resolved_options.oops_all_rockets:
             flag |= 0x01
-        if self._format_option_text(self.options.oops_all_miniguns) == 'True':
+        if self.resolved_options.oops_all_miniguns:
             flag |= 0x02
-        if self._format_option_text(self.options.oops_all_grenades) == 'True':
+        if self.resolved_options.oops_all_grenades:
             flag |= 0x04
-        if self._format_option_text(self.options.oops_all_knives) == 'True':
+        if self.resolved_options.oops_all_knives:
             flag |= 0x08
         return flag
        
     def _enemy_kill_rando(self) -> bool:
-        return self._format_option_text(self.options.add_enemy_kills_as_locations) != "None"
+        return self.resolved_options.add_enemy_kills_as_locations != "none"
 
     def _can_enemy_kill_rando(self) -> bool:
         return True # should be supported for all scenarios now thanks to contributions
@@ -0,0 +1,112 @@
+"""
+A long-running generator for running lots of small generations back to back. Archipelago and its worlds are imported once,
+and the RE2R scenario data (compiled tables, location pools, reachability, etc.) is loaded up front and kept in memory,
+so each generation after that only costs the generation itself instead of the imports and data loading too.
+
+Jobs are JSON objects, one per line, with the command line arguments to pass to Archipelago's Generate.py:
+
+    {"args": ["--player_files_path", "/path/to/yamls", "--outputpath", "/path/to/output"]}
+
+Each job gets one JSON line back, either {"ok": true, "seed": ..., "seconds": ...} or {"ok": false, "error": "..."}.
+Jobs run one at a time, in the order they come in. Anything generation prints goes to stderr, so stdout only has the replies.
+
+Needs an Archipelago checkout with this apworld in worlds/residentevil2remake. Run from the repo root:
+
+    python tools/warm_generator.py --archipelago /path/to/Archipelago                # jobs on stdin, replies on stdout
+    python tools/warm_generator.py --archipelago /path/to/Archipelago --port 38281   # jobs / replies over a localhost socket
+"""
+import argparse
+import contextlib
+import gc
+import json
+import os
+import socketserver
+import sys
+import time
+
+
+def import_archipelago(archipelago: str):
+    archipelago = os.path.abspath(archipelago)
+    sys.path.insert(0, archipelago)
+    os.chdir(archipelago) # Archipelago finds its data / host.yaml relative to its own folder
+
+    # importing worlds loads every world (including RE2R and its item / location tables) once, for every job after this
+    import worlds
+    from worlds.residentevil2remake import ResidentEvil2Remake
+    from worlds.residentevil2remake.Data import Data
+
+    # load every scenario up front, instead of on the first job that has a player on it
+    for character, scenario in Data.scenarios:
+        Data.load_data(character, scenario)
+
+    return ResidentEvil2Remake
+
+def run_job(job: dict, world_type) -> dict:
+    import Generate
+    import Main
+
+    start = time.perf_counter()
+    argv = sys.argv
+
+    try:
+        # keep generation's own output out of the replies
+        with contextlib.redirect_stdout(sys.stderr):
+            sys.argv = ['Generate.py', *job.get('args', [])]
+            generate_args, seed = Generate.main(Generate.mystery_argparse())
+            multiworld = Main.main(generate_args, seed)
+
+        # the RE2R worlds release their own state at the end of the spoiler, but not if there wasn't one
+        for world in multiworld.get_game_worlds(world_type.game):
+            world.release_player_state()
+
+        return { 'ok': True, 'seed': seed, 'seconds': round(time.perf_counter() - start, 3) }
+    except (Exception, SystemExit) as e: # Generate.py calls sys.exit for bad yamls, which shouldn't stop the worker
+        return { 'ok': False, 'error': "{}: {}".format(type(e).__name__, e) }
+    finally:
+        sys.argv = argv
+        multiworld = None
+        gc.collect() # the multiworld has lots of cycles (worlds <-> multiworld, regions <-> locations), so free it before the next job
+
+def handle_line(line: str, world_type) -> str:
+    try:
+        job = json.loads(line)
+    except ValueError as e:
+        return json.dumps({ 'ok': False, 'error': "Invalid job: {}".format(e) })
+
+    return json.dumps(run_job(job, world_type))
+
+
+def serve_stdin(world_type):
+    for line in sys.stdin:
+        if line.strip():
+            print(handle_line(line, world_type), flush=True)
+
+def serve_socket(world_type, port: int):
+    class JobHandler(socketserver.StreamRequestHandler):
+        def handle(self):
+            for line in self.rfile:
+                if line.strip():
+                    self.wfile.write((handle_line(line.decode(), world_type) + '\n').encode())
+
+    # not threaded, so jobs from every connection still run one at a time
+    with socketserver.TCPServer(('127.0.0.1', port), JobHandler) as server:
+        print("Waiting for jobs on 127.0.0.1:{}".format(port), file=sys.stderr)
+        server.serve_forever()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--archipelago', required=True, help="path to an Archipelago checkout with this apworld in worlds/residentevil2remake")
+    parser.add_argument('--port', type=int, default=None, help="take jobs on this localhost port instead of stdin")
+    args = parser.parse_args()
+
+    world_type = import_archipelago(args.archipelago)
+
+    if args.port:
+        serve_socket(world_type, args.port)
+    else:
+        serve_stdin(world_type)
+
+
+if __name__ == '__main__':
+    main()